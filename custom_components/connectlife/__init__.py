@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from copy import deepcopy
+from functools import partial
 
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.config_entries import ConfigEntry
@@ -12,9 +14,9 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 from connectlife.api import LifeConnectAuthError, LifeConnectError
 
-from .client import create_api
 from .const import (
     CONF_DEVELOPMENT_MODE,
+    CONF_POLL_BUDGET,
     CONF_TEST_SERVER_URL,
     CONF_TRIR,
     DATA_STATE_CLASS_MIGRATION_DONE,
@@ -22,8 +24,12 @@ from .const import (
 )
 from .coordinator import ConnectLifeCoordinator, ConnectLifeStatisticsCoordinator
 from .dictionaries import Dictionaries
+from .scheduler import DEFAULT_POLL_BUDGET
 from .services import async_setup_services
-from .statistics_sources import enabled_sensors
+from .session import AccountSession, async_acquire_session, async_release_session
+from .snapshot import ApplianceSnapshot
+from .token_cache import TokenCache
+from .utils import changed_device_options
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -55,53 +61,129 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Setting up ConnectLife")
     _LOGGER.debug("Options: %s", entry.options)
     hass.data.setdefault(DOMAIN, {})
+    await hass.async_add_executor_job(Dictionaries.load_bundle)
     test_server_url = (
         entry.options.get(CONF_TEST_SERVER_URL)
        if entry.options.get(CONF_DEVELOPMENT_MODE)
         else None
     )
-    api = create_api(
+    # Entries of the same account share the client, its login and polls.
+    session = async_acquire_session(
+        hass,
+        entry.entry_id,
         entry.data[CONF_USERNAME],
         entry.data[CONF_PASSWORD],
         trir=entry.data.get(CONF_TRIR, False),
         test_server_url=test_server_url,
     )
-    try:
-        await api.login()
-    except LifeConnectAuthError as ex:
-        raise ConfigEntryAuthFailed from ex
-    except LifeConnectError as ex:
-        raise ConfigEntryNotReady from ex
-    coordinator = ConnectLifeCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(partial(async_release_session, hass, entry.entry_id))
+    api = session.api
+    snapshot = ApplianceSnapshot(hass, entry.entry_id)
+    token_cache = TokenCache(hass, entry.entry_id, entry.data[CONF_USERNAME])
+    coordinator = ConnectLifeCoordinator(
+        hass,
+        api,
+        entry.options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
+        snapshot,
+        session.guard,
+        token_cache,
+        session,
+    )
+    # With a snapshot of the last known appliances, entities are created right
+    # away and the cloud is contacted in the background; otherwise setup has to
+    # wait for the first poll to know which entities to create.
+    warm_start = (appliances := await snapshot.async_load(api)) is not None
+    if warm_start:
+        _LOGGER.debug("Starting from snapshot of %d appliances", len(appliances))
+        coordinator.async_restore(appliances)
+    else:
+        try:
+            # Tokens from the previous setup skip the login.
+            await session.async_login(token_cache)
+        except LifeConnectAuthError as ex:
+            raise ConfigEntryAuthFailed from ex
+        except LifeConnectError as ex:
+            raise ConfigEntryNotReady from ex
+        await coordinator.async_config_entry_first_refresh()
+    coordinator.applied_options = deepcopy(dict(entry.options))
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Only create the statistics coordinator if some device opts into a statistics
     # endpoint with at least one sensor enabled (otherwise it would poll nothing).
     has_statistics = any(
-        enabled_sensors(d.statistics_source, d.statistics_sensors)
+        coordinator.entity_plan(appliance).statistics_sensors
         for appliance in coordinator.data.values()
-        if (d := Dictionaries.get_dictionary(appliance))
     )
+    statistics_coordinator = None
     if has_statistics:
-        statistics_coordinator = ConnectLifeStatisticsCoordinator(hass, api, coordinator)
-        await statistics_coordinator.async_config_entry_first_refresh()
+        statistics_coordinator = ConnectLifeStatisticsCoordinator(
+            hass, api, coordinator, guard=session.guard
+        )
+        if not warm_start:
+            await statistics_coordinator.async_config_entry_first_refresh()
         hass.data[DOMAIN][f"{entry.entry_id}_statistics"] = statistics_coordinator
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if warm_start:
+        entry.async_create_background_task(
+            hass,
+            _async_connect(hass, entry, session, token_cache, coordinator, statistics_coordinator),
+            f"{DOMAIN} connect",
+        )
+
     await coordinator.cleanup_removed_entities()
     if not entry.data.get(DATA_STATE_CLASS_MIGRATION_DONE):
         await coordinator.update_orphaned_statistics_issue()
 
     return True
 
+
+async def _async_connect(
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        session: AccountSession,
+        token_cache: TokenCache,
+        coordinator: ConnectLifeCoordinator,
+        statistics_coordinator: ConnectLifeStatisticsCoordinator | None,
+) -> None:
+    """Log in (unless stored tokens can be used) and replace the snapshot with live data."""
+    try:
+        await session.async_login(token_cache)
+    except LifeConnectAuthError:
+        entry.async_start_reauth(hass)
+        return
+    except LifeConnectError as ex:
+        # The coordinator logs in again on its next poll.
+        _LOGGER.debug("ConnectLife login failed, polling will retry: %s", ex)
+    await coordinator.async_refresh()
+    if statistics_coordinator is not None and coordinator.last_update_success:
+        await statistics_coordinator.async_refresh()
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    _LOGGER.debug(f"Reloading ConnectLife")
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options update.
+
+    When only per-device options changed, just the entities of those devices
+    are recreated; any other change reloads the entry.
+    """
+    coordinator: ConnectLifeCoordinator | None = hass.data[DOMAIN].get(entry.entry_id)
+    changed = (
+        changed_device_options(coordinator.applied_options, entry.options)
+        if coordinator is not None and coordinator.applied_options is not None
+        else None
+    )
+    if changed is None:
+        _LOGGER.debug(f"Reloading ConnectLife")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    assert coordinator is not None
+    coordinator.applied_options = deepcopy(dict(entry.options))
+    for device_id in changed:
+        _LOGGER.debug("Options of %s changed, recreating its entities", device_id)
+        await coordinator.async_rebuild_device(device_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -113,3 +195,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(f"{entry.entry_id}_statistics", None)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the appliance snapshot and stored tokens of a deleted config entry."""
+    await ApplianceSnapshot(hass, entry.entry_id).async_remove()
+    await TokenCache(hass, entry.entry_id, entry.data[CONF_USERNAME]).async_remove()
+
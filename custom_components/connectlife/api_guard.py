@@ -0,0 +1,256 @@
+"""Rate limiting and circuit breaking for the ConnectLife gateway.
+
+Every gateway request of an account (appliance polls, statistics fetches and
+commands from entities and services) goes through one ``ApiGuard``:
+
+* a token bucket caps the request rate; when requests have to wait, user
+  commands are served before background polls, and
+* a circuit breaker stops calling the gateway after repeated gateway errors,
+  lets a single probe through once ``reset_timeout`` has passed, and closes
+  again when the probe succeeds.
+
+The guard also records the latency and failures of the calls (see ``api_stats``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from connectlife.api import LifeConnectAuthError, LifeConnectError
+
+from .api_stats import ApiStats
+from .messages import GATEWAY_ERROR_PREFIX
+
+# Sustained gateway requests per second, and how many may be sent back to back.
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 10
+# Consecutive gateway errors that open the circuit, and seconds before probing.
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60.0
+
+PRIORITY_COMMAND = 0
+PRIORITY_BACKGROUND = 1
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_T = TypeVar("_T")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(LifeConnectError):
+    """The gateway is not called while the circuit is open."""
+
+
+def is_gateway_error(err: BaseException) -> bool:
+    """Whether ``err`` means the gateway is failing (as opposed to a rejected token)."""
+    if not isinstance(err, LifeConnectError) or isinstance(err, (LifeConnectAuthError, CircuitOpenError)):
+        return False
+    return str(err).startswith(GATEWAY_ERROR_PREFIX) or (
+        err.status is not None and (err.status == 429 or err.status >= 500)
+    )
+
+
+class TokenBucket:
+    """Token bucket handing out tokens to waiters in priority order."""
+
+    def __init__(
+            self,
+            rate: float = DEFAULT_RATE,
+            burst: int = DEFAULT_BURST,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        # Requests that had to wait for a token.
+        self.throttled = 0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> None:
+        """Wait for a token; lower ``priority`` values are served first."""
+        if self.rate <= 0:
+            return
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+        self.throttled += 1
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._order), waiter)
+        heapq.heappush(self._waiters, entry)
+        self._schedule()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after being handed a token: pass it on.
+                self._tokens = min(self.burst, self._tokens + 1)
+                self._release()
+                raise
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            if not self._waiters and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            raise
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _schedule(self) -> None:
+        if self._timer is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self._tokens -= 1
+            waiter.set_result(None)
+        self._schedule()
+
+
+class CircuitBreaker:
+    """Open after ``failure_threshold`` consecutive gateway errors."""
+
+    def __init__(
+            self,
+            failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+            reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        # Times the circuit opened.
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if self._probing or self._clock() - self._opened_at >= self.reset_timeout:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may be made now."""
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return
+        if state == CIRCUIT_HALF_OPEN and not self._probing:
+            # This call is the probe; others keep failing fast until it is done.
+            self._probing = True
+            return
+        assert self._opened_at is not None
+        retry_in = max(0, self.reset_timeout - (self._clock() - self._opened_at))
+        raise CircuitOpenError(
+            f"ConnectLife gateway paused after {self.failures} consecutive errors, "
+            f"retrying in {retry_in:.0f} seconds"
+        )
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            _LOGGER.info("ConnectLife gateway recovered, resuming requests")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or (self._opened_at is None and self.failures >= self.failure_threshold):
+            if self._opened_at is None:
+                self.trips += 1
+                _LOGGER.warning(
+                    "ConnectLife gateway failed %d times in a row, pausing requests for %d seconds",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def record_other(self) -> None:
+        """A call that neither proves nor disproves gateway health ended."""
+        self._probing = False
+
+
+class ApiGuard:
+    """Rate limiter and circuit breaker shared by all gateway calls of an account."""
+
+    def __init__(
+            self,
+            limiter: TokenBucket | None = None,
+            breaker: CircuitBreaker | None = None,
+            stats: ApiStats | None = None,
+    ):
+        self.limiter = limiter or TokenBucket()
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = stats or ApiStats()
+
+    async def call(
+            self,
+            priority: int,
+            func: Callable[..., Awaitable[_T]],
+            *args: Any,
+            name: str | None = None,
+    ) -> _T:
+        """Await ``func(*args)`` once the breaker and the rate limit allow it.
+
+        The call is recorded in ``stats`` as ``name``, by default the name of ``func``.
+        """
+        self.breaker.before_call()
+        start: float | None = None
+        try:
+            await self.limiter.acquire(priority)
+            start = time.monotonic()
+            result = await func(*args)
+        except BaseException as err:
+            if is_gateway_error(err):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_other()
+            if start is not None and isinstance(err, Exception):
+                self.stats.record(name or func.__name__, time.monotonic() - start, err)
+            raise
+        self.breaker.record_success()
+        self.stats.record(name or func.__name__, time.monotonic() - start)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Guard state for diagnostics."""
+        return {
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "trips": self.breaker.trips,
+            "throttled": self.limiter.throttled,
+            "waiting": self.limiter.waiting,
+            **self.stats.as_dict(),
+        }
@@ -0,0 +1,101 @@
+"""Latency and error statistics of the ConnectLife API calls, for diagnostics.
+
+``ApiGuard`` records every gateway call it makes: the latency per API method,
+over a rolling window of recent calls, and failures counted by the category
+users see in retry messages (see ``messages.error_category``).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import Any
+
+from .messages import error_category
+
+# Upper bounds (seconds) of the latency histogram buckets; slower calls fall in
+# a final open-ended bucket.
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Calls per API method the histogram covers.
+LATENCY_WINDOW = 200
+
+
+class LatencyHistogram:
+    """Latencies of the last ``window`` calls of one API method."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        # Calls since setup, including those no longer in the window.
+        self.calls = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.calls += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        samples = sorted(self._samples)
+        buckets = dict.fromkeys([f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"], 0)
+        for sample in samples:
+            bucket = next(
+                (f"<={bound}s" for bound in LATENCY_BUCKETS if sample <= bound),
+                f">{LATENCY_BUCKETS[-1]}s",
+            )
+            buckets[bucket] += 1
+        return {
+            "calls": self.calls,
+            "window": len(samples),
+            "p50": _percentile(samples, 0.5),
+            "p95": _percentile(samples, 0.95),
+            "max": round(samples[-1], 3) if samples else None,
+            "buckets": buckets,
+        }
+
+
+def _percentile(samples: list[float], fraction: float) -> float | None:
+    if not samples:
+        return None
+    return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 3)
+
+
+class ApiStats:
+    """Latency histograms per API method, error counts per category and call rate."""
+
+    def __init__(
+            self,
+            window: int = LATENCY_WINDOW,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._window = window
+        self._clock = clock
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.errors: Counter[str] = Counter()
+        # When the calls of the last minute ended.
+        self._recent: deque[float] = deque()
+
+    def record(self, method: str, seconds: float, error: Exception | None = None) -> None:
+        histogram = self.latency.get(method)
+        if histogram is None:
+            histogram = self.latency[method] = LatencyHistogram(self._window)
+        histogram.record(seconds)
+        if error is not None:
+            self.errors[error_category(error)] += 1
+        self._recent.append(self._clock())
+        self._trim()
+
+    def calls_per_minute(self) -> int:
+        """Calls that ended in the last 60 seconds."""
+        self._trim()
+        return len(self._recent)
+
+    def _trim(self) -> None:
+        cutoff = self._clock() - 60
+        while self._recent and self._recent[0] <= cutoff:
+            self._recent.popleft()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls_per_minute": self.calls_per_minute(),
+            "latency": {method: histogram.as_dict() for method, histogram in sorted(self.latency.items())},
+            "errors": dict(self.errors),
+        }
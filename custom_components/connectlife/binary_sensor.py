@@ -19,10 +19,10 @@ from .const import (
     OFFLINE_STATE,
 )
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Property
+from .decoders import MISSING, mapped_decoder
+from .dictionaries import Property
 from .entity import ConnectLifeEntity
 from connectlife.appliance import ConnectLifeAppliance
-from .utils import climate_bound_properties, device_target_overrides, has_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,23 +34,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    devices = config_entry.options.get(CONF_DEVICES, {})
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        overrides = device_target_overrides(config_entry, appliance.device_id)
-        climate_bound = climate_bound_properties(appliance, dictionary, overrides)
-        async_add_entities(
-            ConnectLifeBinaryStatusSensor(
-                coordinator, appliance, s, dictionary.properties[s]
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        for s in plan.properties_for(Platform.BINARY_SENSOR):
+            yield ConnectLifeBinaryStatusSensor(
+                coordinator, appliance, s, plan.dictionary.properties[s]
             )
-            for s in appliance.status_list
-            if has_platform(Platform.BINARY_SENSOR, dictionary.properties[s])
-            and s not in climate_bound
-        )
+        devices = config_entry.options.get(CONF_DEVICES, {})
         if devices.get(appliance.device_id, {}).get(CONF_EXPOSE_OFFLINE_STATE, False):
-            async_add_entities(
-                [ConnectLifeOfflineStateBinarySensor(coordinator, appliance)]
-            )
+            yield ConnectLifeOfflineStateBinarySensor(coordinator, appliance)
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 class ConnectLifeBinaryStatusSensor(ConnectLifeEntity, BinarySensorEntity):
@@ -68,6 +63,7 @@ class ConnectLifeBinaryStatusSensor(ConnectLifeEntity, BinarySensorEntity):
         self.status = status
         self._unavailable_status = status
         self._unavailable_value = dd_entry.unavailable
+        self.watch(status)
         self.options = dd_entry.binary_sensor.options
         self.entity_description = BinarySensorEntityDescription(
             key=self._attr_unique_id,
@@ -79,17 +75,17 @@ class ConnectLifeBinaryStatusSensor(ConnectLifeEntity, BinarySensorEntity):
             device_class=dd_entry.binary_sensor.device_class,
             entity_category=dd_entry.entity_category,
         )
+        self._decode = mapped_decoder(status, self.options, self._unknown_value)
         self._refresh_state()
 
     @callback
     def update_state(self):
-        if self.status in self.coordinator.data[self.device_id].status_list:
-            value = self.coordinator.data[self.device_id].status_list[self.status]
-            if value in self.options:
-                self._attr_is_on = self.options[value]
-            else:
-                self._attr_is_on = None
-                _LOGGER.warning("Unknown value %d for %s", value, self.status)
+        value = self._decode(self.coordinator.data[self.device_id].status_list)
+        if value is not MISSING:
+            self._attr_is_on = value
+
+    def _unknown_value(self, value) -> None:
+        _LOGGER.warning("Unknown value %d for %s", value, self.status)
 
 
 class ConnectLifeOfflineStateBinarySensor(ConnectLifeEntity, BinarySensorEntity):
@@ -107,6 +103,8 @@ class ConnectLifeOfflineStateBinarySensor(ConnectLifeEntity, BinarySensorEntity)
         super().__init__(
             coordinator, appliance, OFFLINE_STATE, Platform.BINARY_SENSOR
         )
+        # offline_state is a device-level field, not a status property.
+        self.watch()
         self.entity_description = BinarySensorEntityDescription(
             key=self._attr_unique_id,
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -10,7 +10,7 @@ from connectlife.appliance import ConnectLifeAppliance
 
 from .const import DOMAIN
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Button, Dictionaries
+from .dictionaries import Button
 from .entity import ConnectLifeEntity
 
 
@@ -21,12 +21,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife buttons."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        async_add_entities(
+    coordinator.async_add_entity_factory(
+        lambda appliance: (
             ConnectLifeButton(coordinator, appliance, button)
-            for button in dictionary.buttons
-        )
+            for button in coordinator.entity_plan(appliance).dictionary.buttons
+        ),
+        async_add_entities,
+    )
 
 
 class ConnectLifeButton(ConnectLifeEntity, ButtonEntity):
@@ -43,6 +44,7 @@ class ConnectLifeButton(ConnectLifeEntity, ButtonEntity):
             coordinator, appliance, f"button-{button.key}", Platform.BUTTON
         )
         self.button = button
+        self.watch(*button.available_when)
         self.entity_description = ButtonEntityDescription(
             key=self._attr_unique_id,
             icon=button.icon,
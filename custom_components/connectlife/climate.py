@@ -1,5 +1,9 @@
 """Provides climate entities for ConnectLife."""
 import logging
+from collections.abc import Mapping
+from functools import reduce
+from operator import or_
+from typing import Any
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -27,7 +31,7 @@ from .const import (
     TEMPERATURE_UNIT,
 )
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Dictionary
+from .dictionaries import Dictionary
 from .entity import ConnectLifeEntity
 from .utils import (
     climate_target_bindings,
@@ -46,6 +50,53 @@ HVAC_MODE_ALIASES = {
 HVAC_MODE_VALUES = {mode.value for mode in HVACMode}
 
 
+class PresetIndex:
+    """Presets compiled for matching against a status list.
+
+    For every property a preset depends on, each value maps to the presets that
+    require it, as a bit mask in preset order. The presets matching a status
+    list then take one lookup per property instead of a subset test of every
+    preset against the whole status list, and the result is kept until one of
+    those properties changes.
+    """
+
+    def __init__(self, presets: Mapping[str, Mapping[str, Any]]):
+        self.names = list(presets)
+        self._bits = {name: 1 << i for i, name in enumerate(self.names)}
+        requiring: dict[str, dict[Any, int]] = {}
+        for name, values in presets.items():
+            for prop, value in values.items():
+                by_value = requiring.setdefault(prop, {})
+                by_value[value] = by_value.get(value, 0) | self._bits[name]
+        self._all = (1 << len(self.names)) - 1
+        self.properties = tuple(requiring)
+        # Per property: presets by required value, and presets that match any value.
+        self._tables = tuple(
+            (by_value, self._all & ~reduce(or_, by_value.values(), 0))
+            for by_value in requiring.values()
+        )
+        self._values: tuple | None = None
+        self._matching = 0
+
+    def _matches(self, status_list: Mapping[str, Any]) -> int:
+        values = tuple(map(status_list.get, self.properties))
+        if values != self._values:
+            matching = self._all
+            for value, (by_value, independent) in zip(values, self._tables):
+                matching &= independent | by_value.get(value, 0)
+            self._values, self._matching = values, matching
+        return self._matching
+
+    def match(self, status_list: Mapping[str, Any], current: str | None = None) -> str | None:
+        """``current`` if it still matches, else the first matching preset, or ``None``."""
+        matching = self._matches(status_list)
+        if current in self._bits and matching & self._bits[current]:
+            return current
+        if not matching:
+            return None
+        return self.names[(matching & -matching).bit_length() - 1]
+
+
 def _add_hvac_mode_mapping(
         raw_mode: int,
         mode_value: str,
@@ -78,16 +129,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    entities = []
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        if is_climate(dictionary):
-            entities.append(ConnectLifeClimate(
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        if Platform.CLIMATE in plan.device_platforms:
+            yield ConnectLifeClimate(
                 coordinator,
                 appliance,
-                dictionary
-            ))
-    async_add_entities(entities)
+                plan.dictionary,
+                plan.climate_bindings,
+            )
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 def is_climate(dictionary: Dictionary):
@@ -113,6 +166,7 @@ class ConnectLifeClimate(ConnectLifeEntity, ClimateEntity):
     hvac_mode_map: dict[int, HVACMode]
     hvac_mode_reverse_map: dict[HVACMode, int]
     preset_map: dict[str, dict[str, int]]
+    preset_index: PresetIndex
     swing_mode_map: dict[int, str]
     swing_mode_reverse_map: dict[str, int]
     temperature_unit_map: dict[int, UnitOfTemperature]
@@ -123,7 +177,8 @@ class ConnectLifeClimate(ConnectLifeEntity, ClimateEntity):
             self,
             coordinator: ConnectLifeCoordinator,
             appliance: ConnectLifeAppliance,
-            data_dictionary: Dictionary
+            data_dictionary: Dictionary,
+            target_map: dict[str, str] | None = None,
     ):
         """Initialize the entity."""
         super().__init__(coordinator, appliance, "climate", Platform.CLIMATE)
@@ -151,9 +206,12 @@ class ConnectLifeClimate(ConnectLifeEntity, ClimateEntity):
 
         # When several properties claim the same climate target, the lowest-
         # priority candidate the device exposes wins (see climate_target_bindings),
-        # unless the user pinned a specific property via the options flow.
-        overrides = device_target_overrides(coordinator.config_entry, appliance.device_id)
-        self.target_map = climate_target_bindings(appliance, data_dictionary, overrides)
+        # unless the user pinned a specific property via the options flow. The
+        # platform passes the bindings from the coordinator's entity plan.
+        if target_map is None:
+            overrides = device_target_overrides(coordinator.config_entry, appliance.device_id)
+            target_map = climate_target_bindings(appliance, data_dictionary, overrides)
+        self.target_map = target_map
 
         hvac_modes: list[HVACMode] = []
         for target, status in self.target_map.items():
@@ -218,6 +276,7 @@ class ConnectLifeClimate(ConnectLifeEntity, ClimateEntity):
 
         if data_dictionary.presets:
             self.preset_map = data_dictionary.presets
+            self.preset_index = PresetIndex(self.preset_map)
             self._attr_preset_modes = list(self.preset_map.keys())
             if PRESET_NONE not in self._attr_preset_modes:
                 self._attr_preset_modes.append(PRESET_NONE)
@@ -230,6 +289,10 @@ class ConnectLifeClimate(ConnectLifeEntity, ClimateEntity):
             if IS_ON not in self.target_map:
                 self._attr_hvac_mode = HVACMode.AUTO
         self._attr_hvac_modes = hvac_modes
+        self.watch(
+            *self.target_map.values(),
+            *(name for preset in self.preset_map.values() for name in preset),
+        )
 
         self.update_state()
 
@@ -290,17 +353,9 @@ class ConnectLifeClimate(ConnectLifeEntity, ClimateEntity):
 
         if self._attr_supported_features & ClimateEntityFeature.PRESET_MODE:
             # If current preset matches, don't change
-            status_list = self.coordinator.data[self.device_id].status_list
-            if (
-                    self._attr_preset_mode not in self.preset_map
-                    or not self.preset_map[self._attr_preset_mode].items() <= status_list.items()
-            ):
-                preset_mode = PRESET_NONE
-                for preset, preset_map in self.preset_map.items():
-                    if preset_map.items() <= status_list.items():
-                        preset_mode = preset
-                        break
-                self._attr_preset_mode = preset_mode
+            self._attr_preset_mode = self.preset_index.match(
+                self.coordinator.data[self.device_id].status_list, self._attr_preset_mode
+            ) or PRESET_NONE
 
         self._attr_hvac_mode = hvac_mode if is_on else HVACMode.OFF
 
@@ -25,6 +25,7 @@ from .const import (
     CONF_DEVELOPMENT_MODE,
     CONF_DISABLE_BEEP,
     CONF_EXPOSE_OFFLINE_STATE,
+    CONF_POLL_BUDGET,
     CONF_TARGET_OVERRIDES,
     CONF_TEST_SERVER_URL,
     CONF_TRIR,
@@ -32,6 +33,7 @@ from .const import (
     OVERRIDE_AUTO,
 )
 from .dictionaries import Dictionaries
+from .scheduler import DEFAULT_POLL_BUDGET
 from .utils import contested_climate_targets
 
 _LOGGER = logging.getLogger(__name__)
@@ -234,10 +236,18 @@ class OptionsFlowHandler(OptionsFlow):
     """Handles options flow for the component."""
 
     _device_id: str | None = None
+    # Entry options carrying the account-wide settings from the init step.
+    _options: dict[str, Any] | None = None
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
-        # Select device to configure
+        # Account-wide settings, and optionally select a device to configure
         if user_input is not None:
+            self._options = {
+                **self.config_entry.options,
+                CONF_POLL_BUDGET: user_input[CONF_POLL_BUDGET],
+            }
+            if "device" not in user_input:
+                return self.async_create_entry(title="", data=self._options)
             self._device_id = user_input["device"]
             return await self.async_step_configure_device()
 
@@ -247,8 +257,12 @@ class OptionsFlowHandler(OptionsFlow):
             for device in sorted(coordinator.data.values(), key=lambda d: d.device_nickname)
         }
 
+        poll_budget = self.config_entry.options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET)
         schema = vol.Schema(
             {
+                vol.Optional(CONF_POLL_BUDGET, default=poll_budget): vol.All(
+                    vol.Coerce(int), vol.Range(min=60, max=3600)
+                ),
                 vol.Optional("device"): vol.In(devices),
             }
         )
@@ -270,7 +284,7 @@ class OptionsFlowHandler(OptionsFlow):
 
         # Configure the device
         if user_input is not None:
-            data = self.config_entry.options.copy()
+            data = (self._options or self.config_entry.options).copy()
             data[CONF_DEVICES] = data[CONF_DEVICES].copy() if CONF_DEVICES in data else {}
             overrides = {
                 target: user_input[self._override_key(target)]
@@ -10,6 +10,7 @@ CONF_DEVICES = "devices"
 CONF_DEVELOPMENT_MODE = "development_mode"
 CONF_DISABLE_BEEP = "disable_beep"
 CONF_EXPOSE_OFFLINE_STATE = "expose_offline_state"
+CONF_POLL_BUDGET = "poll_budget"
 CONF_TARGET_OVERRIDES = "target_overrides"
 CONF_TEST_SERVER_URL = "test_server_url"
 CONF_TRIR = "trir"
@@ -44,3 +45,4 @@ TARGET_TEMPERATURE = "target_temperature"
 TEMPERATURE_UNIT = "temperature_unit"
 
 SW_VERSION_PROPERTY = "oem_host_version"
+BEEP_PROPERTY = "t_beep"
@@ -1,6 +1,11 @@
+import asyncio
+import aiohttp
 import async_timeout
 import logging
-from collections.abc import Mapping
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
 from datetime import timedelta
 
 from connectlife.api import LifeConnectAuthError, LifeConnectError, ConnectLifeApi, EnergyResult
@@ -8,97 +13,687 @@ from connectlife.appliance import ConnectLifeAppliance
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import list_statistic_ids
 from homeassistant.const import Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr, entity_registry as er, issue_registry as ir
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DATA_STATE_CLASS_MIGRATION_DONE, DOMAIN
+from .api_guard import PRIORITY_BACKGROUND, PRIORITY_COMMAND, ApiGuard
+from .const import BEEP_PROPERTY, DATA_STATE_CLASS_MIGRATION_DONE, DOMAIN
 from .dictionaries import Dictionaries
+from .entity_plan import EntityPlan, build_entity_plan
 from .messages import format_retry_message
-from .statistics_sources import STATISTICS_SOURCES, enabled_sensors
+from .scheduler import DEFAULT_POLL_BUDGET, PollScheduler
+from .session import AccountSession
+from .snapshot import ApplianceSnapshot
+from .statistics_sources import STATISTICS_SOURCES, StatisticsSource, enabled_sensors
+from .token_cache import TokenCache
+from .utils import device_target_overrides
 
 MAX_RETRIES = 3
+# Commands for the same device arriving within this many seconds are sent as
+# one update.
+COMMAND_COALESCE_DELAY = 0.2
+# Refreshes within this many seconds of the last successful fetch reuse its
+# data instead of calling the cloud again.
+MIN_FETCH_SPACING = 5.0
+# Seconds after the last command before a refresh checks that the devices
+# report the values the commands wrote.
+CONFIRMATION_DELAY = 5.0
+# Recent polls and commands the success rate and median latency cover.
+POLL_HISTORY = 50
+COMMAND_HISTORY = 50
 STATISTICS_UPDATE_INTERVAL = timedelta(minutes=10)
+STATISTICS_MAX_CONCURRENT_FETCHES = 4
+STATISTICS_FETCH_TIMEOUT = 30
+
+# Creates a platform's entities for one appliance.
+EntityFactory = Callable[[ConnectLifeAppliance], Iterable[Entity]]
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class DeviceSubscription:
+    """Listener context naming the device and status properties an entity renders.
+
+    ``properties`` is ``None`` until the entity watches something, meaning any
+    change on the device notifies it. Once set, the entity is only notified when
+    one of those properties changes, or when the device itself changes (added,
+    removed or ``offline_state`` flipped). An entity following its ``key`` in
+    the data dictionary's dependency graph is also notified when a property
+    the graph lists for it changes (see ``Dictionary.dependents``).
+    """
+
+    def __init__(self, device_id: str):
+        self.device_id = device_id
+        self.properties: set[str] | None = None
+        self.key: str | None = None
+
+    def watch(self, *properties: str) -> None:
+        """Add status properties to the watched set (an empty call watches none)."""
+        if self.properties is None:
+            self.properties = set()
+        self.properties.update(properties)
+
+    def follow(self, key: str, *properties: str) -> None:
+        """Watch the properties the dependency graph lists for entity ``key``, and ``properties``."""
+        self.key = key
+        self.watch(*properties)
+
+    def affected_by(
+            self,
+            changes: Mapping[str, set[str] | None],
+            woken: Mapping[str, set[str]] | None = None,
+    ) -> bool:
+        """Whether ``changes`` (see ``changed_properties``) concern this subscription.
+
+        ``woken`` holds the keys of the entities reading the changed
+        properties, per device.
+        """
+        if self.device_id not in changes:
+            return False
+        changed = changes[self.device_id]
+        if changed is None or self.properties is None:
+            return True
+        if self.key is not None and woken is not None and self.key in woken.get(self.device_id, ()):
+            return True
+        return not self.properties.isdisjoint(changed)
+
+
+def changed_properties(
+        previous: Mapping[str, ConnectLifeAppliance] | None,
+        current: Mapping[str, ConnectLifeAppliance],
+) -> dict[str, set[str] | None] | None:
+    """Diff two appliance snapshots.
+
+    Returns ``{device_id: changed property names}`` for devices whose
+    ``status_list`` changed, with ``None`` in place of the names when the whole
+    device changed (added, removed or ``offline_state`` flipped). Unchanged
+    devices are omitted. Returns ``None`` when there is no previous snapshot.
+    """
+    if previous is None:
+        return None
+    changes: dict[str, set[str] | None] = {}
+    for device_id in previous.keys() - current.keys():
+        changes[device_id] = None
+    for device_id, appliance in current.items():
+        old = previous.get(device_id)
+        if old is None or old.offline_state != appliance.offline_state:
+            changes[device_id] = None
+            continue
+        if old is appliance:
+            continue
+        old_status, new_status = old.status_list, appliance.status_list
+        changed = {
+            name for name, value in new_status.items()
+            if name not in old_status or old_status[name] != value
+        }
+        changed.update(old_status.keys() - new_status.keys())
+        if changed:
+            changes[device_id] = changed
+    return changes
+
+
+def _merge_confirmations(
+        target: dict[str, dict[str, tuple[int | str, float]]],
+        source: dict[str, dict[str, tuple[int | str, float]]],
+) -> None:
+    """Add ``source`` to ``target``; values already in ``target`` are newer."""
+    for device_id, written in source.items():
+        target[device_id] = {**written, **target.get(device_id, {})}
+
+
+async def _guarded(guard: ApiGuard | None, priority: int, func, *args, name: str | None = None):
+    """Call the API through ``guard`` when there is one."""
+    if guard is None:
+        return await func(*args)
+    return await guard.call(priority, func, *args, name=name)
+
+
+class _CommandBatch:
+    """Commands for one device waiting to be sent as a single update."""
+
+    def __init__(self, beep: int | str | None):
+        # Commands are only merged when they agree on t_beep, so a caller's
+        # beep setting (and its retry without it) never leaks onto others.
+        self.beep = beep
+        self.command: dict[str, str] = {}
+        self.properties: dict[str, int | str] = {}
+        self.waiters: list[asyncio.Future[None]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
 class ConnectLifeCoordinator(DataUpdateCoordinator[dict[str, ConnectLifeAppliance]]):
     """ConnectLife coordinator."""
 
     # We need initial data, so no retries for first request.
     error_count = MAX_RETRIES
+    # Property changes of the last fetch or command, consumed by the next
+    # async_update_listeners (None = notify every listener).
+    _pending_changes: dict[str, set[str] | None] | None = None
+    # Listener notifications delivered vs. skipped because nothing the
+    # entity watches changed.
+    updates_delivered = 0
+    updates_skipped = 0
+    # Entity state writes skipped because the rendered state was unchanged.
+    writes_suppressed = 0
+    # Refreshes served by a fetch in flight or a recent one (see _async_update_data).
+    refreshes_coalesced = 0
+    # Seconds the last poll took, and the entities it notified and that wrote a
+    # new state.
+    last_poll_duration: float | None = None
+    last_poll_entities_notified: int | None = None
+    last_poll_entities_written: int | None = None
+    # Set while the listeners are notified of the poll that just finished.
+    _dispatching_poll = False
+    # Commands waiting to be sent or for the device's answer.
+    commands_queued = 0
+    # Polls since setup, successful or not.
+    polls_completed = 0
+    _update_task: asyncio.Task | None = None
+    _confirmation_timer: asyncio.TimerHandle | None = None
+    # Written values confirmed or rolled back by the confirmation refresh, and
+    # seconds from the last confirmed command to its confirmation.
+    commands_confirmed = 0
+    commands_rolled_back = 0
+    last_confirmation_latency: float | None = None
+    # time.monotonic() of the last successful fetch.
+    _fetched_at: float | None = None
+    snapshot: ApplianceSnapshot | None = None
+    # Rate limiter and circuit breaker for the account's gateway calls.
+    guard: ApiGuard | None = None
+    token_cache: TokenCache | None = None
+    # Client and appliance poll shared with other entries of the account.
+    session: AccountSession | None = None
+    # Config entry options the entities were created with (see update_listener).
+    applied_options: Mapping | None = None
 
-    def __init__(self, hass, api: ConnectLifeApi):
+    def __init__(
+            self,
+            hass,
+            api: ConnectLifeApi,
+            poll_budget: int = DEFAULT_POLL_BUDGET,
+            snapshot: ApplianceSnapshot | None = None,
+            guard: ApiGuard | None = None,
+            token_cache: TokenCache | None = None,
+            session: AccountSession | None = None,
+    ):
         """Initialize coordinator."""
         self.api = api
+        self.snapshot = snapshot
+        self.guard = guard
+        self.token_cache = token_cache
+        self.session = session
+        self.scheduler = PollScheduler(poll_budget)
+        self._command_batches: dict[str, _CommandBatch] = {}
+        self._command_locks: dict[str, asyncio.Lock] = {}
+        # Values written by commands, per device and property, with the
+        # time.monotonic() they were sent: awaiting the confirmation timer,
+        # and due to be checked by the next fetch. Values a device did not
+        # report yet are checked once more by the fetch after that.
+        self._unconfirmed: dict[str, dict[str, tuple[int | str, float]]] = {}
+        self._confirmations_due: dict[str, dict[str, tuple[int | str, float]]] = {}
+        self._confirmation_retries: dict[str, dict[str, tuple[int | str, float]]] = {}
+        # Outcomes of the recent polls, and seconds the recent commands took.
+        self._poll_results: deque[bool] = deque(maxlen=POLL_HISTORY)
+        self._command_latencies: deque[float] = deque(maxlen=COMMAND_HISTORY)
         # Register of entities created this setup, keyed by unique ID (used by
         # cleanup_removed_entities). Instance-scoped so a reload — e.g. after
         # toggling a per-device option — starts fresh and prunes entities that
         # are no longer created, such as the offline-state binary sensor.
         self.entities: dict[str, Platform] = {}
+        # Entity plans of this setup, keyed by device ID (see entity_plan).
+        self._entity_plans: dict[str, EntityPlan] = {}
+        # Platform entity factories and the entities they created per device,
+        # so a single device can be rebuilt (see async_rebuild_device).
+        self._entity_factories: list[tuple[EntityFactory, AddEntitiesCallback]] = []
+        self._device_entities: dict[str, list[Entity]] = {}
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=self.scheduler.next_interval(),
         )
 
     async def _async_update_data(self):
-        """Fetch data from API endpoint."""
+        """Fetch data from API endpoint, sharing a fetch already in flight.
+
+        Refresh triggers arriving close together (the periodic poll, manual
+        entity updates, refreshes after commands) share one fetch, and a
+        refresh within ``MIN_FETCH_SPACING`` of the last successful fetch
+        returns its data. Only the refresh that started a fetch reports its
+        changes to the listeners.
+        """
+        if self._update_task is None:
+            if (
+                    self._fetched_at is not None
+                    and time.monotonic() - self._fetched_at < MIN_FETCH_SPACING
+            ):
+                self.refreshes_coalesced += 1
+                self._pending_changes = {}
+                return self.data
+            self._update_task = asyncio.create_task(self._async_update())
+            self._update_task.add_done_callback(self._update_done)
+            joined = False
+        else:
+            self.refreshes_coalesced += 1
+            joined = True
+        # Shielded so one cancelled refresh does not cancel the others.
+        data, changes = await asyncio.shield(self._update_task)
+        if joined:
+            self._pending_changes = {}
+        else:
+            # After a failed refresh every entity must re-evaluate availability.
+            self._pending_changes = changes if self.last_update_success else None
+            self._dispatching_poll = True
+        return data
+
+    def _update_done(self, task: asyncio.Task) -> None:
+        self._update_task = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes, a fetch in flight and commands not yet sent."""
+        self._drop_commands()
+        await super().async_shutdown()
+        if self._confirmation_timer is not None:
+            self._confirmation_timer.cancel()
+            self._confirmation_timer = None
+        if self._update_task is not None:
+            self._update_task.cancel()
+
+    async def _async_update(
+            self,
+    ) -> tuple[dict[str, ConnectLifeAppliance], dict[str, set[str] | None] | None]:
+        """Fetch appliances and schedule the next poll."""
+        start = time.monotonic()
+        # Confirmations due now are checked against this fetch; later ones
+        # wait for the next.
+        due, self._confirmations_due = self._confirmations_due, {}
+        success = reused = False
+        try:
+            data, reused = await self._async_fetch_appliances()
+            success = self.error_count == 0
+            if success:
+                self._confirm_commands(self._confirmation_retries, data, last_check=True)
+                self._confirmation_retries = self._confirm_commands(due, data)
+            else:
+                _merge_confirmations(self._confirmations_due, due)
+            changes = changed_properties(self.data, data)
+            self.scheduler.record_changes(data, changes)
+            if self.snapshot is not None and changes != {}:
+                self.snapshot.async_save(data)
+            return data, changes
+        finally:
+            self.update_interval = self.scheduler.next_interval()
+            self.last_poll_duration = round(time.monotonic() - start, 3)
+            if not reused:
+                self._poll_results.append(success)
+                self.polls_completed += 1
+
+    @property
+    def poll_success_rate(self) -> float | None:
+        """Percentage of the recent polls that reached the cloud."""
+        if not self._poll_results:
+            return None
+        return round(100 * sum(self._poll_results) / len(self._poll_results), 1)
+
+    @property
+    def median_command_latency(self) -> float | None:
+        """Median seconds from a command to the cloud accepting it, over recent commands."""
+        if not self._command_latencies:
+            return None
+        return round(statistics.median(self._command_latencies), 3)
+
+    @callback
+    def _expect_confirmation(self, device_id: str, properties: Mapping[str, int | str]) -> None:
+        """Schedule the confirmation refresh for values just written to a device."""
+        sent_at = time.monotonic()
+        pending = self._unconfirmed.setdefault(device_id, {})
+        retries = self._confirmation_retries.get(device_id, {})
+        for prop, value in properties.items():
+            pending[prop] = (value, sent_at)
+            # The new value replaces one the device did not report yet.
+            retries.pop(prop, None)
+        if self.session is not None:
+            # The account's last poll predates the command.
+            self.session.invalidate()
+        # One refresh for all commands in quick succession, on any device.
+        if self._confirmation_timer is not None:
+            self._confirmation_timer.cancel()
+        self._confirmation_timer = self.hass.loop.call_later(
+            CONFIRMATION_DELAY, self._async_confirm
+        )
+
+    @callback
+    def _async_confirm(self) -> None:
+        """Refresh to confirm the commands sent since the last confirmation."""
+        self._confirmation_timer = None
+        _merge_confirmations(self._confirmations_due, self._unconfirmed)
+        self._unconfirmed = {}
+        # Not answered from a fetch that may predate the commands.
+        self._fetched_at = None
+        self.hass.async_create_task(self.async_refresh(), f"{DOMAIN} confirm commands")
+
+    def _confirm_commands(
+            self,
+            due: dict[str, dict[str, tuple[int | str, float]]],
+            data: dict[str, ConnectLifeAppliance],
+            last_check: bool = False,
+    ) -> dict[str, dict[str, tuple[int | str, float]]]:
+        """Compare the values devices report with what the commands wrote.
+
+        A device that did not apply a value reports the old one; the fetched
+        data replaces the optimistic value, so the entities roll back with the
+        regular change dispatch. Slow devices may apply a command late, so
+        the values not reported by the first check are returned to be checked
+        again by the next fetch; only the ``last_check`` rolls them back.
+        """
+        now = time.monotonic()
+        retries: dict[str, dict[str, tuple[int | str, float]]] = {}
+        for device_id, written in due.items():
+            appliance = data.get(device_id)
+            if appliance is None:
+                continue
+            for prop, (value, sent_at) in written.items():
+                reported = appliance.status_list.get(prop)
+                if reported is not None and str(reported) == str(value):
+                    self.commands_confirmed += 1
+                    self.last_confirmation_latency = round(now - sent_at, 3)
+                elif not last_check:
+                    retries.setdefault(device_id, {})[prop] = (value, sent_at)
+                else:
+                    self.commands_rolled_back += 1
+                    _LOGGER.warning(
+                        "%s did not apply %s=%s, it reports %s",
+                        appliance.device_nickname,
+                        prop,
+                        value,
+                        reported,
+                    )
+        return retries
+
+    def entity_plan(self, appliance: ConnectLifeAppliance) -> EntityPlan:
+        """Entities to create for an appliance, built on first use by any platform."""
+        plan = self._entity_plans.get(appliance.device_id)
+        if plan is None:
+            plan = self._entity_plans[appliance.device_id] = build_entity_plan(
+                appliance,
+                Dictionaries.get_dictionary(appliance),
+                device_target_overrides(self.config_entry, appliance.device_id),
+            )
+        return plan
+
+    @callback
+    def async_restore(self, data: dict[str, ConnectLifeAppliance]) -> None:
+        """Start from snapshot data, unavailable until the first live refresh."""
+        self.data = data
+        self.last_update_success = False
+
+    async def _async_fetch_appliances(self) -> tuple[dict[str, ConnectLifeAppliance], bool]:
+        """Fetch appliances, tolerating a few consecutive API failures.
+
+        Also returns whether the appliances come from another entry's recent
+        poll (see ``AccountSession``). Such a poll is not counted against the
+        poll budget and does not count as a fetch of this coordinator.
+        """
+        reused = False
         try:
             # Note: aiohttp.ClientError is already handled by the data update
-            # coordinator. TimeoutError is retried here so the UI gets the
+            # coordinator (it is only counted for the backoff here). TimeoutError is retried here so the UI gets the
             # same user-facing retry message as other ConnectLife API errors.
             async with async_timeout.timeout(30):
-                await self.api.get_appliances()
+                if self.session is not None:
+                    _, reused = await self.session.async_get_appliances()
+                else:
+                    await _guarded(self.guard, PRIORITY_BACKGROUND, self.api.get_appliances)
+                if reused:
+                    return {a.device_id: a for a in self.api.appliances}, True
                 self.error_count = 0
+                self._fetched_at = time.monotonic()
+                self.scheduler.record_success()
+                if self.token_cache is not None:
+                    # The client may have refreshed or replaced its token.
+                    self.token_cache.async_save(self.api)
         except LifeConnectAuthError as err:
             # Raising ConfigEntryAuthFailed will cancel future updates
             # and start a config flow with SOURCE_REAUTH (async_step_reauth)
             raise ConfigEntryAuthFailed from err
+        except aiohttp.ClientError:
+            self.scheduler.record_failure()
+            raise
         except TimeoutError as err:
+            self.scheduler.record_failure()
             self.error_count += 1
             i = MAX_RETRIES - self.error_count
             if i > 0:
                 _LOGGER.debug(
-                    "ConnectLife API request timed out, will try %d more %s",
+                    "ConnectLife API request timed out, will try %d more %s, next in %s",
                     i,
                     "time" if i == 1 else "times",
+                    self.scheduler.next_interval(),
                 )
             else:
                 raise UpdateFailed(format_retry_message(err)) from err
         except LifeConnectError as err:
+            self.scheduler.record_failure()
             self.error_count += 1
             i = MAX_RETRIES - self.error_count
             if i > 0:
                 _LOGGER.debug(
-                    "ConnectLife API failed with '%s', will try %d more %s",
+                    "ConnectLife API failed with '%s', will try %d more %s, next in %s",
                     err,
                     i,
                     "time" if i == 1 else "times",
+                    self.scheduler.next_interval(),
                 )
             else:
                 raise UpdateFailed(format_retry_message(err)) from err
-        return {a.device_id: a for a in self.api.appliances}
+        finally:
+            if not reused:
+                self.scheduler.record_poll()
+        return {a.device_id: a for a in self.api.appliances}, False
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners affected by the pending property changes."""
+        changes, self._pending_changes = self._pending_changes, None
+        woken = self._woken_entities(changes) if changes is not None else None
+        delivered = skipped = 0
+        suppressed = self.writes_suppressed
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                changes is not None
+                and isinstance(context, DeviceSubscription)
+                and not context.affected_by(changes, woken)
+            ):
+                skipped += 1
+                continue
+            update_callback()
+            delivered += 1
+        self.updates_delivered += delivered
+        self.updates_skipped += skipped
+        if self._dispatching_poll:
+            self._dispatching_poll = False
+            self.last_poll_entities_notified = delivered
+            self.last_poll_entities_written = delivered - (self.writes_suppressed - suppressed)
+        _LOGGER.debug(
+            "Delivered %d updates (%d left the state unchanged), skipped %d unchanged",
+            delivered,
+            self.writes_suppressed - suppressed,
+            skipped,
+        )
+
+    def _woken_entities(self, changes: Mapping[str, set[str] | None]) -> dict[str, set[str]]:
+        """Keys of the entities reading the changed properties, per device.
+
+        Looked up once per device in the dependency graph of the dictionary its
+        entities were planned with (see ``Dictionary.dependents``).
+        """
+        woken: dict[str, set[str]] = {}
+        for device_id, changed in changes.items():
+            plan = self._entity_plans.get(device_id)
+            if changed and plan is not None:
+                dependents = plan.dictionary.dependents
+                woken[device_id] = {key for name in changed for key in dependents.get(name, ())}
+        return woken
 
     async def async_update_device(self, device_id: str, command: Mapping[str, int | str], properties: Mapping[str, int | str]):
-        """Updates the device, and sets the properties in local copy and notify to avoid refetching."""
-        await self.api.update_appliance(self.data[device_id].puid, {k: str(v) for k, v in command.items()})
-        self.data[device_id].status_list.update(properties)
-        self.async_update_listeners()
+        """Updates the device, and sets the properties in local copy and notify to avoid refetching.
+
+        Commands for the same device arriving within ``COMMAND_COALESCE_DELAY``
+        are merged into one update (a later value for a property supersedes an
+        earlier one); every caller gets the result of that shared update.
+        """
+        beep = command.get(BEEP_PROPERTY)
+        batch = self._command_batches.get(device_id)
+        if batch is not None and batch.beep != beep:
+            self._flush_commands(device_id)
+            batch = None
+        if batch is None:
+            batch = self._command_batches[device_id] = _CommandBatch(beep)
+            batch.timer = self.hass.loop.call_later(
+                COMMAND_COALESCE_DELAY, self._flush_commands, device_id
+            )
+        batch.command.update({k: str(v) for k, v in command.items()})
+        batch.properties.update(properties)
+        waiter = self.hass.loop.create_future()
+        batch.waiters.append(waiter)
+        self.commands_queued += 1
+        start = time.monotonic()
+        try:
+            await waiter
+        finally:
+            self.commands_queued -= 1
+        self._command_latencies.append(time.monotonic() - start)
+
+    @callback
+    def _flush_commands(self, device_id: str) -> None:
+        """Send the pending command batch for a device."""
+        batch = self._command_batches.pop(device_id, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self.hass.async_create_task(
+            self._async_send_commands(device_id, batch),
+            f"{DOMAIN} command {device_id}",
+        )
+
+    @callback
+    def _drop_commands(self) -> None:
+        """Drop the pending command batches, cancelling their callers.
+
+        The session is about to close, so they are not sent.
+        """
+        batches, self._command_batches = self._command_batches, {}
+        for device_id, batch in batches.items():
+            if batch.timer is not None:
+                batch.timer.cancel()
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+            _LOGGER.debug(
+                "Dropped %d unsent commands for %s on shutdown", len(batch.waiters), device_id
+            )
+
+    async def _async_send_commands(self, device_id: str, batch: _CommandBatch) -> None:
+        """Send a command batch and resolve its waiters with the result."""
+        # Batches for a device are sent in order, one at a time.
+        lock = self._command_locks.setdefault(device_id, asyncio.Lock())
+        try:
+            async with lock:
+                await _guarded(
+                    self.guard,
+                    PRIORITY_COMMAND,
+                    self.api.update_appliance,
+                    self.data[device_id].puid,
+                    batch.command,
+                )
+        except Exception as err:  # pylint: disable=broad-except
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+        else:
+            if len(batch.waiters) > 1:
+                _LOGGER.debug(
+                    "Sent %d commands for %s as one update", len(batch.waiters), device_id
+                )
+            self.data[device_id].status_list.update(batch.properties)
+            self._pending_changes = {device_id: set(batch.properties)}
+            self.async_update_listeners()
+            self._expect_confirmation(device_id, batch.properties)
+            # Poll sooner so the device's response to the command shows up quickly.
+            self.scheduler.record_command(device_id)
+            self.update_interval = self.scheduler.next_interval()
+            if self._listeners:
+                self._schedule_refresh()
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+        finally:
+            # Only reached with pending waiters if the send itself was cancelled.
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.cancel()
 
     def add_entity(self, entity_unique_id: str, platform: Platform):
         """Add known entity."""
         self.entities[entity_unique_id] = platform;
 
-    async def cleanup_removed_entities(self) -> None:
+    @callback
+    def async_add_entity_factory(
+            self,
+            factory: EntityFactory,
+            async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Add a platform's entities for every appliance.
+
+        The factory is kept to recreate the entities of a single device in
+        ``async_rebuild_device``.
         """
-        Cleanup entity registry for entities converted to a different entity
-        type or set to disabled in the mapping file, and create issues for
-        unavailable devices.
+        self._entity_factories.append((factory, async_add_entities))
+        entities: list[Entity] = []
+        for appliance in self.data.values():
+            entities.extend(self._create_device_entities(appliance, factory))
+        async_add_entities(entities)
+
+    def _create_device_entities(
+            self, appliance: ConnectLifeAppliance, factory: EntityFactory
+    ) -> list[Entity]:
+        entities = list(factory(appliance))
+        self._device_entities.setdefault(appliance.device_id, []).extend(entities)
+        return entities
+
+    async def async_rebuild_device(self, device_id: str) -> None:
+        """Recreate the entities of one device, e.g. after its options changed.
+
+        The coordinator, the API session and the entities of other devices are
+        left alone. Registry entries of entities that are no longer created are
+        removed.
         """
+        entities = self._device_entities.pop(device_id, [])
+        for entity in entities:
+            if entity.unique_id is not None:
+                self.entities.pop(entity.unique_id, None)
+        await asyncio.gather(*(entity.async_remove() for entity in entities if entity.hass))
+        self._entity_plans.pop(device_id, None)
+        appliance = self.data.get(device_id)
+        if appliance is not None:
+            for factory, async_add_entities in self._entity_factories:
+                async_add_entities(self._create_device_entities(appliance, factory))
+        self._remove_unmapped_entities(device_id)
+        _LOGGER.debug(
+            "Rebuilt %s: %d entities replaced by %d",
+            device_id,
+            len(entities),
+            len(self._device_entities.get(device_id, [])),
+        )
 
+    @callback
+    def _remove_unmapped_entities(self, only_device_id: str | None = None) -> None:
+        """Remove registry entries of entities this setup no longer creates."""
         device_reg = dr.async_get(self.hass)
         entity_reg = er.async_get(self.hass)
 
@@ -112,7 +707,11 @@ class ConnectLifeCoordinator(DataUpdateCoordinator[dict[str, ConnectLifeApplianc
                 if device is None:
                     continue
                 for (domain, device_id) in device.identifiers:
-                    if domain == DOMAIN and device_id in self.data:
+                    if (
+                            domain == DOMAIN
+                            and device_id in self.data
+                            and only_device_id in (None, device_id)
+                    ):
                         _LOGGER.info(
                             "Entity %s (%s) is no longer mapped, removing",
                             entity.unique_id,
@@ -120,7 +719,20 @@ class ConnectLifeCoordinator(DataUpdateCoordinator[dict[str, ConnectLifeApplianc
                         )
                         entity_reg.async_remove(entity.entity_id)
 
+    async def cleanup_removed_entities(self) -> None:
+        """
+        Cleanup entity registry for entities converted to a different entity
+        type or set to disabled in the mapping file, and create issues for
+        unavailable devices.
+        """
+
+        device_reg = dr.async_get(self.hass)
+        self._remove_unmapped_entities()
+
         for device in dr.async_entries_for_config_entry(device_reg, self.config_entry.entry_id):
+            if device.entry_type == dr.DeviceEntryType.SERVICE:
+                # The account device of the diagnostic sensors.
+                continue
             for (domain, device_id) in device.identifiers:
                 if domain == DOMAIN:
                     if device_id not in self.data:
@@ -212,12 +824,32 @@ class ConnectLifeCoordinator(DataUpdateCoordinator[dict[str, ConnectLifeApplianc
 class ConnectLifeStatisticsCoordinator(DataUpdateCoordinator[dict[str, EnergyResult | None]]):
     """ConnectLife statistics coordinator. Polls each appliance's statistics endpoint
     (selected per device type via the data dictionary ``statistics_source``) every 10
-    minutes. Stores the fetched result per device; sensors extract their datapoint."""
+    minutes. Stores the fetched result per device; sensors extract their datapoint.
 
-    def __init__(self, hass, api: ConnectLifeApi, appliance_coordinator: ConnectLifeCoordinator):
+    Devices are fetched concurrently, at most ``max_concurrent_fetches`` at a time and
+    each bounded by ``fetch_timeout`` seconds."""
+
+    max_concurrent_fetches = STATISTICS_MAX_CONCURRENT_FETCHES
+    fetch_timeout = STATISTICS_FETCH_TIMEOUT
+    guard: ApiGuard | None = None
+    # Seconds the last statistics cycle took.
+    last_cycle_duration: float | None = None
+
+    def __init__(
+            self,
+            hass,
+            api: ConnectLifeApi,
+            appliance_coordinator: ConnectLifeCoordinator,
+            max_concurrent_fetches: int = STATISTICS_MAX_CONCURRENT_FETCHES,
+            fetch_timeout: float = STATISTICS_FETCH_TIMEOUT,
+            guard: ApiGuard | None = None,
+    ):
         """Initialize statistics coordinator."""
         self.api = api
         self.appliance_coordinator = appliance_coordinator
+        self.guard = guard
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self.fetch_timeout = fetch_timeout
         super().__init__(
             hass,
             _LOGGER,
@@ -227,26 +859,70 @@ class ConnectLifeStatisticsCoordinator(DataUpdateCoordinator[dict[str, EnergyRes
 
     async def _async_update_data(self) -> dict[str, EnergyResult | None]:
         """Fetch statistics for appliances whose data dictionary opts into an endpoint."""
-        result: dict[str, EnergyResult | None] = {}
-        for device_id, appliance in self.appliance_coordinator.data.items():
+        start = time.monotonic()
+        try:
+            return await self._async_fetch_statistics()
+        finally:
+            self.last_cycle_duration = round(time.monotonic() - start, 3)
+
+    async def _async_fetch_statistics(self) -> dict[str, EnergyResult | None]:
+        """Fetch the appliances' statistics concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def fetch(source: StatisticsSource, appliance: ConnectLifeAppliance) -> EnergyResult | None:
+            async with semaphore:
+                async with async_timeout.timeout(self.fetch_timeout):
+                    return await _guarded(
+                        self.guard,
+                        PRIORITY_BACKGROUND,
+                        source.fetch,
+                        self.api,
+                        appliance,
+                        name=source.api_method,
+                    )
+
+        tasks: dict[asyncio.Task[EnergyResult | None], ConnectLifeAppliance] = {}
+        for appliance in self.appliance_coordinator.data.values():
             dictionary = Dictionaries.get_dictionary(appliance)
             source = STATISTICS_SOURCES.get(dictionary.statistics_source or "")
             if source is None or not enabled_sensors(
                 dictionary.statistics_source, dictionary.statistics_sensors
             ):
                 continue
-            try:
-                result[device_id] = await source.fetch(self.api, appliance)
-            except LifeConnectAuthError:
-                # Token is rejected; stop rather than hammering the gateway (and any
-                # re-login) for every remaining device. Recovers on the next cycle.
-                _LOGGER.debug("Statistics auth failed; skipping remaining devices this cycle")
-                break
-            except Exception:
-                _LOGGER.debug(
-                    "Failed to fetch statistics for %s",
-                    appliance.device_nickname,
-                    exc_info=True,
-                )
-                result[device_id] = None
+            tasks[asyncio.create_task(fetch(source, appliance))] = appliance
+
+        result: dict[str, EnergyResult | None] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                auth_failed = False
+                for task in done:
+                    appliance = tasks[task]
+                    try:
+                        result[appliance.device_id] = task.result()
+                    except LifeConnectAuthError:
+                        auth_failed = True
+                    except TimeoutError:
+                        _LOGGER.debug(
+                            "Timed out fetching statistics for %s", appliance.device_nickname
+                        )
+                        result[appliance.device_id] = None
+                    except Exception:
+                        _LOGGER.debug(
+                            "Failed to fetch statistics for %s",
+                            appliance.device_nickname,
+                            exc_info=True,
+                        )
+                        result[appliance.device_id] = None
+                if auth_failed:
+                    # Token is rejected; stop rather than hammering the gateway (and any
+                    # re-login) for every remaining device. Recovers on the next cycle.
+                    _LOGGER.debug("Statistics auth failed; cancelling remaining devices this cycle")
+                    return result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
         return result
@@ -0,0 +1,163 @@
+"""Per-property value decoders, compiled once when an entity is created.
+
+A decoder takes an appliance ``status_list`` and returns the entity's new
+value, or ``MISSING`` when the property is not reported (the entity then keeps
+its current value). Each factory returns the most specialised callable for the
+data dictionary entry, so the branches on unit, unknown value, multiplier and
+options are taken once at setup instead of on every coordinator update.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from .dictionaries import CombineSource
+
+MISSING: Any = object()
+
+Decoder = Callable[[Mapping[str, Any]], Any]
+# Called with a raw value that is not in the options map; returns the value to show.
+UnexpectedValue = Callable[[Any], Any]
+
+
+def value_decoder(status: str, unknown_value: Any = None, multiplier: float | None = None) -> Decoder:
+    """Raw value, ``None`` for the unknown value, scaled by ``multiplier``."""
+    if multiplier is None:
+        if unknown_value is None:
+            return lambda status_list: status_list.get(status, MISSING)
+
+        def decode(status_list: Mapping[str, Any]) -> Any:
+            value = status_list.get(status, MISSING)
+            return None if value == unknown_value else value
+
+        return decode
+
+    def decode_scaled(status_list: Mapping[str, Any]) -> Any:
+        value = status_list.get(status, MISSING)
+        if value is MISSING:
+            return MISSING
+        if value == unknown_value or value is None:
+            return None
+        return value * multiplier
+
+    return decode_scaled
+
+
+def enum_decoder(
+    status: str,
+    options: Mapping[Any, Any],
+    on_unexpected: UnexpectedValue,
+    unknown_value: Any = None,
+    multiplier: float | None = None,
+) -> Decoder:
+    """Value looked up in ``options`` (read live, so additions are seen).
+
+    A value that is neither mapped nor the unknown value goes through
+    ``on_unexpected``. The result is then treated as by ``value_decoder``.
+    """
+
+    def decode(status_list: Mapping[str, Any]) -> Any:
+        value = status_list.get(status, MISSING)
+        if value is MISSING:
+            return MISSING
+        if value in options:
+            value = options[value]
+        elif value != unknown_value:
+            value = on_unexpected(value)
+        if value == unknown_value:
+            return None
+        if multiplier is not None and value is not None:
+            value *= multiplier
+        return value
+
+    return decode
+
+
+def combine_decoder(
+    status: str,
+    sources: Sequence[CombineSource],
+    fallback: Decoder,
+    unknown_value: Any = None,
+    multiplier: float | None = None,
+) -> Decoder:
+    """Sum of the numeric ``sources`` (each with its own unknown value and multiplier).
+
+    Without any usable source, the property's own value is decoded by
+    ``fallback``, or ``None`` when the property is not reported either.
+    """
+    parts = tuple(
+        (source["property"], source.get("unknown_value", MISSING), source.get("multiplier", 1))
+        for source in sources
+    )
+
+    def decode(status_list: Mapping[str, Any]) -> Any:
+        value = 0.0
+        has_sources = False
+        for name, source_unknown, source_multiplier in parts:
+            src_value = status_list.get(name)
+            if src_value is not None and isinstance(src_value, (int, float)):
+                if src_value == source_unknown:
+                    continue
+                value += src_value * source_multiplier
+                has_sources = True
+        if has_sources:
+            if value == unknown_value:
+                return None
+            return value * multiplier if multiplier is not None else value
+        if status not in status_list:
+            return None
+        return fallback(status_list)
+
+    return decode
+
+
+def select_decoder(
+    status: str,
+    options: Mapping[Any, str],
+    on_unexpected: UnexpectedValue,
+    unknown_value: Any = None,
+) -> Decoder:
+    """Option name for the raw value; ``None`` for the unknown value."""
+
+    def decode(status_list: Mapping[str, Any]) -> Any:
+        value = status_list.get(status, MISSING)
+        if value is MISSING:
+            return MISSING
+        if value == unknown_value:
+            return None
+        if value in options:
+            return options[value]
+        return on_unexpected(value)
+
+    return decode
+
+
+def switch_decoder(status: str, on: Any, off: Any, on_unexpected: UnexpectedValue) -> Decoder:
+    """``True`` for the on value, ``False`` for the off value."""
+
+    def decode(status_list: Mapping[str, Any]) -> Any:
+        value = status_list.get(status, MISSING)
+        if value is MISSING:
+            return MISSING
+        if value == on:
+            return True
+        if value == off:
+            return False
+        return on_unexpected(value)
+
+    return decode
+
+
+def mapped_decoder(status: str, options: Mapping[Any, Any], on_unexpected: UnexpectedValue) -> Decoder:
+    """Value looked up in a fixed map (binary sensor states)."""
+
+    def decode(status_list: Mapping[str, Any]) -> Any:
+        value = status_list.get(status, MISSING)
+        if value is MISSING:
+            return MISSING
+        if value in options:
+            return options[value]
+        return on_unexpected(value)
+
+    return decode
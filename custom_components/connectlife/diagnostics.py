@@ -0,0 +1,118 @@
+"""Diagnostics support for ConnectLife."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from connectlife.appliance import ConnectLifeAppliance
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .const import DOMAIN
+from .coordinator import ConnectLifeCoordinator
+from .dictionaries import Dictionaries
+
+TO_REDACT = {"device_id", "device_nickname", "puid", "room_id", "room_name", "wifi_id"}
+
+
+def _status_bytes(appliances: list[ConnectLifeAppliance]) -> int:
+    """Approximate size of the status lists as sent by the cloud."""
+    return len(json.dumps([a.status_list for a in appliances], default=str))
+
+
+def _appliance(appliance: ConnectLifeAppliance) -> dict[str, Any]:
+    return async_redact_data(
+        {
+            "device_id": appliance.device_id,
+            "puid": appliance.puid,
+            "wifi_id": appliance.wifi_id,
+            "device_nickname": appliance.device_nickname,
+            "device_type_code": appliance.device_type_code,
+            "device_type_name": appliance.device_type_name,
+            "device_feature_code": appliance.device_feature_code,
+            "device_feature_name": appliance.device_feature_name,
+            "role": appliance.role,
+            "room_id": appliance.room_id,
+            "room_name": appliance.room_name,
+            "offline_state": appliance.offline_state,
+            "status_list": appliance.status_list,
+        },
+        TO_REDACT,
+    )
+
+
+async def _device(
+    hass: HomeAssistant, coordinator: ConnectLifeCoordinator, appliance: ConnectLifeAppliance
+) -> dict[str, Any]:
+    """Redacted appliance, its polling state and its resolved data dictionary."""
+    return {
+        "polling": coordinator.scheduler.device_as_dict(appliance.device_id),
+        "appliance": _appliance(appliance),
+        "status_bytes": _status_bytes([appliance]),
+        # Without an up-to-date bundle this reads the YAML files.
+        "dictionary": await hass.async_add_executor_job(Dictionaries.raw_dictionary, appliance),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ConnectLifeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    appliances = list((coordinator.data or {}).values())
+    return {
+        "polling": coordinator.scheduler.as_dict(),
+        "last_poll": {
+            "duration": coordinator.last_poll_duration,
+            "entities_notified": coordinator.last_poll_entities_notified,
+            "entities_written": coordinator.last_poll_entities_written,
+        },
+        "payload": {
+            "devices": len(appliances),
+            "properties": sum(len(a.status_list) for a in appliances),
+            "status_bytes": _status_bytes(appliances),
+        },
+        "updates": {
+            "delivered": coordinator.updates_delivered,
+            "skipped": coordinator.updates_skipped,
+            "writes_suppressed": coordinator.writes_suppressed,
+            "refreshes_coalesced": coordinator.refreshes_coalesced,
+        },
+        "commands": {
+            "confirmed": coordinator.commands_confirmed,
+            "rolled_back": coordinator.commands_rolled_back,
+            "last_confirmation_latency": coordinator.last_confirmation_latency,
+        },
+        "api": coordinator.guard.as_dict() if coordinator.guard is not None else None,
+        "session": (
+            {
+                "entries": len(coordinator.session.entries),
+                "polls_shared": coordinator.session.polls_shared,
+            }
+            if coordinator.session is not None
+            else None
+        ),
+        "appliances": [await _device(hass, coordinator, a) for a in appliances],
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a device."""
+    coordinator: ConnectLifeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device_id = next(
+        identifier for domain, identifier in device.identifiers if domain == DOMAIN
+    )
+    appliance = (coordinator.data or {}).get(device_id)
+    if appliance is None:
+        return {
+            "polling": coordinator.scheduler.device_as_dict(device_id),
+            "appliance": None,
+            "status_bytes": None,
+            "dictionary": None,
+        }
+    return await _device(hass, coordinator, appliance)
@@ -1,7 +1,10 @@
 import yaml
 from collections import defaultdict
 from dataclasses import dataclass, field
+import hashlib
+import json
 import logging
+import os
 import pkgutil
 from typing import Any, TypedDict
 
@@ -76,6 +79,27 @@ class CombineSource(_CombineSourceRequired, total=False):
     unknown_value: int
 
 
+# A unit given as ``property.<name>`` is read from that property's value.
+UNIT_PROPERTY_PREFIX = "property."
+
+
+def unit_property(unit: str | None) -> str | None:
+    """Name of the property a ``property.<name>`` unit is read from, else ``None``."""
+    if unit is not None and unit.startswith(UNIT_PROPERTY_PREFIX):
+        return unit[len(UNIT_PROPERTY_PREFIX):]
+    return None
+
+
+def entity_key(platform: Platform, name: str | None = None) -> str:
+    """Key of an entity in the dependency graph of a ``Dictionary``.
+
+    ``<platform>.<property>`` for per-property entities, ``button.<key>`` for
+    buttons and the bare platform for device-level entities (climate,
+    humidifier, water heater), whose targets are only resolved per appliance.
+    """
+    return platform.value if name is None else f"{platform.value}.{name}"
+
+
 def _val(d: dict, key: str, default: Any = None) -> Any:
     """Return ``d[key]`` if the key is present with a non-None value, else ``default``."""
     if key in d and d[key] is not None:
@@ -457,6 +481,13 @@ class Dictionary:
     # Per-sensor flags from the `statistics` block (sensor key -> create?). A sensor is
     # created only when listed true here; omitted or false means not created.
     statistics_sensors: dict[str, bool] = field(default_factory=dict)
+    # Dependency graph: entity key (see ``entity_key``) -> status properties the
+    # entity reads, including `combine` sources, `property.<name>` units,
+    # button `available_when` and climate presets; and the reverse, property ->
+    # keys of the entities reading it, used by the coordinator to notify the
+    # entities following their key (see ``DeviceSubscription.follow``).
+    depends_on: dict[str, set[str]] = field(default_factory=dict)
+    dependents: dict[str, set[str]] = field(default_factory=dict)
 
 
 # Device-level platforms own a `target` and may coexist with a per-property
@@ -562,9 +593,250 @@ def _load_yaml(path: str) -> tuple[bool, Any]:
     return True, yaml.safe_load(data)
 
 
+def _resolve(type_code: str, feature_code: str) -> tuple[bool, dict[str, Any]]:
+    """Read the base and subtype YAML of a device and merge them.
+
+    Returns ``(subtype_found, raw)`` where ``raw`` holds the merged, still
+    unparsed ``climate``, ``statistics``, ``properties`` and ``buttons``. This
+    is what the precompiled bundle stores per device key.
+    """
+    climate: dict | None = None
+    statistics: dict | None = None
+    raw_entries: dict[str, dict] = {}
+    raw_buttons: list[dict] = []
+
+    # TODO: Support default climate section
+    _, base_data = _load_yaml(f"data_dictionaries/{type_code}.yaml")
+    if base_data is not None:
+        statistics = _val(base_data, STATISTICS, statistics)
+        if PROPERTIES in base_data and base_data[PROPERTIES] is not None:
+            for prop in base_data[PROPERTIES]:
+                raw_entries[prop[PROPERTY]] = prop
+        if BUTTONS in base_data and base_data[BUTTONS] is not None:
+            raw_buttons = list(base_data[BUTTONS])
+
+    sub_found, sub_data = _load_yaml(f"data_dictionaries/{type_code}-{feature_code}.yaml")
+    if sub_data is not None:
+        statistics = _val(sub_data, STATISTICS, statistics)
+        if Platform.CLIMATE in sub_data:
+            climate = sub_data[Platform.CLIMATE]
+        if PROPERTIES in sub_data and sub_data[PROPERTIES] is not None:
+            for prop in sub_data[PROPERTIES]:
+                name = prop[PROPERTY]
+                raw_entries[name] = _merge_property(raw_entries.get(name), prop)
+        if BUTTONS in sub_data and sub_data[BUTTONS] is not None:
+            raw_buttons = _merge_buttons(raw_buttons, sub_data[BUTTONS])
+
+    return sub_found, {
+        Platform.CLIMATE.value: climate,
+        STATISTICS: statistics,
+        PROPERTIES: list(raw_entries.values()),
+        BUTTONS: raw_buttons,
+    }
+
+
+def _build(raw: dict[str, Any]) -> Dictionary:
+    """Parse a merged data dictionary (see ``_resolve``)."""
+    climate = raw[Platform.CLIMATE.value]
+
+    properties: dict[str, Property] = defaultdict(
+        lambda: Property({PROPERTY: "default", OPTIONAL: True})
+    )
+    for entry in raw[PROPERTIES]:
+        properties[entry[PROPERTY]] = Property(entry)
+
+    buttons = [Button(b) for b in raw[BUTTONS]]
+
+    # Parse presets into a name -> values map. The preset name is stripped
+    # from the value so it can be matched against a device status list.
+    presets = {
+        preset[PRESET]: {k: v for k, v in preset.items() if k != PRESET}
+        for preset in _val(climate or {}, PRESETS, [])
+    }
+
+    # Before combine sources not declared are added as placeholders below.
+    depends_on = _dependencies(properties, buttons, presets)
+
+    for prop in list(properties.values()):
+        if prop.combine:
+            for source in prop.combine:
+                properties[source[PROPERTY]].disable = True
+
+    statistics = raw[STATISTICS] or {}
+    statistics_source = _val(statistics, SOURCE)
+    statistics_sensors = {
+        sensor_key: bool(create)
+        for sensor_key, create in statistics.items()
+        if sensor_key != SOURCE
+    }
+
+    dependents: dict[str, set[str]] = defaultdict(set)
+    for key, names in depends_on.items():
+        for name in names:
+            dependents[name].add(key)
+
+    return Dictionary(
+        climate=climate,
+        properties=properties,
+        buttons=buttons,
+        presets=presets,
+        statistics_source=statistics_source,
+        statistics_sensors=statistics_sensors,
+        depends_on=depends_on,
+        dependents=dict(dependents),
+    )
+
+
+def _dependencies(
+        properties: dict[str, Property],
+        buttons: list[Button],
+        presets: dict[str, dict[str, int]],
+) -> dict[str, set[str]]:
+    """Entity key -> status properties the entity reads (see ``Dictionary.depends_on``).
+
+    Device-level entities list every property that is a candidate for one of
+    their targets; disabled properties are included, as their entities may
+    still be enabled per appliance.
+    """
+    depends_on: dict[str, set[str]] = defaultdict(set)
+    for prop in properties.values():
+        for platform in DEVICE_PLATFORM_KEYS:
+            if hasattr(prop, platform):
+                depends_on[entity_key(platform)].add(prop.name)
+        for platform in PER_PROPERTY_PLATFORM_KEYS:
+            if hasattr(prop, platform):
+                reads = depends_on[entity_key(platform, prop.name)]
+                reads.add(prop.name)
+                reads.update(source[PROPERTY] for source in prop.combine or [])
+                unit = unit_property(getattr(getattr(prop, platform), UNIT, None))
+                if unit is not None:
+                    reads.add(unit)
+    for values in presets.values():
+        depends_on[entity_key(Platform.CLIMATE)].update(values)
+    for button in buttons:
+        depends_on[entity_key(Platform.BUTTON, button.key)] = set(button.available_when)
+    return dict(depends_on)
+
+
+# Precompiled bundle of every data dictionary, written by
+# `python -m scripts.compile_dictionaries`.
+BUNDLE_FILE = "data_dictionaries.json"
+BUNDLE_VERSION = 1
+# JSON object keys are always strings, but YAML mappings also have int (and
+# bool) keys, e.g. select options. Such mappings are stored as a list of pairs.
+_PAIRS = "__pairs__"
+
+_DICTIONARY_DIR = os.path.join(os.path.dirname(__file__), "data_dictionaries")
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value):
+            return {k: _encode(v) for k, v in value.items()}
+        return {_PAIRS: [[k, _encode(v)] for k, v in value.items()]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if _PAIRS in value:
+            return {k: _decode(v) for k, v in value[_PAIRS]}
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def source_digest() -> str:
+    """SHA-256 over all data dictionary YAML files, to detect a stale bundle."""
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(_DICTIONARY_DIR)):
+        if not filename.endswith(".yaml"):
+            continue
+        digest.update(filename.encode())
+        with open(os.path.join(_DICTIONARY_DIR, filename), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def compile_bundle() -> dict[str, Any]:
+    """Resolve every data dictionary into the bundle format.
+
+    ``types`` holds each base file resolved on its own (used for feature codes
+    without a subtype file), ``dictionaries`` each ``{type}-{feature}`` file
+    resolved on top of its base. Most subtypes inherit most of their properties
+    unchanged, so property entries are stored once in ``properties`` and
+    referenced by index.
+    """
+    entries: list[Any] = []
+    index: dict[str, int] = {}
+
+    def intern(raw: dict[str, Any]) -> dict[str, Any]:
+        encoded = _encode(raw)
+        refs = []
+        for entry in encoded[PROPERTIES]:
+            entry_key = json.dumps(entry)
+            if entry_key not in index:
+                index[entry_key] = len(entries)
+                entries.append(entry)
+            refs.append(index[entry_key])
+        return {**encoded, PROPERTIES: refs}
+
+    types: dict[str, Any] = {}
+    dictionaries: dict[str, Any] = {}
+    for filename in sorted(os.listdir(_DICTIONARY_DIR)):
+        if not filename.endswith(".yaml"):
+            continue
+        key = filename.removesuffix(".yaml")
+        if "-" in key:
+            type_code, feature_code = key.split("-", 1)
+            dictionaries[key] = intern(_resolve(type_code, feature_code)[1])
+        else:
+            types[key] = intern(_resolve(key, "")[1])
+    return {
+        "version": BUNDLE_VERSION,
+        "digest": source_digest(),
+        PROPERTIES: entries,
+        "types": types,
+        "dictionaries": dictionaries,
+    }
+
+
+def _from_bundle(bundle: dict[str, Any], compiled: dict[str, Any]) -> dict[str, Any]:
+    """Raw dictionary (as returned by ``_resolve``) from a bundle entry."""
+    raw = _decode({k: v for k, v in compiled.items() if k != PROPERTIES})
+    raw[PROPERTIES] = [_decode(bundle[PROPERTIES][i]) for i in compiled[PROPERTIES]]
+    return raw
+
+
 class Dictionaries:
 
     dictionaries: dict[str, Dictionary] = {}
+    # Raw bundle contents once ``load_bundle`` found an up-to-date bundle.
+    bundle: dict[str, Any] | None = None
+
+    @classmethod
+    def load_bundle(cls) -> bool:
+        """Load the precompiled bundle; blocking, run it in the executor.
+
+        Returns whether the bundle is used. A missing, unreadable or stale bundle
+        (YAML edited without recompiling) leaves ``get_dictionary`` parsing YAML.
+        """
+        if cls.bundle is not None:
+            return True
+        try:
+            with open(os.path.join(os.path.dirname(__file__), BUNDLE_FILE), "rb") as f:
+                bundle = json.load(f)
+        except (OSError, ValueError):
+            _LOGGER.debug("No readable data dictionary bundle, using YAML", exc_info=True)
+            return False
+        if bundle.get("version") != BUNDLE_VERSION or bundle.get("digest") != source_digest():
+            _LOGGER.info("Data dictionary bundle is out of date, using YAML")
+            return False
+        cls.bundle = bundle
+        return True
 
     @classmethod
     def get_dictionary(cls, appliance: ConnectLifeAppliance) -> Dictionary:
@@ -572,76 +844,33 @@ class Dictionaries:
         if key in cls.dictionaries:
             return cls.dictionaries[key]
 
-        climate: dict | None = None
-        statistics: dict | None = None
-        raw_entries: dict[str, dict] = {}
-        raw_buttons: list[dict] = []
-
-        # TODO: Support default climate section
-        _, base_data = _load_yaml(
-            f"data_dictionaries/{appliance.device_type_code}.yaml"
-        )
-        if base_data is not None:
-            statistics = _val(base_data, STATISTICS, statistics)
-            if PROPERTIES in base_data and base_data[PROPERTIES] is not None:
-                for prop in base_data[PROPERTIES]:
-                    raw_entries[prop[PROPERTY]] = prop
-            if BUTTONS in base_data and base_data[BUTTONS] is not None:
-                raw_buttons = list(base_data[BUTTONS])
-
-        sub_found, sub_data = _load_yaml(f"data_dictionaries/{key}.yaml")
+        sub_found, raw = cls._raw_dictionary(appliance)
         if not sub_found:
             _LOGGER.warning(
                 "No data dictionary found for %s (%s)",
                 appliance.device_nickname,
                 key,
             )
-        if sub_data is not None:
-            statistics = _val(sub_data, STATISTICS, statistics)
-            if Platform.CLIMATE in sub_data:
-                climate = sub_data[Platform.CLIMATE]
-            if PROPERTIES in sub_data and sub_data[PROPERTIES] is not None:
-                for prop in sub_data[PROPERTIES]:
-                    name = prop[PROPERTY]
-                    raw_entries[name] = _merge_property(raw_entries.get(name), prop)
-            if BUTTONS in sub_data and sub_data[BUTTONS] is not None:
-                raw_buttons = _merge_buttons(raw_buttons, sub_data[BUTTONS])
-
-        properties: dict[str, Property] = defaultdict(
-            lambda: Property({PROPERTY: "default", OPTIONAL: True})
-        )
-        for name, entry in raw_entries.items():
-            properties[name] = Property(entry)
-
-        for prop in list(properties.values()):
-            if prop.combine:
-                for source in prop.combine:
-                    properties[source[PROPERTY]].disable = True
-
-        buttons = [Button(b) for b in raw_buttons]
-
-        statistics = statistics or {}
-        statistics_source = _val(statistics, SOURCE)
-        statistics_sensors = {
-            sensor_key: bool(create)
-            for sensor_key, create in statistics.items()
-            if sensor_key != SOURCE
-        }
-
-        # Parse presets into a name -> values map. The preset name is stripped
-        # from the value so it can be matched against a device status list.
-        presets = {
-            preset[PRESET]: {k: v for k, v in preset.items() if k != PRESET}
-            for preset in _val(climate or {}, PRESETS, [])
-        }
-
-        dictionary = Dictionary(
-            climate=climate,
-            properties=properties,
-            buttons=buttons,
-            presets=presets,
-            statistics_source=statistics_source,
-            statistics_sensors=statistics_sensors,
-        )
+
+        dictionary = _build(raw)
         cls.dictionaries[key] = dictionary
         return dictionary
+
+    @classmethod
+    def raw_dictionary(cls, appliance: ConnectLifeAppliance) -> dict[str, Any]:
+        """The merged, unparsed data dictionary of an appliance (for diagnostics)."""
+        return cls._raw_dictionary(appliance)[1]
+
+    @classmethod
+    def _raw_dictionary(cls, appliance: ConnectLifeAppliance) -> tuple[bool, dict[str, Any]]:
+        if cls.bundle is not None:
+            compiled = cls.bundle["dictionaries"].get(
+                f"{appliance.device_type_code}-{appliance.device_feature_code}"
+            )
+            sub_found = compiled is not None
+            if compiled is None:
+                compiled = cls.bundle["types"].get(appliance.device_type_code)
+            if compiled is not None:
+                return sub_found, _from_bundle(cls.bundle, compiled)
+            return sub_found, _resolve(appliance.device_type_code, appliance.device_feature_code)[1]
+        return _resolve(appliance.device_type_code, appliance.device_feature_code)
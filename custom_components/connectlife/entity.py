@@ -15,16 +15,29 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from connectlife.appliance import ConnectLifeAppliance
 
 from .const import (
+    BEEP_PROPERTY,
     CONF_DEVICES,
     CONF_DISABLE_BEEP,
     CONF_EXPOSE_OFFLINE_STATE,
     DOMAIN,
     SW_VERSION_PROPERTY,
 )
-from .coordinator import ConnectLifeCoordinator
+from .coordinator import ConnectLifeCoordinator, DeviceSubscription
 
 _LOGGER = logging.getLogger(__name__)
 DISABLE_BEEP_FAILURE_THRESHOLD = 3
+# Instance attributes holding entity state. Home Assistant stores cached
+# properties under a "__attr_" prefix.
+_STATE_ATTR_PREFIXES = ("_attr_", "__attr_")
+
+
+def _snapshot(value):
+    """Copy mutable containers so later in-place changes are detected."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
 
 
 class ConnectLifeEntity(CoordinatorEntity[ConnectLifeCoordinator]):
@@ -37,6 +50,7 @@ class ConnectLifeEntity(CoordinatorEntity[ConnectLifeCoordinator]):
     _expose_offline_state = False
     _unavailable_status: str | None = None
     _unavailable_value: int | None = None
+    _written_fingerprint: tuple | None = None
 
     def __init__(
             self,
@@ -45,7 +59,8 @@ class ConnectLifeEntity(CoordinatorEntity[ConnectLifeCoordinator]):
             entity_name: str,
             platform: Platform):
         """Initialize the entity."""
-        super().__init__(coordinator)
+        self._subscription = DeviceSubscription(appliance.device_id)
+        super().__init__(coordinator, self._subscription)
         self.device_id = appliance.device_id
         self.nickname = appliance.device_nickname
         self._attr_unique_id = f'{appliance.device_id}-{entity_name}'
@@ -101,6 +116,23 @@ class ConnectLifeEntity(CoordinatorEntity[ConnectLifeCoordinator]):
         status_list = self.coordinator.data[self.device_id].status_list
         return status_list.get(self._unavailable_status) == self._unavailable_value
 
+    def watch(self, *properties: str) -> None:
+        """Only refresh this entity when one of these status properties changes.
+
+        Entities that never call this are refreshed on any change on their
+        device. Calling it without arguments limits refreshes to device-level
+        changes (availability).
+        """
+        self._subscription.watch(*properties)
+
+    def follow(self, key: str, *properties: str) -> None:
+        """Only refresh this entity when a status property it reads changes.
+
+        The properties are those the data dictionary's dependency graph lists
+        for the entity ``key`` (see ``entity_key``), plus ``properties``.
+        """
+        self._subscription.follow(key, *properties)
+
     @callback
     @abstractmethod
     def update_state(self):
@@ -112,18 +144,42 @@ class ConnectLifeEntity(CoordinatorEntity[ConnectLifeCoordinator]):
         if not self._is_value_unavailable():
             self.update_state()
 
+    def _state_fingerprint(self) -> tuple:
+        """Everything the written state is rendered from: availability, the
+        entity description and the ``_attr_`` values set by ``update_state``."""
+        return (
+            self.available,
+            self.entity_description if hasattr(self, "entity_description") else None,
+            [
+                (name, _snapshot(value))
+                for name, value in vars(self).items()
+                if name.startswith(_STATE_ATTR_PREFIXES)
+            ],
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, remembering what it was rendered from."""
+        self._written_fingerprint = self._state_fingerprint()
+        super().async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator, writing only if the state changed."""
         self._refresh_state()
-        self.async_write_ha_state()
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_fingerprint:
+            self.coordinator.writes_suppressed += 1
+            return
+        self._written_fingerprint = fingerprint
+        super().async_write_ha_state()
 
     async def async_update_device(self, command: dict[str, int], properties: dict[str, int] | None = None):
         if properties is None:
             properties = command.copy()
         try:
             if self._disable_beep:
-                command["t_beep"] = 0
+                command[BEEP_PROPERTY] = 0
                 try:
                     await self.coordinator.async_update_device(self.device_id, command, properties)
                     self._disable_beep_failure_count = 0
@@ -138,7 +194,7 @@ class ConnectLifeEntity(CoordinatorEntity[ConnectLifeCoordinator]):
                         self.nickname,
                         err,
                     )
-                    command.pop("t_beep", None)
+                    command.pop(BEEP_PROPERTY, None)
                     try:
                         await self.coordinator.async_update_device(self.device_id, command, properties)
                     except LifeConnectError:
@@ -0,0 +1,82 @@
+"""Which entities to create for an appliance, computed once and shared by all platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from connectlife.appliance import ConnectLifeAppliance
+from homeassistant.const import Platform
+
+from .const import SW_VERSION_PROPERTY
+from .dictionaries import DEVICE_PLATFORM_KEYS, PER_PROPERTY_PLATFORM_KEYS, Dictionary
+from .statistics_sources import StatisticsSensorDef, enabled_sensors
+from .utils import climate_target_bindings, has_platform
+
+
+@dataclass
+class EntityPlan:
+    """Platform assignment for the properties of one appliance.
+
+    ``properties`` maps each per-property platform to the status properties
+    it creates entities for (``status_list`` order). Properties bound to a
+    climate target are left out, since the climate entity exposes them.
+    """
+
+    dictionary: Dictionary
+    # Climate target -> property serving it (see utils.climate_target_bindings).
+    climate_bindings: dict[str, str]
+    properties: dict[Platform, list[str]] = field(default_factory=dict)
+    # Sensors combining other properties, not themselves in the status list.
+    combine_sensors: list[str] = field(default_factory=list)
+    statistics_sensors: list[StatisticsSensorDef] = field(default_factory=list)
+    # Device-level platforms (climate / humidifier / water_heater) with at least
+    # one property in the data dictionary.
+    device_platforms: set[Platform] = field(default_factory=set)
+
+    def properties_for(self, platform: Platform) -> list[str]:
+        """Status properties to create ``platform`` entities for."""
+        return self.properties.get(platform, [])
+
+
+def build_entity_plan(
+    appliance: ConnectLifeAppliance,
+    dictionary: Dictionary,
+    overrides: Mapping[str, str] | None = None,
+) -> EntityPlan:
+    """Assign the appliance's properties to platforms in one pass."""
+    climate_bindings = climate_target_bindings(appliance, dictionary, overrides)
+    climate_bound = set(climate_bindings.values())
+    plan = EntityPlan(
+        dictionary=dictionary,
+        climate_bindings=climate_bindings,
+        statistics_sensors=enabled_sensors(
+            dictionary.statistics_source, dictionary.statistics_sensors
+        ),
+    )
+
+    for status in appliance.status_list:
+        # Unknown properties resolve to the dictionary's default sensor.
+        prop = dictionary.properties[status]
+        if status in climate_bound:
+            continue
+        platform = next(
+            (p for p in PER_PROPERTY_PLATFORM_KEYS if has_platform(p, prop)), None
+        )
+        if platform is None or (platform == Platform.SENSOR and status == SW_VERSION_PROPERTY):
+            continue
+        plan.properties.setdefault(platform, []).append(status)
+
+    for name, prop in dictionary.properties.items():
+        for platform in DEVICE_PLATFORM_KEYS:
+            if has_platform(platform, prop):
+                plan.device_platforms.add(platform)
+        if (
+            prop.combine
+            and name not in appliance.status_list
+            and has_platform(Platform.SENSOR, prop)
+            and any(src["property"] in appliance.status_list for src in prop.combine)
+        ):
+            plan.combine_sensors.append(name)
+
+    return plan
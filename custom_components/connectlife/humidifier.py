@@ -20,7 +20,7 @@ from .const import (
     TARGET_HUMIDITY,
 )
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Dictionary
+from .dictionaries import Dictionary
 from .entity import ConnectLifeEntity
 from .utils import has_platform
 from connectlife.appliance import ConnectLifeAppliance
@@ -35,12 +35,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    entities = []
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        if is_humidifier(dictionary):
-            entities.append(ConnectLifeHumidifier(coordinator, appliance, dictionary))
-    async_add_entities(entities)
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        if Platform.HUMIDIFIER in plan.device_platforms:
+            yield ConnectLifeHumidifier(coordinator, appliance, plan.dictionary)
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 def is_humidifier(dictionary: Dictionary):
@@ -97,6 +98,7 @@ class ConnectLifeHumidifier(ConnectLifeEntity, HumidifierEntity):
                         self.target_map[target], dd_entry.name, target, self.nickname, dd_entry.name,
                     )
                 self.target_map[target] = dd_entry.name
+        self.watch(*self.target_map.values())
 
         for target, status in self.target_map.items():
             if target == ACTION:
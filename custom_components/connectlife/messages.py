@@ -11,19 +11,35 @@ NETWORK_ERROR_MARKERS = (
 )
 
 
-def format_retry_message(error: Exception) -> str:
-    """Return a short retry message for Home Assistant UI surfaces."""
+ERROR_TIMEOUT = "timeout"
+ERROR_GATEWAY = "gateway"
+ERROR_NETWORK = "network"
+ERROR_OTHER = "other"
+
+_RETRY_MESSAGES = {
+    ERROR_TIMEOUT: "ConnectLife request timed out. The integration will retry automatically.",
+    ERROR_GATEWAY: (
+        "ConnectLife gateway rejected the request. "
+        "The integration will retry automatically."
+    ),
+    ERROR_NETWORK: "Could not reach ConnectLife. The integration will retry automatically.",
+    ERROR_OTHER: "ConnectLife request failed. The integration will retry automatically.",
+}
+
+
+def error_category(error: Exception) -> str:
+    """Return which of the retry messages applies to ``error``."""
     message = str(error)
 
     if isinstance(error, TimeoutError):
-        return (
-            "ConnectLife request timed out. The integration will retry automatically."
-        )
+        return ERROR_TIMEOUT
     if message.startswith(GATEWAY_ERROR_PREFIX):
-        return (
-            "ConnectLife gateway rejected the request. "
-            "The integration will retry automatically."
-        )
+        return ERROR_GATEWAY
     if any(marker in message for marker in NETWORK_ERROR_MARKERS):
-        return "Could not reach ConnectLife. The integration will retry automatically."
-    return "ConnectLife request failed. The integration will retry automatically."
+        return ERROR_NETWORK
+    return ERROR_OTHER
+
+
+def format_retry_message(error: Exception) -> str:
+    """Return a short retry message for Home Assistant UI surfaces."""
+    return _RETRY_MESSAGES[error_category(error)]
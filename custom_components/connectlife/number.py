@@ -9,10 +9,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Dictionary, Property
+from .decoders import MISSING, value_decoder
+from .dictionaries import Dictionary, Property, entity_key, unit_property
 from .entity import ConnectLifeEntity
 from connectlife.appliance import ConnectLifeAppliance
-from .utils import climate_bound_properties, device_target_overrides, has_platform, to_unit
+from .utils import PropertyUnit, to_unit
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,22 +25,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife number entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        overrides = device_target_overrides(config_entry, appliance.device_id)
-        climate_bound = climate_bound_properties(appliance, dictionary, overrides)
-        async_add_entities(
-            ConnectLifeNumberEntity(
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        for s in plan.properties_for(Platform.NUMBER):
+            yield ConnectLifeNumberEntity(
                 coordinator,
                 appliance,
                 s,
-                dictionary.properties[s],
-                dictionary,
+                plan.dictionary.properties[s],
+                plan.dictionary,
             )
-            for s in appliance.status_list
-            if has_platform(Platform.NUMBER, dictionary.properties[s])
-            and s not in climate_bound
-        )
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 class ConnectLifeNumberEntity(ConnectLifeEntity, NumberEntity):
@@ -60,6 +58,12 @@ class ConnectLifeNumberEntity(ConnectLifeEntity, NumberEntity):
         self.status = status
         self._unavailable_status = status
         self._unavailable_value = dd_entry.unavailable
+        self.follow(entity_key(Platform.NUMBER, status), status)
+        # Set when the unit is read from another property (see update_state).
+        unit_source = unit_property(dd_entry.number.unit)
+        self.property_unit = (
+            PropertyUnit(unit_source, appliance, dictionary) if unit_source is not None else None
+        )
         self.command_name = (
             dd_entry.number.command_name if dd_entry.number.command_name else status
         )
@@ -73,18 +77,29 @@ class ConnectLifeNumberEntity(ConnectLifeEntity, NumberEntity):
             name=status.replace("_", " "),
             native_max_value=dd_entry.number.max_value,  # type: ignore[arg-type]
             native_min_value=dd_entry.number.min_value,  # type: ignore[arg-type]
-            native_unit_of_measurement=to_unit(
-                dd_entry.number.unit, appliance=appliance, dictionary=dictionary
+            native_unit_of_measurement=(
+                self.property_unit.resolved
+                if self.property_unit is not None
+                else to_unit(dd_entry.number.unit, appliance=appliance, dictionary=dictionary)
             ),
             translation_key=self.to_translation_key(dd_entry.translation_key or status),
             entity_category=dd_entry.entity_category,
         )
+        self._decode = value_decoder(status)
         self._refresh_state()
 
     @callback
     def update_state(self):
-        if self.status in self.coordinator.data[self.device_id].status_list:
-            value = self.coordinator.data[self.device_id].status_list[self.status]
+        appliance = self.coordinator.data[self.device_id]
+        if self.property_unit is not None and self.property_unit.update(appliance):
+            # With device class temperature, Home Assistant converts the value
+            # and its min/max to the configured unit, so the state keeps its unit.
+            _LOGGER.debug(
+                "Unit of %s on %s changed to %s", self.status, self.nickname, self.property_unit.resolved
+            )
+            self._attr_native_unit_of_measurement = self.property_unit.resolved
+        value = self._decode(appliance.status_list)
+        if value is not MISSING:
             self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
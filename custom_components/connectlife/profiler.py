@@ -0,0 +1,100 @@
+"""On-demand profile of the integration, for the connectlife.profile service.
+
+cProfile runs in the event loop thread for the requested time (or number of
+polls) and the result is cut down to the functions of this integration:
+coordinator refreshes, entity ``update_state``, data dictionary lookups and
+command sends, each with the time spent in what they call. The pstats file
+opens in snakeviz, flameprof or gprof2dot; a text summary is written next to it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+from collections.abc import Callable
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+INTEGRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DURATION = 60
+MAX_DURATION = 600
+MAX_POLLS = 100
+# How often the poll count is checked while profiling a number of polls.
+POLL_CHECK_INTERVAL = 1.0
+SUMMARY_LINES = 50
+
+_Key = tuple[str, int, str]
+
+
+def _integration_stats(profile: cProfile.Profile) -> pstats.Stats:
+    """Stats of the profile restricted to functions of this integration."""
+    stats = pstats.Stats(profile)
+    raw: dict[_Key, tuple] = stats.stats  # type: ignore[attr-defined]
+    kept = {key for key in raw if key[0].startswith(INTEGRATION_DIR)}
+    stats.stats = {  # type: ignore[attr-defined]
+        key: (*raw[key][:4], {caller: value for caller, value in raw[key][4].items() if caller in kept})
+        for key in kept
+    }
+    stats.total_tt = sum(raw[key][2] for key in kept)  # type: ignore[attr-defined]
+    return stats
+
+
+def _write(profile: cProfile.Profile, path: str) -> None:
+    stats = _integration_stats(profile)
+    stats.dump_stats(path)
+    summary = io.StringIO()
+    stats.stream = summary  # type: ignore[attr-defined]
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+    with open(f"{path.removesuffix('.prof')}.txt", "w", encoding="utf-8") as file:
+        file.write(summary.getvalue())
+
+
+async def async_profile(
+        hass: HomeAssistant,
+        duration: float,
+        polls: int | None = None,
+        polls_done: Callable[[], int] | None = None,
+) -> str:
+    """Profile for ``duration`` seconds, or until ``polls`` more polls are done.
+
+    ``duration`` bounds the profile in both cases. Returns the path of the
+    pstats file in the config directory.
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as err:
+        # Another profiler (e.g. the profiler integration) is running.
+        raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+    start = time.monotonic()
+    try:
+        if polls is None or polls_done is None:
+            await asyncio.sleep(duration)
+        else:
+            target = polls_done() + polls
+            while polls_done() < target and time.monotonic() - start < duration:
+                await asyncio.sleep(POLL_CHECK_INTERVAL)
+    finally:
+        profile.disable()
+    elapsed = time.monotonic() - start
+
+    path = hass.config.path(f"connectlife_profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.prof")
+    await hass.async_add_executor_job(_write, profile, path)
+    _LOGGER.info("Wrote ConnectLife profile of %.0f seconds to %s", elapsed, path)
+    persistent_notification.async_create(
+        hass,
+        f"Wrote the profile of {elapsed:.0f} seconds to {path}",
+        title="ConnectLife profile",
+        notification_id=f"connectlife_profile_{os.path.basename(path)}",
+    )
+    return path
@@ -0,0 +1,190 @@
+"""Adaptive polling for the ConnectLife appliance coordinator.
+
+The gateway returns every appliance of the account in a single request, so the
+account is polled as a whole: each device asks for an interval based on what it
+is doing (just commanded, changing, idle, offline), the shortest request wins,
+and a sliding one-hour budget caps the number of polls per account.
+
+When polls fail, the activity-based interval is replaced by a backoff: one
+quick recovery probe, then exponentially growing delays, each with random
+jitter so many installations do not retry in lockstep. A successful poll
+resets it.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from connectlife.appliance import ConnectLifeAppliance
+from homeassistant.util import dt as dt_util
+
+DEFAULT_POLL_BUDGET = 240
+BUDGET_WINDOW = 3600.0
+
+STATE_COMMAND = "command"
+STATE_ACTIVE = "active"
+STATE_DEFAULT = "default"
+STATE_IDLE = "idle"
+STATE_OFFLINE = "offline"
+
+POLL_INTERVALS = {
+    STATE_COMMAND: timedelta(seconds=10),
+    STATE_ACTIVE: timedelta(seconds=30),
+    STATE_DEFAULT: timedelta(seconds=60),
+    STATE_IDLE: timedelta(minutes=2),
+    STATE_OFFLINE: timedelta(minutes=5),
+}
+
+# How long a device stays in a state after the triggering event.
+COMMAND_WINDOW = 60.0
+ACTIVE_WINDOW = 300.0
+# A device whose status has not changed for this long is idle.
+IDLE_AFTER = 1800.0
+
+# Delay before retrying after the first failed poll.
+RECOVERY_PROBE_DELAY = 10.0
+# Delay after the second consecutive failure, doubled for each further one.
+BACKOFF_BASE = 60.0
+BACKOFF_MAX = 1800.0
+# Each delay is drawn from [(1 - BACKOFF_JITTER) * delay, delay].
+BACKOFF_JITTER = 0.5
+
+
+@dataclass
+class DeviceActivity:
+    """What the scheduler knows about one appliance (monotonic timestamps)."""
+
+    first_seen: float
+    last_change: float | None = None
+    last_command: float | None = None
+    offline: bool = False
+
+
+class PollScheduler:
+    """Pick the next poll interval from per-device activity and the poll budget."""
+
+    def __init__(
+            self,
+            budget: int = DEFAULT_POLL_BUDGET,
+            clock: Callable[[], float] = time.monotonic,
+            rng: random.Random | None = None,
+    ):
+        self.budget = budget
+        self._clock = clock
+        self._random = rng or random.Random()
+        self._devices: dict[str, DeviceActivity] = {}
+        self._polls: deque[float] = deque()
+        self.failures = 0
+        self._retry_at: float | None = None
+
+    def record_poll(self) -> None:
+        """Count a poll against the budget."""
+        self._polls.append(self._clock())
+
+    def record_success(self) -> None:
+        """End any backoff after a poll that reached the cloud."""
+        self.failures = 0
+        self._retry_at = None
+
+    def record_failure(self) -> None:
+        """Back off after a failed poll: a quick probe first, then exponentially."""
+        self.failures += 1
+        if self.failures == 1:
+            delay = RECOVERY_PROBE_DELAY
+        else:
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failures - 2))
+        delay *= self._random.uniform(1 - BACKOFF_JITTER, 1)
+        self._retry_at = self._clock() + delay
+
+    def record_changes(
+            self,
+            data: Mapping[str, ConnectLifeAppliance],
+            changes: Mapping[str, Any] | None,
+    ) -> None:
+        """Update device activity from a successful poll.
+
+        ``changes`` is the output of ``coordinator.changed_properties``; ``None``
+        (first poll) records no change so devices start in the default state.
+        """
+        now = self._clock()
+        for device_id in self._devices.keys() - data.keys():
+            del self._devices[device_id]
+        for device_id, appliance in data.items():
+            activity = self._devices.get(device_id)
+            if activity is None:
+                activity = self._devices[device_id] = DeviceActivity(first_seen=now)
+            elif changes is not None and device_id in changes:
+                activity.last_change = now
+            activity.offline = appliance.offline_state != 1
+
+    def record_command(self, device_id: str) -> None:
+        """Poll faster for a while so the device's response shows up quickly."""
+        if device_id not in self._devices:
+            self._devices[device_id] = DeviceActivity(first_seen=self._clock())
+        self._devices[device_id].last_command = self._clock()
+
+    def device_state(self, device_id: str) -> str:
+        """Polling state of a device, a key of ``POLL_INTERVALS``."""
+        activity = self._devices.get(device_id)
+        if activity is None:
+            return STATE_DEFAULT
+        now = self._clock()
+        if activity.last_command is not None and now - activity.last_command < COMMAND_WINDOW:
+            return STATE_COMMAND
+        if activity.offline:
+            return STATE_OFFLINE
+        if activity.last_change is not None and now - activity.last_change < ACTIVE_WINDOW:
+            return STATE_ACTIVE
+        if now - (activity.last_change or activity.first_seen) >= IDLE_AFTER:
+            return STATE_IDLE
+        return STATE_DEFAULT
+
+    def next_interval(self) -> timedelta:
+        """Shortest interval any device asks for (or the backoff after failed
+        polls), deferred to stay within budget."""
+        now = self._clock()
+        if self._retry_at is not None:
+            interval = timedelta(seconds=max(0.0, self._retry_at - now))
+        else:
+            interval = min(
+                (POLL_INTERVALS[self.device_state(d)] for d in self._devices),
+                default=POLL_INTERVALS[STATE_DEFAULT],
+            )
+        while self._polls and self._polls[0] <= now - BUDGET_WINDOW:
+            self._polls.popleft()
+        if self.budget > 0 and len(self._polls) >= self.budget:
+            # The next poll must wait until the oldest poll that would exceed
+            # the budget has left the window.
+            available_at = self._polls[-self.budget] + BUDGET_WINDOW
+            interval = max(interval, timedelta(seconds=available_at - now))
+        return interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Scheduler state for diagnostics."""
+        interval = self.next_interval()
+        return {
+            "interval": interval.total_seconds(),
+            "budget": self.budget,
+            "polls_last_hour": len(self._polls),
+            "consecutive_failures": self.failures,
+            "next_attempt": (
+                (dt_util.utcnow() + interval).isoformat() if self.failures else None
+            ),
+            "devices": {
+                device_id: self.device_as_dict(device_id) for device_id in self._devices
+            },
+        }
+
+    def device_as_dict(self, device_id: str) -> dict[str, Any]:
+        """Polling state and the interval it asks for, for one device."""
+        state = self.device_state(device_id)
+        return {
+            "state": state,
+            "interval": POLL_INTERVALS[state].total_seconds(),
+        }
@@ -10,10 +10,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Property
+from .decoders import MISSING, select_decoder
+from .dictionaries import Property
 from .entity import ConnectLifeEntity
 from connectlife.appliance import ConnectLifeAppliance
-from .utils import climate_bound_properties, device_target_overrides, has_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +25,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife selectors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        overrides = device_target_overrides(config_entry, appliance.device_id)
-        climate_bound = climate_bound_properties(appliance, dictionary, overrides)
-        async_add_entities(
-            ConnectLifeSelect(
-                coordinator, appliance, s, dictionary.properties[s]
-            )
-            for s in appliance.status_list
-            if has_platform(Platform.SELECT, dictionary.properties[s])
-            and s not in climate_bound
-        )
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        for s in plan.properties_for(Platform.SELECT):
+            yield ConnectLifeSelect(coordinator, appliance, s, plan.dictionary.properties[s])
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 class ConnectLifeSelect(ConnectLifeEntity, SelectEntity):
@@ -56,6 +51,7 @@ class ConnectLifeSelect(ConnectLifeEntity, SelectEntity):
         self.status = status
         self._unavailable_status = status
         self._unavailable_value = dd_entry.unavailable
+        self.watch(status)
         # Copy: unmapped values are added per-entity, avoid leaking to other appliances.
         self.options_map = dict(dd_entry.select.options)
         self.reverse_options_map = {v: k for k, v in self.options_map.items()}
@@ -74,32 +70,32 @@ class ConnectLifeSelect(ConnectLifeEntity, SelectEntity):
             translation_key=self.to_translation_key(dd_entry.translation_key or status),
             entity_category=dd_entry.entity_category,
         )
+        self._decode = select_decoder(
+            status, self.options_map, self._unexpected_option, self.unknown_value
+        )
         self._refresh_state()
 
     @callback
     def update_state(self):
-        if self.status in self.coordinator.data[self.device_id].status_list:
-            value = self.coordinator.data[self.device_id].status_list[self.status]
-            if value == self.unknown_value:
-                self._attr_current_option = None
-                return
-            if value in self.options_map:
-                value = self.options_map[value]
-            else:
-                str_value = str(value)
-                if str_value not in self._attr_options:
-                    _LOGGER.warning(
-                        "Got unexpected value %s for %s (%s)",
-                        str_value,
-                        self.status,
-                        self.nickname,
-                    )
-                    self.options_map[value] = str_value
-                    self.reverse_options_map[str_value] = value
-                    self._attr_options = [*self._attr_options, str_value]
-                value = str_value
+        value = self._decode(self.coordinator.data[self.device_id].status_list)
+        if value is not MISSING:
             self._attr_current_option = value
 
+    def _unexpected_option(self, value) -> str:
+        """Show a value missing from the options as is, adding it as an option."""
+        str_value = str(value)
+        if str_value not in self._attr_options:
+            _LOGGER.warning(
+                "Got unexpected value %s for %s (%s)",
+                str_value,
+                self.status,
+                self.nickname,
+            )
+            self.options_map[value] = str_value
+            self.reverse_options_map[str_value] = value
+            self._attr_options = [*self._attr_options, str_value]
+        return str_value
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         await self.async_update_device(
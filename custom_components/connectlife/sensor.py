@@ -2,33 +2,38 @@
 
 import datetime
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 import voluptuous as vol
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import PERCENTAGE, EntityCategory, Platform, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    DOMAIN,
-    SW_VERSION_PROPERTY,
-)
+from .const import DOMAIN
 from .coordinator import ConnectLifeCoordinator, ConnectLifeStatisticsCoordinator
-from .dictionaries import Dictionaries, Dictionary, Property
+from .decoders import MISSING, combine_decoder, enum_decoder, value_decoder
+from .dictionaries import Dictionary, Property, entity_key, unit_property
 from .entity import ConnectLifeEntity
-from .statistics_sources import StatisticsSensorDef, enabled_sensors
+from .statistics_sources import StatisticsSensorDef
 from connectlife.appliance import ConnectLifeAppliance, MAX_DATETIME
-from .utils import climate_bound_properties, device_target_overrides, has_platform, to_unit
+from .utils import PropertyUnit, to_unit
 
 SERVICE_SET_VALUE = "set_value"
+# How often the diagnostic sensors re-read their metric between polls.
+DIAGNOSTIC_REFRESH_INTERVAL = datetime.timedelta(seconds=30)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,41 +46,26 @@ async def async_setup_entry(
     """Set up ConnectLife sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     statistics_coordinator = hass.data[DOMAIN].get(f"{config_entry.entry_id}_statistics")
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        overrides = device_target_overrides(config_entry, appliance.device_id)
-        climate_bound = climate_bound_properties(appliance, dictionary, overrides)
-        async_add_entities(
-            ConnectLifeStatusSensor(
-                coordinator, appliance, s, dictionary.properties[s], dictionary
-            )
-            for s in appliance.status_list
-            if s != SW_VERSION_PROPERTY
-            and has_platform(Platform.SENSOR, dictionary.properties[s])
-            and s not in climate_bound
-        )
-        async_add_entities(
-            ConnectLifeStatusSensor(
-                coordinator, appliance, name, prop, dictionary
-            )
-            for name, prop in dictionary.properties.items()
-            if prop.combine
-            and name not in appliance.status_list
-            and has_platform(Platform.SENSOR, prop)
-            and any(
-                src["property"] in appliance.status_list
-                for src in prop.combine
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        dictionary = plan.dictionary
+        for name in (*plan.properties_for(Platform.SENSOR), *plan.combine_sensors):
+            yield ConnectLifeStatusSensor(
+                coordinator, appliance, name, dictionary.properties[name], dictionary
             )
-        )
-    if statistics_coordinator is not None:
-        for appliance in coordinator.data.values():
-            dictionary = Dictionaries.get_dictionary(appliance)
-            async_add_entities(
-                ConnectLifeStatisticsSensor(coordinator, statistics_coordinator, appliance, sensor)
-                for sensor in enabled_sensors(
-                    dictionary.statistics_source, dictionary.statistics_sensors
+        if statistics_coordinator is not None:
+            for sensor in plan.statistics_sensors:
+                yield ConnectLifeStatisticsSensor(
+                    coordinator, statistics_coordinator, appliance, sensor
                 )
-            )
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
+    async_add_entities(
+        ConnectLifeDiagnosticSensor(coordinator, statistics_coordinator, config_entry, description)
+        for description in DIAGNOSTIC_SENSORS
+        if statistics_coordinator is not None or not description.statistics
+    )
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
@@ -105,6 +95,12 @@ class ConnectLifeStatusSensor(ConnectLifeEntity, SensorEntity):
         self.read_only = True if self.combine else dd_entry.sensor.read_only
         self.multiplier = dd_entry.sensor.multiplier
         self.unknown_value = dd_entry.sensor.unknown_value
+        self.follow(entity_key(Platform.SENSOR, status), status)
+        # Set when the unit is read from another property (see update_state).
+        unit_source = unit_property(dd_entry.sensor.unit)
+        self.property_unit = (
+            PropertyUnit(unit_source, appliance, dictionary) if unit_source is not None else None
+        )
 
         device_class = dd_entry.sensor.device_class
         self.options_map: dict[int, str] | None = None
@@ -125,62 +121,54 @@ class ConnectLifeStatusSensor(ConnectLifeEntity, SensorEntity):
             entity_registry_enabled_default=not dd_entry.optional,
             icon=dd_entry.icon,
             name=status.replace("_", " "),
-            native_unit_of_measurement=to_unit(
-                dd_entry.sensor.unit, appliance=appliance, dictionary=dictionary
+            native_unit_of_measurement=(
+                self.property_unit.resolved
+                if self.property_unit is not None
+                else to_unit(dd_entry.sensor.unit, appliance=appliance, dictionary=dictionary)
             ),
             state_class=state_class,
             translation_key=self.to_translation_key(dd_entry.translation_key or status),
             entity_category=dd_entry.entity_category,
         )
+        if self.options_map is not None:
+            self._decode = enum_decoder(
+                status, self.options_map, self._unexpected_option, self.unknown_value, self.multiplier
+            )
+        else:
+            self._decode = value_decoder(status, self.unknown_value, self.multiplier)
+        if self.combine:
+            self._decode = combine_decoder(
+                status, self.combine, self._decode, self.unknown_value, self.multiplier
+            )
         self._refresh_state()
 
     @callback
     def update_state(self):
-        status_list = self.coordinator.data[self.device_id].status_list
-        if self.combine:
-            value = 0.0
-            has_sources = False
-            for source in self.combine:
-                src_value = status_list.get(source["property"])
-                if src_value is not None and isinstance(src_value, (int, float)):
-                    if "unknown_value" in source and src_value == source["unknown_value"]:
-                        continue
-                    value += src_value * source.get("multiplier", 1)
-                    has_sources = True
-            if has_sources:
-                if value == self.unknown_value:
-                    self._attr_native_value = None
-                else:
-                    if self.multiplier is not None:
-                        value *= self.multiplier
-                    self._attr_native_value = value
-                return
-            elif self.status not in status_list:
-                self._attr_native_value = None
-                return
-        if self.status in status_list:
-            value = status_list[self.status]
-            if self.device_class == SensorDeviceClass.ENUM and self.options_map is not None:
-                if value in self.options_map:
-                    value = self.options_map[value]
-                elif value != self.unknown_value:
-                    str_value = str(value)
-                    if self._attr_options is not None and str_value not in self._attr_options:
-                        _LOGGER.warning(
-                            "Got unexpected value %s for %s (%s)",
-                            str_value,
-                            self.status,
-                            self.nickname,
-                        )
-                        self.options_map[value] = str_value
-                        self._attr_options = [*self._attr_options, str_value]
-                    value = str_value
-            if value == self.unknown_value:
-                self._attr_native_value = None
-            else:
-                if self.multiplier is not None and value is not None:
-                    value *= self.multiplier  # type: ignore[operator]
-                self._attr_native_value = value
+        appliance = self.coordinator.data[self.device_id]
+        if self.property_unit is not None and self.property_unit.update(appliance):
+            # Temperatures are converted to the configured unit by Home Assistant,
+            # so the state and its statistics keep their unit across the switch.
+            _LOGGER.debug(
+                "Unit of %s on %s changed to %s", self.status, self.nickname, self.property_unit.resolved
+            )
+            self._attr_native_unit_of_measurement = self.property_unit.resolved
+        value = self._decode(appliance.status_list)
+        if value is not MISSING:
+            self._attr_native_value = value
+
+    def _unexpected_option(self, value) -> str:
+        """Show a value missing from the enum options as is, adding it as an option."""
+        str_value = str(value)
+        if self._attr_options is not None and str_value not in self._attr_options:
+            _LOGGER.warning(
+                "Got unexpected value %s for %s (%s)",
+                str_value,
+                self.status,
+                self.nickname,
+            )
+            self.options_map[value] = str_value  # type: ignore[index]
+            self._attr_options = [*self._attr_options, str_value]
+        return str_value
 
     async def async_set_value(self, value: int) -> None:
         """Set value for this sensor."""
@@ -251,3 +239,130 @@ class ConnectLifeStatisticsSensor(CoordinatorEntity[ConnectLifeStatisticsCoordin
         """Extract this sensor's datapoint from the fetched statistics result."""
         result = self.coordinator.data.get(self._device_id) if self.coordinator.data else None
         self._attr_native_value = self._sensor.value(result) if result is not None else None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ConnectLifeDiagnosticSensorDescription(SensorEntityDescription):
+    """Health metric of the integration itself."""
+
+    value: Callable[[ConnectLifeCoordinator, ConnectLifeStatisticsCoordinator | None], StateType]
+    # Only created when the entry fetches statistics.
+    statistics: bool = False
+
+
+DIAGNOSTIC_SENSORS: tuple[ConnectLifeDiagnosticSensorDescription, ...] = (
+    ConnectLifeDiagnosticSensorDescription(
+        key="last_poll_duration",
+        translation_key="last_poll_duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator, _: coordinator.last_poll_duration,
+    ),
+    ConnectLifeDiagnosticSensorDescription(
+        key="poll_success_rate",
+        translation_key="poll_success_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator, _: coordinator.poll_success_rate,
+    ),
+    ConnectLifeDiagnosticSensorDescription(
+        key="api_calls_per_minute",
+        translation_key="api_calls_per_minute",
+        native_unit_of_measurement="calls/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator, _: (
+            coordinator.guard.stats.calls_per_minute() if coordinator.guard is not None else None
+        ),
+    ),
+    ConnectLifeDiagnosticSensorDescription(
+        key="queued_commands",
+        translation_key="queued_commands",
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator, _: coordinator.commands_queued,
+    ),
+    ConnectLifeDiagnosticSensorDescription(
+        key="median_command_latency",
+        translation_key="median_command_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator, _: coordinator.median_command_latency,
+    ),
+    ConnectLifeDiagnosticSensorDescription(
+        key="statistics_cycle_duration",
+        translation_key="statistics_cycle_duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda _, statistics: statistics.last_cycle_duration if statistics is not None else None,
+        statistics=True,
+    ),
+)
+
+
+class ConnectLifeDiagnosticSensor(CoordinatorEntity[ConnectLifeCoordinator], SensorEntity):
+    """Poll, command and API metrics of a config entry, disabled by default.
+
+    The sensors belong to a service device for the account and are updated
+    whenever the appliance coordinator notifies its listeners, and every
+    ``DIAGNOSTIC_REFRESH_INTERVAL`` for metrics such as queued commands and
+    API calls that change between polls.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: ConnectLifeDiagnosticSensorDescription
+
+    def __init__(
+        self,
+        coordinator: ConnectLifeCoordinator,
+        statistics_coordinator: ConnectLifeStatisticsCoordinator | None,
+        entry: ConfigEntry,
+        description: ConnectLifeDiagnosticSensorDescription,
+    ):
+        """Initialize the diagnostic sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._statistics_coordinator = statistics_coordinator
+        self._attr_unique_id = f"{entry.entry_id}-{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="ConnectLife",
+            name=entry.title,
+        )
+        coordinator.add_entity(self._attr_unique_id, Platform.SENSOR)
+        self._update_native_value()
+
+    @property
+    def available(self) -> bool:
+        # Most useful while polls fail, so not tied to the last update's success.
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Also refresh periodically once added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_refresh, DIAGNOSTIC_REFRESH_INTERVAL)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_refresh(self, _now: datetime.datetime) -> None:
+        """Re-read the metric, writing the state only if it changed."""
+        previous = self._attr_native_value
+        self._update_native_value()
+        if self._attr_native_value != previous:
+            self.async_write_ha_state()
+
+    def _update_native_value(self) -> None:
+        self._attr_native_value = self.entity_description.value(
+            self.coordinator, self._statistics_coordinator
+        )
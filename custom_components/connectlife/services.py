@@ -2,84 +2,133 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.device_registry as dr
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util.json import JsonObjectType
 
 from connectlife.api import LifeConnectError
 
 from .coordinator import ConnectLifeCoordinator
 from .const import DOMAIN
+from .profiler import DEFAULT_DURATION, MAX_DURATION, MAX_POLLS, async_profile
 
 ATTR_ACTION = "action"
 ATTR_DATA = "data"
+ATTR_DURATION = "duration"
+ATTR_POLLS = "polls"
 SERVICE_SET_ACTION = "set_action"
 SERVICE_UPDATE = "update"
+SERVICE_PROFILE = "profile"
+# Devices a service call sends commands to at the same time.
+MAX_CONCURRENT_UPDATES = 4
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_update_devices(
+    devices: Mapping[str, tuple[str, ConnectLifeCoordinator]],
+    data: dict[str, Any],
+) -> dict[str, JsonObjectType]:
+    """Send ``data`` to the devices, a few at a time, and collect per-device results.
+
+    ``devices`` maps device registry IDs to the ConnectLife device ID and its
+    coordinator. A failing device does not stop the others.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+
+    async def update(device_id: str, coordinator: ConnectLifeCoordinator) -> JsonObjectType:
+        async with semaphore:
+            _LOGGER.debug(f"Updating {device_id} with data: {data}")
+            start = time.monotonic()
+            # The coordinator refreshes once after the commands to all of its
+            # devices, so the new state shows up without waiting for the next poll.
+            try:
+                await coordinator.async_update_device(device_id, dict(data), {})
+            except (LifeConnectError, TimeoutError) as err:
+                result: JsonObjectType = {"success": False, "error": str(err) or type(err).__name__}
+            except Exception as err:  # pylint: disable=broad-except
+                # Reported as this device's result so the other devices still get theirs.
+                _LOGGER.exception("Unexpected error updating %s", device_id)
+                result = {"success": False, "error": f"{type(err).__name__}: {err}"}
+            else:
+                result = {"success": True}
+            result["latency"] = round(time.monotonic() - start, 3)
+            return result
+
+    results = await asyncio.gather(
+        *(update(device_id, coordinator) for device_id, coordinator in devices.values())
+    )
+    return dict(zip(devices, results))
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the services for the Fully Kiosk Browser integration."""
 
     async def collect_coordinators(
         device_ids: list[str],
-    ) -> dict[str, ConnectLifeCoordinator]:
-        config_entries = dict[str, ConfigEntry]()
+    ) -> dict[str, tuple[str, ConnectLifeCoordinator]]:
+        """Map device registry IDs to the ConnectLife device ID and its coordinator."""
+        config_entries = dict[str, tuple[str, ConfigEntry]]()
         registry = dr.async_get(hass)
         for target in device_ids:
             device = registry.async_get(target)
             if device:
-                device_entries = dict[str, ConfigEntry]()
+                device_entry: tuple[str, ConfigEntry] | None = None
                 for entry_id in device.config_entries:
                     entry = hass.config_entries.async_get_entry(entry_id)
                     if entry and entry.domain == DOMAIN:
                         for domain, device_id in device.identifiers:
                             if domain == DOMAIN:
                                 _LOGGER.debug(f"device_id: {device_id}")
-                                device_entries[device_id] = entry
+                                device_entry = (device_id, entry)
                                 break
-                if not device_entries:
+                if not device_entry:
                     raise HomeAssistantError(
                         f"Device '{target}' is not a {DOMAIN} device"
                     )
-                config_entries.update(device_entries)
+                config_entries[target] = device_entry
             else:
                 raise HomeAssistantError(
                     f"Device '{target}' not found in device registry"
                 )
-        coordinators = dict[str, ConnectLifeCoordinator]()
-        for device_id, config_entry in config_entries.items():
+        coordinators = dict[str, tuple[str, ConnectLifeCoordinator]]()
+        for target, (device_id, config_entry) in config_entries.items():
             if config_entry.state != ConfigEntryState.LOADED:
                 raise HomeAssistantError(f"{config_entry.title} is not loaded")
-            coordinators[device_id] = hass.data[DOMAIN][config_entry.entry_id]
+            coordinators[target] = (device_id, hass.data[DOMAIN][config_entry.entry_id])
         return coordinators
 
-    async def _async_update(devices: list[str], data: dict[str, Any]) -> None:
-        """Update properties on device."""
-        coordinators = await collect_coordinators(devices)
-        for device_id, coordinator in coordinators.items():
-            _LOGGER.debug(f"Updating {device_id} with data: {data}")
-            # TODO: Consider trigging a data update to avoid waiting for next poll to update state.
-            #       Make sure to only do this once per coordinater.
-            try:
-                await coordinator.async_update_device(device_id, data, {})
-            except LifeConnectError as api_error:
-                raise ServiceValidationError(str(api_error)) from api_error
+    async def _async_update(call: ServiceCall, data: dict[str, Any]) -> ServiceResponse:
+        """Update properties on the devices, returning per-device results if requested."""
+        coordinators = await collect_coordinators(call.data[ATTR_DEVICE_ID])
+        results = await async_update_devices(coordinators, data)
+        if call.return_response:
+            devices: JsonObjectType = {target: result for target, result in results.items()}
+            return {"devices": devices}
+        failed = {target: result["error"] for target, result in results.items() if not result["success"]}
+        if failed:
+            raise ServiceValidationError(
+                f"Update failed for {len(failed)} of {len(results)} devices: "
+                + "; ".join(f"{target}: {error}" for target, error in failed.items())
+            )
+        return None
 
-    async def async_set_action(call: ServiceCall) -> None:
+    async def async_set_action(call: ServiceCall) -> ServiceResponse:
         """Set action on device."""
-        await _async_update(
-            call.data[ATTR_DEVICE_ID], {"Actions": call.data[ATTR_ACTION]}
-        )
+        return await _async_update(call, {"Actions": call.data[ATTR_ACTION]})
 
     hass.services.async_register(
         DOMAIN,
@@ -93,11 +142,12 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 }
             )
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
-    async def async_update(call: ServiceCall) -> None:
+    async def async_update(call: ServiceCall) -> ServiceResponse:
         """Action handler for updating properties on device."""
-        await _async_update(call.data[ATTR_DEVICE_ID], call.data[ATTR_DATA])
+        return await _async_update(call, call.data[ATTR_DATA])
 
     hass.services.async_register(
         DOMAIN,
@@ -111,4 +161,36 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 }
             )
         ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_profile_service(call: ServiceCall) -> None:
+        """Profile the integration for a while or a number of polls."""
+        polls = call.data.get(ATTR_POLLS)
+        duration = call.data.get(ATTR_DURATION, MAX_DURATION if polls else DEFAULT_DURATION)
+        coordinators = [
+            coordinator
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+            if isinstance(coordinator, ConnectLifeCoordinator)
+        ]
+        await async_profile(
+            hass,
+            duration,
+            polls,
+            lambda: sum(coordinator.polls_completed for coordinator in coordinators),
+        )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile_service,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_DURATION): vol.All(
+                    vol.Coerce(float), vol.Range(min=1, max=MAX_DURATION)
+                ),
+                vol.Optional(ATTR_POLLS): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_POLLS)),
+            }
+        ),
     )
@@ -0,0 +1,144 @@
+"""API client shared by the config entries of one ConnectLife account.
+
+Entries for the same account (backend, test server and credentials) get the
+same ``AccountSession``: one authenticated client, logged in once, one rate
+limiter and circuit breaker (see ``api_guard``), and one appliance poll whose
+result is handed to every entry that asks for it at about the same time. The
+session is reference-counted and dropped when its last entry unloads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Sequence
+
+from connectlife.api import ConnectLifeApi
+from connectlife.appliance import ConnectLifeAppliance
+from homeassistant.core import HomeAssistant, callback
+
+from .api_guard import PRIORITY_BACKGROUND, ApiGuard
+from .client import create_api
+from .const import DOMAIN
+from .token_cache import TokenCache
+
+DATA_SESSIONS = "sessions"
+# When the session is shared, an appliance poll finished less than this many
+# seconds ago is reused instead of polling again, so entries of the same
+# account share their polls. Below the shortest poll interval (see
+# scheduler.POLL_INTERVALS), so an entry never reuses its own previous poll.
+SHARED_POLL_MAX_AGE = 5.0
+
+_LOGGER = logging.getLogger(__name__)
+
+SessionKey = tuple[bool, str, str, str]
+
+
+def session_key(
+        username: str, password: str, trir: bool = False, test_server_url: str | None = None
+) -> SessionKey:
+    """Key identifying an account; the password is only kept as a digest."""
+    return (
+        trir,
+        test_server_url or "",
+        username.strip().lower(),
+        hashlib.sha256(password.encode()).hexdigest(),
+    )
+
+
+class AccountSession:
+    """Client, login state, guard and appliance poll of one account."""
+
+    def __init__(
+            self,
+            api: ConnectLifeApi,
+            guard: ApiGuard | None = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.api = api
+        self.guard = guard or ApiGuard()
+        self._clock = clock
+        self.entries: set[str] = set()
+        self.logged_in = False
+        self._login_lock = asyncio.Lock()
+        self._poll: asyncio.Task[Sequence[ConnectLifeAppliance]] | None = None
+        self._polled_at: float | None = None
+        # Polls answered from another entry's poll instead of the cloud.
+        self.polls_shared = 0
+
+    async def async_login(self, token_cache: TokenCache) -> None:
+        """Log in unless already done for another entry (or stored tokens can be used)."""
+        async with self._login_lock:
+            if self.logged_in:
+                return
+            if not await token_cache.async_restore(self.api):
+                await self.api.login()
+            self.logged_in = True
+
+    async def async_get_appliances(self) -> tuple[Sequence[ConnectLifeAppliance], bool]:
+        """Appliances of the account, from a poll in progress or a recent one if any.
+
+        The flag is true when the appliances come from a poll that had already
+        finished, i.e. no request was made for this call. Only a session shared
+        by several entries reuses finished polls.
+        """
+        if self._poll is None:
+            if (
+                    len(self.entries) > 1
+                    and self._polled_at is not None
+                    and self._clock() - self._polled_at < SHARED_POLL_MAX_AGE
+            ):
+                self.polls_shared += 1
+                return self.api.appliances, True
+            self._poll = asyncio.create_task(
+                self.guard.call(PRIORITY_BACKGROUND, self.api.get_appliances)
+            )
+            self._poll.add_done_callback(self._poll_done)
+        else:
+            self.polls_shared += 1
+        # Shielded so one entry's cancelled refresh does not cancel the others'.
+        return await asyncio.shield(self._poll), False
+
+    def invalidate(self) -> None:
+        """Poll again on the next request, e.g. after a command changed a device."""
+        self._polled_at = None
+
+    def _poll_done(self, task: asyncio.Task) -> None:
+        self._poll = None
+        if not task.cancelled() and task.exception() is None:
+            self._polled_at = self._clock()
+
+
+@callback
+def async_acquire_session(
+        hass: HomeAssistant,
+        entry_id: str,
+        username: str,
+        password: str,
+        trir: bool = False,
+        test_server_url: str | None = None,
+) -> AccountSession:
+    """Session for the account, created on first use; the entry holds a reference."""
+    sessions: dict[SessionKey, AccountSession] = hass.data[DOMAIN].setdefault(DATA_SESSIONS, {})
+    key = session_key(username, password, trir, test_server_url)
+    session = sessions.get(key)
+    if session is None:
+        session = sessions[key] = AccountSession(
+            create_api(username, password, trir=trir, test_server_url=test_server_url)
+        )
+    elif entry_id not in session.entries:
+        _LOGGER.debug("Sharing the ConnectLife session of %s with another entry", username)
+    session.entries.add(entry_id)
+    return session
+
+
+@callback
+def async_release_session(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop the entry's reference; the last one removes the session."""
+    sessions: dict[SessionKey, AccountSession] = hass.data[DOMAIN].get(DATA_SESSIONS, {})
+    for key, session in list(sessions.items()):
+        session.entries.discard(entry_id)
+        if not session.entries:
+            del sessions[key]
@@ -0,0 +1,98 @@
+"""Last known appliance list, persisted so setup does not wait for the cloud.
+
+After each poll that changed something the appliance payloads are written to a
+Home Assistant ``Store``. At startup the snapshot is turned back into
+``ConnectLifeAppliance`` objects so entities can be created immediately; they
+stay unavailable until the first live refresh replaces the snapshot.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+from connectlife.api import ConnectLifeApi
+from connectlife.appliance import ConnectLifeAppliance
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Coalesce writes; the store also flushes pending data when Home Assistant stops.
+SAVE_DELAY = 60
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _timestamp(value: dt.datetime | None) -> int | None:
+    return int(value.timestamp() * 1000) if value is not None else None
+
+
+def _status_value(value: Any) -> Any:
+    # Datetimes are written in the gateway's own format so that the library
+    # parses them back to the same value.
+    if isinstance(value, dt.datetime):
+        return (
+            f"{value.year:04d}/{value.month:02d}/{value.day:02d}"
+            f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+        )
+    return value
+
+
+def appliance_to_payload(appliance: ConnectLifeAppliance) -> dict[str, Any]:
+    """Gateway payload that ``ConnectLifeAppliance`` builds the appliance from."""
+    return {
+        "wifiId": appliance.wifi_id,
+        "deviceId": appliance.device_id,
+        "puid": appliance.puid,
+        "deviceNickName": appliance.device_nickname,
+        "deviceFeatureCode": appliance.device_feature_code,
+        "deviceFeatureName": appliance.device_feature_name,
+        "deviceTypeCode": appliance.device_type_code,
+        "deviceTypeName": appliance.device_type_name,
+        "role": appliance.role,
+        "roomId": appliance.room_id,
+        "roomName": appliance.room_name,
+        "offlineState": appliance.offline_state,
+        "seq": appliance.seq,
+        "bindTime": _timestamp(appliance.bind_time),
+        "useTime": _timestamp(appliance.use_time),
+        "createTime": _timestamp(appliance.create_time),
+        "statusList": {k: _status_value(v) for k, v in appliance.status_list.items()},
+    }
+
+
+class ApplianceSnapshot:
+    """Persisted copy of the last polled appliances of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.appliances"
+        )
+
+    async def async_load(self, api: ConnectLifeApi) -> dict[str, ConnectLifeAppliance] | None:
+        """Appliances from the snapshot, or ``None`` if there is no usable snapshot."""
+        stored = await self._store.async_load()
+        if not stored or not stored.get("appliances"):
+            return None
+        try:
+            appliances = [ConnectLifeAppliance(api, payload) for payload in stored["appliances"]]
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning("Ignoring unreadable appliance snapshot", exc_info=True)
+            return None
+        return {a.device_id: a for a in appliances}
+
+    @callback
+    def async_save(self, data: Mapping[str, ConnectLifeAppliance]) -> None:
+        """Schedule writing ``data``; serialized when the write happens."""
+        self._store.async_delay_save(
+            lambda: {"appliances": [appliance_to_payload(a) for a in data.values()]},
+            SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot."""
+        await self._store.async_remove()
@@ -61,6 +61,8 @@ class StatisticsSource:
     """Base class: fetch one endpoint and declare its sensors."""
 
     key: str
+    # Library method ``fetch`` calls, as named in diagnostics.
+    api_method: str
     sensors: tuple[StatisticsSensorDef, ...]
 
     async def fetch(
@@ -73,6 +75,7 @@ class AirDuctStatisticsSource(StatisticsSource):
     """``air_duct_energy`` (air conditioners). Today's total via ``statType=day``."""
 
     key = "air_duct_energy"
+    api_method = "get_air_duct_energy"
     sensors = (
         StatisticsSensorDef(
             "daily_energy_kwh",
@@ -97,6 +100,7 @@ class ConsumptionStatisticsSource(StatisticsSource):
     """
 
     key = "energy_consumption_curve"
+    api_method = "get_energy_consumption_curve"
     sensors = (
         StatisticsSensorDef(
             "daily_energy_kwh",
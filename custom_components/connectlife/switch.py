@@ -12,9 +12,9 @@ from connectlife.appliance import ConnectLifeAppliance
 
 from .const import DOMAIN
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Property
+from .decoders import MISSING, switch_decoder
+from .dictionaries import Property
 from .entity import ConnectLifeEntity
-from .utils import climate_bound_properties, device_target_overrides, has_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,18 +26,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        overrides = device_target_overrides(config_entry, appliance.device_id)
-        climate_bound = climate_bound_properties(appliance, dictionary, overrides)
-        async_add_entities(
-            ConnectLifeSwitch(
-                coordinator, appliance, s, dictionary.properties[s]
-            )
-            for s in appliance.status_list
-            if has_platform(Platform.SWITCH, dictionary.properties[s])
-            and s not in climate_bound
-        )
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        for s in plan.properties_for(Platform.SWITCH):
+            yield ConnectLifeSwitch(coordinator, appliance, s, plan.dictionary.properties[s])
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 class ConnectLifeSwitch(ConnectLifeEntity, SwitchEntity):
@@ -55,6 +50,7 @@ class ConnectLifeSwitch(ConnectLifeEntity, SwitchEntity):
         self.status = status
         self._unavailable_status = status
         self._unavailable_value = dd_entry.unavailable
+        self.watch(status)
         self.command_name = (
             dd_entry.switch.command_name if dd_entry.switch.command_name else status
         )
@@ -72,19 +68,17 @@ class ConnectLifeSwitch(ConnectLifeEntity, SwitchEntity):
             device_class=dd_entry.switch.device_class,
             entity_category=dd_entry.entity_category,
         )
+        self._decode = switch_decoder(status, self.on, self.off, self._unknown_value)
         self._refresh_state()
 
     @callback
     def update_state(self):
-        if self.status in self.coordinator.data[self.device_id].status_list:
-            value = self.coordinator.data[self.device_id].status_list[self.status]
-            if value == self.on:
-                self._attr_is_on = True
-            elif value == self.off:
-                self._attr_is_on = False
-            else:
-                self._attr_is_on = None
-                _LOGGER.warning("Unknown value %s for %s", str(value), self.status)
+        value = self._decode(self.coordinator.data[self.device_id].status_list)
+        if value is not MISSING:
+            self._attr_is_on = value
+
+    def _unknown_value(self, value) -> None:
+        _LOGGER.warning("Unknown value %s for %s", str(value), self.status)
 
     async def async_turn_off(self, **kwargs):
         """Turn off."""
@@ -0,0 +1,98 @@
+"""Access and refresh token of a config entry, persisted across reloads and restarts.
+
+Logging in is the slowest part of setup and the login endpoints are the most
+rate-limited, so the tokens are stored after each successful poll and handed
+back to the API client on the next setup. The client then keeps refreshing
+them as usual, and falls back to a full login if the gateway rejects them.
+
+The library keeps the token state in private attributes; only this module
+touches them.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any
+
+from connectlife.api import ConnectLifeApi
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 5
+
+
+def _timestamp(value: dt.datetime | None) -> float | None:
+    # The library uses naive local times; timestamp()/fromtimestamp() round trip them.
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: float | None) -> dt.datetime | None:
+    return dt.datetime.fromtimestamp(value) if value is not None else None
+
+
+def token_state(api: ConnectLifeApi, username: str) -> dict[str, Any] | None:
+    """Serializable token state of ``api``, or ``None`` when it is not logged in."""
+    if api._access_token is None:
+        return None
+    return {
+        "username": username,
+        "access_token": api._access_token,
+        "expires": _timestamp(api._expires),
+        "refresh_token": api._refresh_token,
+        "refresh_token_expires": _timestamp(api._refresh_token_expires),
+    }
+
+
+def restore_token_state(api: ConnectLifeApi, state: dict[str, Any], username: str) -> bool:
+    """Hand stored tokens to ``api``; ``False`` if they are for another account or unusable."""
+    if state.get("username") != username or not state.get("access_token"):
+        return False
+    now = dt.datetime.now()
+    expires = _datetime(state.get("expires"))
+    refresh_token_expires = _datetime(state.get("refresh_token_expires"))
+    access_valid = expires is not None and expires > now
+    refresh_valid = state.get("refresh_token") is not None and (
+        refresh_token_expires is None or refresh_token_expires > now
+    )
+    if not access_valid and not refresh_valid:
+        return False
+    api._access_token = state["access_token"]
+    api._expires = expires
+    api._refresh_token = state.get("refresh_token")
+    api._refresh_token_expires = refresh_token_expires
+    return True
+
+
+class TokenCache:
+    """Stored tokens of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, username: str):
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.token", private=True
+        )
+        self._username = username
+        self._saved: dict[str, Any] | None = None
+
+    async def async_restore(self, api: ConnectLifeApi) -> bool:
+        """Give ``api`` the stored tokens; ``False`` if it has to log in."""
+        stored = await self._store.async_load()
+        if not stored or not restore_token_state(api, stored, self._username):
+            return False
+        self._saved = stored
+        return True
+
+    @callback
+    def async_save(self, api: ConnectLifeApi) -> None:
+        """Store the tokens of ``api`` if they changed since the last save."""
+        state = token_state(api, self._username)
+        if state is None or state == self._saved:
+            return
+        self._saved = state
+        self._store.async_delay_save(lambda: state, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored tokens."""
+        await self._store.async_remove()
@@ -5,7 +5,7 @@ from homeassistant.const import Platform, UnitOfTemperature
 
 from connectlife.appliance import ConnectLifeAppliance
 from .const import CONF_DEVICES, CONF_TARGET_OVERRIDES, TEMPERATURE_UNIT
-from .dictionaries import Property, Dictionary
+from .dictionaries import UNIT_PROPERTY_PREFIX, Property, Dictionary, unit_property
 
 
 def has_platform(platform: Platform, property: Property):
@@ -87,6 +87,24 @@ def device_target_overrides(config_entry, device_id: str) -> dict[str, str]:
     return device.get(CONF_TARGET_OVERRIDES, {})
 
 
+def changed_device_options(old: Mapping, new: Mapping) -> set[str] | None:
+    """Device IDs whose per-device options differ between two option sets.
+
+    Returns ``None`` when an account-wide option differs as well.
+    """
+    if {k: v for k, v in old.items() if k != CONF_DEVICES} != {
+        k: v for k, v in new.items() if k != CONF_DEVICES
+    }:
+        return None
+    old_devices = old.get(CONF_DEVICES, {})
+    new_devices = new.get(CONF_DEVICES, {})
+    return {
+        device_id
+        for device_id in old_devices.keys() | new_devices.keys()
+        if old_devices.get(device_id, {}) != new_devices.get(device_id, {})
+    }
+
+
 def climate_bound_properties(
     appliance: ConnectLifeAppliance,
     dictionary: Dictionary,
@@ -104,21 +122,21 @@ def climate_bound_properties(
 def to_unit(unit: str | None, appliance: ConnectLifeAppliance, dictionary: Dictionary):
     if unit is None:
         return None
-    if unit.startswith("property."):
-        unit_property_name = unit[9:]
+    unit_property_name = unit_property(unit)
+    if unit_property_name is not None:
         if unit_property_name in dictionary.properties:
-            unit_value = appliance.status_list[unit_property_name]
-            unit_property = dictionary.properties[unit_property_name]
-            if has_platform(Platform.CLIMATE, unit_property):
-                unit_climate = unit_property.climate
+            unit_value = appliance.status_list.get(unit_property_name)
+            source = dictionary.properties[unit_property_name]
+            if has_platform(Platform.CLIMATE, source):
+                unit_climate = source.climate
                 if unit_climate.target == TEMPERATURE_UNIT and unit_value in unit_climate.options:
                     unit = unit_climate.options[unit_value]
-            elif has_platform(Platform.SENSOR, unit_property):
-                unit_sensor = unit_property.sensor
+            elif has_platform(Platform.SENSOR, source):
+                unit_sensor = source.sensor
                 if unit_sensor.device_class == SensorDeviceClass.ENUM and unit_sensor.options is not None and unit_value in unit_sensor.options:
                     unit = unit_sensor.options[unit_value]  # type: ignore[index]
-            elif has_platform(Platform.SELECT, unit_property):
-                unit_select = unit_property.select
+            elif has_platform(Platform.SELECT, source):
+                unit_select = source.select
                 if unit_value in unit_select.options:
                     unit = unit_select.options[unit_value]
     if unit is None:
@@ -126,6 +144,34 @@ def to_unit(unit: str | None, appliance: ConnectLifeAppliance, dictionary: Dicti
     return normalize_temperature_unit(unit)
 
 
+class PropertyUnit:
+    """A ``unit: property.<name>`` unit, re-resolved when that property changes.
+
+    The device may switch the unit at any time (e.g. an oven between °C and
+    °F); ``update`` resolves it again only when the source property's value
+    differs from the one last resolved.
+    """
+
+    def __init__(self, source: str, appliance: ConnectLifeAppliance, dictionary: Dictionary):
+        self.source = source
+        self.unit = f"{UNIT_PROPERTY_PREFIX}{source}"
+        self._dictionary = dictionary
+        self._value = appliance.status_list.get(source)
+        self.resolved = to_unit(self.unit, appliance, dictionary)
+
+    def update(self, appliance: ConnectLifeAppliance) -> bool:
+        """Resolve the unit again if its source changed; return whether the unit changed."""
+        value = appliance.status_list.get(self.source)
+        if value == self._value:
+            return False
+        self._value = value
+        resolved = to_unit(self.unit, appliance, self._dictionary)
+        if resolved == self.resolved:
+            return False
+        self.resolved = resolved
+        return True
+
+
 def normalize_temperature_unit(unit: str) -> UnitOfTemperature | str:
     """Normalizes temperature units to UnitOfTemperature, or returns the provided unit."""
     if unit in ["°C", "C", "celsius", "Celsius"]:
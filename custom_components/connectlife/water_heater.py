@@ -28,7 +28,7 @@ from .const import (
     TEMPERATURE_UNIT,
 )
 from .coordinator import ConnectLifeCoordinator
-from .dictionaries import Dictionaries, Dictionary
+from .dictionaries import Dictionary
 from .entity import ConnectLifeEntity
 from .utils import has_platform, to_temperature_map, normalize_temperature_unit
 from connectlife.appliance import ConnectLifeAppliance
@@ -47,12 +47,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up ConnectLife sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    entities = []
-    for appliance in coordinator.data.values():
-        dictionary = Dictionaries.get_dictionary(appliance)
-        if is_water_heater(dictionary):
-            entities.append(ConnectLifeWaterHeater(coordinator, appliance, dictionary))
-    async_add_entities(entities)
+
+    def entities(appliance: ConnectLifeAppliance):
+        plan = coordinator.entity_plan(appliance)
+        if Platform.WATER_HEATER in plan.device_platforms:
+            yield ConnectLifeWaterHeater(coordinator, appliance, plan.dictionary)
+
+    coordinator.async_add_entity_factory(entities, async_add_entities)
 
 
 def is_water_heater(dictionary: Dictionary):
@@ -117,6 +118,7 @@ class ConnectLifeWaterHeater(ConnectLifeEntity, WaterHeaterEntity):
                         self.target_map[target], dd_entry.name, target, self.nickname, dd_entry.name,
                     )
                 self.target_map[target] = dd_entry.name
+        self.watch(*self.target_map.values())
 
         for target, status in self.target_map.items():
             if target == IS_ON:
@@ -0,0 +1,365 @@
+"""Benchmark dictionary loading, entity setup, update fan-out and command round trips.
+
+Appliances are synthesised from the shipped data dictionaries (every property
+reported with a value its mapping accepts) and run through the real platform
+setup, coordinator dispatch and command path against a fake API. Home
+Assistant's state machine is not involved: entity state writes are counted,
+not performed.
+
+Results are saved as JSON (by default under .benchmarks/, named after the
+current commit) and can be compared with an earlier run:
+
+    python -m scripts.benchmark
+    python -m scripts.benchmark --compare .benchmarks/<commit>.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
+
+from connectlife.appliance import ConnectLifeAppliance
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry, current_entry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+import custom_components.connectlife.coordinator as coordinator_module
+from custom_components.connectlife import (
+    binary_sensor,
+    button,
+    climate,
+    humidifier,
+    number,
+    select,
+    sensor,
+    switch,
+    water_heater,
+)
+from custom_components.connectlife.api_guard import ApiGuard, TokenBucket
+from custom_components.connectlife.const import DOMAIN
+from custom_components.connectlife.coordinator import ConnectLifeCoordinator
+from custom_components.connectlife.dictionaries import (
+    Dictionaries,
+    PER_PROPERTY_PLATFORM_KEYS,
+    _merge_property,
+    _resolve,
+)
+from custom_components.connectlife.session import AccountSession
+from custom_components.connectlife.utils import climate_target_bindings
+
+PLATFORM_MODULES = (
+    binary_sensor, button, climate, humidifier, number, select, sensor, switch, water_heater
+)
+DEFAULT_DEVICES = "1,10,100,500"
+RESULTS_DIR = ".benchmarks"
+
+
+def timed(func: Callable[[], object], repeat: int = 3) -> float:
+    """Best of ``repeat`` wall-clock runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def dictionary_keys() -> list[str]:
+    assert Dictionaries.load_bundle(), "run scripts.compile_dictionaries first"
+    assert Dictionaries.bundle is not None
+    return list(Dictionaries.bundle["dictionaries"])
+
+
+def sample_value(prop) -> int:
+    """A raw value the property's mapping accepts."""
+    for platform in (Platform.CLIMATE, Platform.HUMIDIFIER, Platform.WATER_HEATER, *PER_PROPERTY_PLATFORM_KEYS):
+        if not hasattr(prop, platform):
+            continue
+        block = getattr(prop, platform)
+        if platform == Platform.SWITCH:
+            return block.on
+        options = getattr(block, "options", None)
+        if options:
+            return next(iter(options))
+        min_value = getattr(block, "min_value", None)
+        if isinstance(min_value, int):
+            return min_value
+    return 1
+
+
+def payload(index: int, key: str, variant: int = 0) -> dict:
+    """Gateway payload for a synthetic appliance using the dictionary ``key``."""
+    type_code, feature_code = key.split("-", 1)
+    dictionary = Dictionaries.get_dictionary(
+        SimpleNamespace(device_type_code=type_code, device_feature_code=feature_code, device_nickname=key)
+    )
+    status_list = {
+        name: sample_value(prop)
+        for name, prop in list(dictionary.properties.items())
+        if name != "default"
+    }
+    # Later polls change one property with an entity on every tenth device.
+    if variant and index % 10 == 0:
+        name = next((
+            name for name, prop in dictionary.properties.items()
+            if name in status_list and not (prop.hide or prop.disable) and hasattr(prop, Platform.SENSOR)
+        ), None)
+        if name is not None:
+            status_list[name] = status_list[name] + variant
+    return {
+        "wifiId": f"wifi{index}",
+        "deviceId": f"dev{index}",
+        "puid": f"puid{index}",
+        "deviceNickName": f"Device {index}",
+        "deviceFeatureCode": feature_code,
+        "deviceFeatureName": feature_code,
+        "deviceTypeCode": type_code,
+        "deviceTypeName": type_code,
+        "role": 1,
+        "roomId": 1,
+        "roomName": "Room",
+        "offlineState": 1,
+        "seq": 1,
+        "bindTime": None,
+        "useTime": None,
+        "createTime": None,
+        "statusList": {k: str(v) for k, v in status_list.items()},
+    }
+
+
+class FakeApi:
+    """Returns synthesised appliances; accepts every command."""
+
+    def __init__(self, payloads: list[dict]):
+        self.payloads = payloads
+        self.appliances: list[ConnectLifeAppliance] = []
+        self.commands = 0
+
+    async def get_appliances(self):
+        self.appliances = [ConnectLifeAppliance(self, p) for p in self.payloads]
+        return self.appliances
+
+    async def update_appliance(self, puid, properties):
+        self.commands += 1
+
+
+async def make_coordinator(api: FakeApi) -> ConnectLifeCoordinator:
+    """Coordinator on a bare Home Assistant, polling ``api`` through an unthrottled session."""
+    hass = HomeAssistant(tempfile.gettempdir())
+    entry = ConfigEntry(
+        data={}, discovery_keys=MappingProxyType({}), domain=DOMAIN, entry_id="bench", minor_version=1,
+        options={}, source=SOURCE_USER, title="Benchmark", unique_id=None, version=1,
+    )
+    # As during entry setup, where the coordinator picks up its config entry.
+    current_entry.set(entry)
+    session = AccountSession(api, ApiGuard(TokenBucket(rate=0)))  # type: ignore[arg-type]
+    session.entries.add(entry.entry_id)
+    return ConnectLifeCoordinator(hass, api, session=session)  # type: ignore[arg-type]
+
+
+async def setup_entities(coordinator: ConnectLifeCoordinator) -> list[Entity]:
+    """Run every platform's async_setup_entry, returning the created entities."""
+    entities: list[Entity] = []
+    hass = coordinator.hass
+    hass.data[DOMAIN] = {"bench": coordinator}
+    for module in PLATFORM_MODULES:
+        await module.async_setup_entry(hass, coordinator.config_entry, entities.extend)  # type: ignore[arg-type]
+    for entity in entities:
+        context = getattr(entity, "_subscription", None)
+        coordinator.async_add_listener(entity._handle_coordinator_update, context)  # type: ignore[attr-defined]
+    return entities
+
+
+def bench_dictionaries(keys: list[str]) -> dict[str, float]:
+    results: dict[str, float] = {}
+    appliances = [
+        SimpleNamespace(device_type_code=k.split("-", 1)[0], device_feature_code=k.split("-", 1)[1], device_nickname=k)
+        for k in keys
+    ]
+
+    def load_yaml():
+        Dictionaries.dictionaries.clear()
+        Dictionaries.bundle = None
+        for appliance in appliances:
+            Dictionaries.get_dictionary(appliance)
+
+    def load_bundle():
+        Dictionaries.dictionaries.clear()
+        Dictionaries.bundle = None
+        Dictionaries.load_bundle()
+        for appliance in appliances:
+            Dictionaries.get_dictionary(appliance)
+
+    results["get_dictionary_yaml_all_ms"] = timed(load_yaml, repeat=1)
+    results["get_dictionary_bundle_all_ms"] = timed(load_bundle)
+
+    raws = [_resolve(*k.split("-", 1))[1] for k in keys]
+    entries = [entry for raw in raws for entry in raw["properties"]]
+    results["merge_property_all_ms"] = timed(lambda: [_merge_property(e, e) for e in entries])
+
+    statuses = [
+        (SimpleNamespace(status_list={n: 0 for n in d.properties}), d)
+        for d in (Dictionaries.get_dictionary(a) for a in appliances)
+    ]
+    results["climate_target_bindings_all_ms"] = timed(
+        lambda: [climate_target_bindings(a, d) for a, d in statuses]
+    )
+    results.update(bench_presets(appliances))
+    return results
+
+
+def bench_presets(appliances: list[SimpleNamespace], polls: int = 2000) -> dict[str, float]:
+    """Preset matching of the dictionary with the most presets, one status list per preset plus none."""
+    presets = max((Dictionaries.get_dictionary(a).presets for a in appliances), key=len)
+    if not presets:
+        return {}
+    properties = {prop for values in presets.values() for prop in values}
+    status_lists = [{**dict.fromkeys(properties, -1), **values} for values in presets.values()]
+    status_lists.append(dict.fromkeys(properties, -1))
+
+    def scan(status_list, current):
+        if current in presets and presets[current].items() <= status_list.items():
+            return current
+        return next((name for name, values in presets.items() if values.items() <= status_list.items()), None)
+
+    # One device per status list, each with its own index as its climate entity has.
+    devices = [(climate.PresetIndex(presets), s) for s in status_lists]
+    shared = climate.PresetIndex(presets)
+    return {
+        "presets": len(presets),
+        "preset_scan_ms": timed(lambda: [scan(s, None) for _ in range(polls) for s in status_lists]),
+        "preset_index_unchanged_ms": timed(lambda: [i.match(s) for _ in range(polls) for i, s in devices]),
+        "preset_index_changed_ms": timed(lambda: [shared.match(s) for _ in range(polls) for s in status_lists]),
+    }
+
+
+def bench_devices(keys: list[str], count: int) -> dict[str, float]:
+    payloads = [payload(i, keys[i % len(keys)]) for i in range(count)]
+    changed = [payload(i, keys[i % len(keys)], variant=1) for i in range(count)]
+    results: dict[str, float] = {}
+    writes = 0
+
+    def count_write(self):
+        nonlocal writes
+        writes += 1
+
+    async def run():
+        nonlocal writes
+        api = FakeApi(payloads)
+        coordinator = await make_coordinator(api)
+        coordinator.data = await coordinator._async_update_data()
+
+        start = time.perf_counter()
+        entities = await setup_entities(coordinator)
+        results["setup_ms"] = (time.perf_counter() - start) * 1000
+        results["entities"] = len(entities)
+
+        for name, data in (("refresh_unchanged", payloads), ("refresh_changed", changed)):
+            api.payloads = data
+            writes = 0
+            # Measure a real fetch, not the reuse of the previous one.
+            coordinator._fetched_at = None
+            start = time.perf_counter()
+            coordinator.data = await coordinator._async_update_data()
+            coordinator.async_update_listeners()
+            results[f"{name}_ms"] = (time.perf_counter() - start) * 1000
+            results[f"{name}_writes"] = writes
+
+        # Two commands per device, sent concurrently so they coalesce per device.
+        devices = list(coordinator.data.values())
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            coordinator.async_update_device(a.device_id, {name: value}, {name: value})
+            for a in devices
+            for name, value in list(a.status_list.items())[:2]
+        ))
+        results["commands_ms"] = (time.perf_counter() - start) * 1000
+        results["commands_sent"] = api.commands
+        await coordinator.async_shutdown()
+        await coordinator.hass.async_stop(force=True)
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(Entity, "async_write_ha_state", count_write))
+        stack.enter_context(patch.object(
+            sensor.entity_platform,
+            "async_get_current_platform",
+            lambda: SimpleNamespace(async_register_entity_service=lambda *a, **k: None),
+        ))
+        # Measure the command path, not the coalescing wait.
+        stack.enter_context(patch.object(coordinator_module, "COMMAND_COALESCE_DELAY", 0))
+        asyncio.run(run())
+    assert results["refresh_changed_writes"] > results["refresh_unchanged_writes"], "changed poll wrote no more states"
+    return results
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results: dict, baseline: dict | None) -> None:
+    def rows(values: dict, base: dict | None):
+        for name, value in values.items():
+            line = f"  {name:<34}{value:>12.2f}" if isinstance(value, float) else f"  {name:<34}{value:>12}"
+            if base is not None and name in base and base[name] and name.endswith("_ms"):
+                line += f"{(value - base[name]) / base[name] * 100:>+10.1f}%"
+            print(line)
+
+    print("dictionaries")
+    rows(results["dictionaries"], baseline and baseline.get("dictionaries"))
+    for count, values in results["devices"].items():
+        print(f"{count} devices")
+        rows(values, baseline and baseline.get("devices", {}).get(count))
+
+
+def main(devices: list[int], output: str | None, compare: str | None) -> None:
+    logging.disable(logging.WARNING)
+    keys = dictionary_keys()
+    results = {
+        "commit": current_commit(),
+        "dictionaries": bench_dictionaries(keys),
+        "devices": {},
+    }
+    Dictionaries.dictionaries.clear()
+    Dictionaries.bundle = None
+    Dictionaries.load_bundle()
+    for count in devices:
+        results["devices"][str(count)] = bench_devices(keys, count)
+
+    baseline = None
+    if compare:
+        with open(compare) as f:
+            baseline = json.load(f)
+        print(f"Compared with {baseline.get('commit')} ({compare})")
+    print_results(results, baseline)
+
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{results['commit']}.json")
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", default=DEFAULT_DEVICES,
+                        help=f"comma-separated device counts (default {DEFAULT_DEVICES})")
+    parser.add_argument("--output", help=f"results file (default {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results file to compare with")
+    args = parser.parse_args()
+    main([int(n) for n in args.devices.split(",")], args.output, args.compare)
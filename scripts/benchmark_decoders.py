@@ -0,0 +1,200 @@
+"""Micro-benchmark of per-update value decoding, before and after compiled decoders.
+
+For every property of every shipped data dictionary, decodes a representative
+status value with the branch chain the entities used to evaluate on each update
+("before") and with the decoder compiled at entity creation ("after").
+"""
+
+import argparse
+import timeit
+from collections import defaultdict
+from types import SimpleNamespace
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import Platform
+
+from custom_components.connectlife.decoders import (
+    MISSING,
+    combine_decoder,
+    enum_decoder,
+    mapped_decoder,
+    select_decoder,
+    switch_decoder,
+    value_decoder,
+)
+from custom_components.connectlife.dictionaries import Dictionaries, PER_PROPERTY_PLATFORM_KEYS
+from custom_components.connectlife.utils import has_platform
+
+
+# -- before: the branches update_state evaluated on every update --------------
+
+
+def legacy_sensor(status, prop, status_list):
+    combine = prop.combine
+    sensor = prop.sensor
+    unknown_value = sensor.unknown_value
+    multiplier = sensor.multiplier
+    options_map = (
+        sensor.options
+        if sensor.device_class == SensorDeviceClass.ENUM and sensor.options is not None
+        else None
+    )
+    if combine:
+        value = 0.0
+        has_sources = False
+        for source in combine:
+            src_value = status_list.get(source["property"])
+            if src_value is not None and isinstance(src_value, (int, float)):
+                if "unknown_value" in source and src_value == source["unknown_value"]:
+                    continue
+                value += src_value * source.get("multiplier", 1)
+                has_sources = True
+        if has_sources:
+            if value == unknown_value:
+                return None
+            if multiplier is not None:
+                value *= multiplier
+            return value
+        elif status not in status_list:
+            return None
+    if status in status_list:
+        value = status_list[status]
+        if sensor.device_class == SensorDeviceClass.ENUM and options_map is not None:
+            if value in options_map:
+                value = options_map[value]
+            elif value != unknown_value:
+                value = str(value)
+        if value == unknown_value:
+            return None
+        if multiplier is not None and value is not None:
+            value *= multiplier
+        return value
+    return MISSING
+
+
+def legacy_number(status, prop, status_list):
+    if status in status_list:
+        return status_list[status]
+    return MISSING
+
+
+def legacy_select(status, prop, status_list):
+    if status in status_list:
+        value = status_list[status]
+        if value == prop.select.unknown_value:
+            return None
+        if value in prop.select.options:
+            return prop.select.options[value]
+        return str(value)
+    return MISSING
+
+
+def legacy_switch(status, prop, status_list):
+    if status in status_list:
+        value = status_list[status]
+        if value == prop.switch.on:
+            return True
+        if value == prop.switch.off:
+            return False
+        return None
+    return MISSING
+
+
+def legacy_binary_sensor(status, prop, status_list):
+    if status in status_list:
+        value = status_list[status]
+        if value in prop.binary_sensor.options:
+            return prop.binary_sensor.options[value]
+        return None
+    return MISSING
+
+
+LEGACY = {
+    Platform.BINARY_SENSOR: legacy_binary_sensor,
+    Platform.NUMBER: legacy_number,
+    Platform.SELECT: legacy_select,
+    Platform.SENSOR: legacy_sensor,
+    Platform.SWITCH: legacy_switch,
+}
+
+
+# -- after: decoders as the entities compile them ------------------------------
+
+
+def compiled(platform, status, prop):
+    if platform == Platform.SENSOR:
+        sensor = prop.sensor
+        if sensor.device_class == SensorDeviceClass.ENUM and sensor.options is not None:
+            decode = enum_decoder(status, dict(sensor.options), str, sensor.unknown_value, sensor.multiplier)
+        else:
+            decode = value_decoder(status, sensor.unknown_value, sensor.multiplier)
+        if prop.combine:
+            decode = combine_decoder(status, prop.combine, decode, sensor.unknown_value, sensor.multiplier)
+        return decode
+    if platform == Platform.NUMBER:
+        return value_decoder(status)
+    if platform == Platform.SELECT:
+        return select_decoder(status, dict(prop.select.options), str, prop.select.unknown_value)
+    if platform == Platform.SWITCH:
+        return switch_decoder(status, prop.switch.on, prop.switch.off, lambda v: None)
+    return mapped_decoder(status, prop.binary_sensor.options, lambda v: None)
+
+
+def sample_value(platform, prop):
+    """A value the property plausibly reports."""
+    block = getattr(prop, platform)
+    options = getattr(block, "options", None)
+    if platform == Platform.SWITCH:
+        return block.on
+    if options:
+        return next(iter(options))
+    return 1
+
+
+def cases():
+    Dictionaries.load_bundle()
+    assert Dictionaries.bundle is not None, "run scripts.compile_dictionaries first"
+    for key in Dictionaries.bundle["dictionaries"]:
+        type_code, feature = key.split("-", 1)
+        dictionary = Dictionaries.get_dictionary(
+            SimpleNamespace(device_type_code=type_code, device_feature_code=feature, device_nickname=key)
+        )
+        for name, prop in list(dictionary.properties.items()):
+            platform = next((p for p in PER_PROPERTY_PLATFORM_KEYS if has_platform(p, prop)), None)
+            if platform is None:
+                continue
+            status_list = {name: sample_value(platform, prop)}
+            for source in prop.combine or []:
+                status_list[source["property"]] = 1
+            yield platform, name, prop, status_list
+
+
+def main(number):
+    before = defaultdict(float)
+    after = defaultdict(float)
+    counts = defaultdict(int)
+    for platform, name, prop, status_list in cases():
+        legacy = LEGACY[platform]
+        decode = compiled(platform, name, prop)
+        assert legacy(name, prop, status_list) == decode(status_list), (platform, name)
+        before[platform] += timeit.timeit(lambda: legacy(name, prop, status_list), number=number)
+        after[platform] += timeit.timeit(lambda: decode(status_list), number=number)
+        counts[platform] += 1
+
+    print(f"{'platform':<14}{'properties':>11}{'before ns':>11}{'after ns':>10}{'speedup':>9}")
+    for platform in sorted(counts):
+        calls = counts[platform] * number
+        b = before[platform] / calls * 1e9
+        a = after[platform] / calls * 1e9
+        print(f"{platform:<14}{counts[platform]:>11}{b:>11.0f}{a:>10.0f}{b / a:>8.1f}x")
+    calls = sum(counts.values()) * number
+    b = sum(before.values()) / calls * 1e9
+    a = sum(after.values()) / calls * 1e9
+    print(f"{'all':<14}{sum(counts.values()):>11}{b:>11.0f}{a:>10.0f}{b / a:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000, help="decodes per property")
+    args = parser.parse_args()
+    main(args.number)
@@ -0,0 +1,37 @@
+"""Compile all data dictionaries into the bundle loaded at startup.
+
+Run after changing any file in data_dictionaries/; with --check, only verify
+that the committed bundle is up to date.
+"""
+
+import argparse
+import json
+import sys
+
+from custom_components.connectlife.dictionaries import BUNDLE_FILE, compile_bundle
+
+
+def main(basedir, check=False):
+    bundle = compile_bundle()
+    path = f'{basedir}/{BUNDLE_FILE}'
+    content = json.dumps(bundle, separators=(',', ':')) + "\n"
+    if check:
+        try:
+            with open(path, 'r') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != content:
+            print(f"{path} is out of date. Run 'uv run python -m scripts.compile_dictionaries' and commit the changes.")
+            sys.exit(1)
+        return
+    with open(path, 'w') as f:
+        f.write(content)
+    print(f"Compiled {len(bundle['types'])} types and {len(bundle['dictionaries'])} dictionaries into {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true", help="fail if the bundle is out of date")
+    args = parser.parse_args()
+    main("custom_components/connectlife", check=args.check)
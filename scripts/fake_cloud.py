@@ -0,0 +1,304 @@
+"""Local stand-in for the ConnectLife cloud, for load and soak testing.
+
+Serves the login, OAuth and gateway endpoints the integration uses for any
+number of synthetic appliances generated from the mapping files. Latency,
+error rates, token lifetime and rate limiting are configurable, and every
+random decision comes from one seeded generator, so a run can be replayed.
+
+    python -m scripts.fake_cloud --devices 2000 --latency 0.3 --failure-rate 5
+
+Point the integration at it by enabling development mode and setting the test
+server URL to http://localhost:8080. Request counters are served at /_stats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import json
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+
+from scripts.benchmark import dictionary_keys, payload
+
+# Gateway error codes, as returned by the real gateway.
+INVALID_ACCESS_TOKEN = 100026
+UNKNOWN_DEVICE = 404
+
+
+@dataclass
+class CloudConfig:
+    devices: int = 100
+    seed: int = 0
+    # Seconds added to every gateway response, plus up to ``jitter`` more.
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Percentages of gateway requests answered with HTTP 500 / left hanging.
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 35.0
+    # Percentage of logins rejected as invalid credentials.
+    auth_error_rate: float = 0.0
+    # Access token lifetime in seconds; expired tokens are rejected by the gateway.
+    token_lifetime: int = 86400
+    # Gateway requests per second (with a burst of the same size); 0 disables the limit.
+    rate_limit: float = 0.0
+    # Percentage of appliances that change one property between device list polls.
+    change_rate: float = 0.0
+
+
+def _ok(data: dict[str, Any] | None = None) -> web.Response:
+    response: dict[str, Any] = {"resultCode": 0}
+    if data is not None:
+        response.update(data)
+    return web.json_response({"response": response})
+
+
+def _error(error_code: int, error_desc: str) -> web.Response:
+    return web.json_response(
+        {"response": {"resultCode": 1, "errorCode": error_code, "errorDesc": error_desc}}
+    )
+
+
+class FakeCloud:
+    """Appliance state, issued tokens and request counters of one simulated account."""
+
+    def __init__(self, config: CloudConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        keys = dictionary_keys()
+        self.appliances: dict[str, dict[str, Any]] = {}
+        for index in range(config.devices):
+            appliance = payload(index, keys[index % len(keys)])
+            self.appliances[appliance["puid"]] = appliance
+        self.tokens: dict[str, float] = {}
+        self.stats: Counter[str] = Counter()
+        self._allowance = config.rate_limit
+        self._allowance_updated = time.monotonic()
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._count])
+        app.add_routes([
+            web.post("/accounts.login", self.login),
+            web.post("/accounts.getJWT", self.get_jwt),
+            web.post("/oauth/authorize", self.authorize),
+            web.post("/oauth/token", self.token),
+            web.get("/clife-svc/pu/get_device_status_list", self.get_device_status_list),
+            web.post("/device/pu/property/set", self.property_set),
+            web.post("/clife-svc/pu/air_duct_energy", self.air_duct_energy),
+            web.post("/clife-svc/pu/energyConsumptionCurve", self.energy_consumption_curve),
+            web.get("/_stats", self.get_stats),
+        ])
+        return app
+
+    @web.middleware
+    async def _count(self, request: web.Request, handler) -> web.StreamResponse:
+        self.stats[f"{request.method} {request.path}"] += 1
+        return await handler(request)
+
+    # -- Login ----------------------------------------------------------------
+
+    async def login(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        if self._chance(self.config.auth_error_rate):
+            self.stats["login rejected"] += 1
+            return web.json_response({
+                "errorCode": 403042,
+                "errorMessage": "Invalid LoginID",
+                "errorDetails": "invalid loginID or password",
+            })
+        return web.json_response({"UID": "123", "sessionInfo": {"cookieValue": "login_token"}})
+
+    async def get_jwt(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        return web.json_response({"id_token": "id_token"})
+
+    async def authorize(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        return web.json_response({"code": "authorization_code"})
+
+    async def token(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        access_token = secrets.token_hex(16)
+        self.tokens[access_token] = time.monotonic() + self.config.token_lifetime
+        return web.json_response({
+            "access_token": access_token,
+            "expires_in": self.config.token_lifetime,
+            "refresh_token": secrets.token_hex(16),
+        })
+
+    # -- Gateway --------------------------------------------------------------
+
+    async def _gateway(self, request: web.Request) -> tuple[dict[str, Any] | None, web.Response | None]:
+        """Request data, or the response to send instead (latency, faults, auth, rate limit)."""
+        delay = self.config.latency + self.random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if not self._take_allowance():
+            self.stats["rate limited"] += 1
+            return None, web.Response(status=429)
+        if self._chance(self.config.failure_rate):
+            self.stats["failed"] += 1
+            return None, web.Response(status=500)
+        if self._chance(self.config.timeout_rate):
+            self.stats["timed out"] += 1
+            await asyncio.sleep(self.config.timeout)
+        data = dict(request.query) if request.method == "GET" else await request.json()
+        expires = self.tokens.get(data.get("accessToken", ""))
+        if expires is None or expires < time.monotonic():
+            self.stats["token rejected"] += 1
+            return None, _error(INVALID_ACCESS_TOKEN, "Invalid access token")
+        return data, None
+
+    async def get_device_status_list(self, request: web.Request) -> web.Response:
+        _, response = await self._gateway(request)
+        if response is not None:
+            return response
+        self._simulate_activity()
+        return _ok({"deviceList": list(self.appliances.values())})
+
+    async def property_set(self, request: web.Request) -> web.Response:
+        data, response = await self._gateway(request)
+        if response is not None:
+            return response
+        assert data is not None
+        appliance = self.appliances.get(data.get("puid"))
+        if appliance is None:
+            return _error(UNKNOWN_DEVICE, f"Unknown puid {data.get('puid')}")
+        properties = data.get("properties", {})
+        unknowns = [key for key in properties if key not in appliance["statusList"]]
+        if unknowns:
+            return _error(400, f"Unknown properties {unknowns}")
+        appliance["statusList"].update(properties)
+        return _ok()
+
+    async def air_duct_energy(self, request: web.Request) -> web.Response:
+        data, response = await self._gateway(request)
+        if response is not None:
+            return response
+        assert data is not None
+        if data.get("puid") not in self.appliances:
+            return _error(UNKNOWN_DEVICE, f"Unknown puid {data.get('puid')}")
+        hours = [str(h) for h in range(24)]
+        return _ok({
+            "type": data.get("statType", "day"),
+            "dateStart": data.get("dateStart"),
+            "dateEnd": data.get("dateEnd"),
+            "resultData": {
+                "electricTotal": 0.0,
+                "costTotal": "0.00",
+                "durationTotal": 0,
+                "electricCurve": {h: "0.00" for h in hours},
+                "costCurve": {h: "0.00" for h in hours},
+                "coolingCurve": {h: "0" for h in hours},
+                "heatingCurve": {h: "0" for h in hours},
+            },
+        })
+
+    async def energy_consumption_curve(self, request: web.Request) -> web.Response:
+        data, response = await self._gateway(request)
+        if response is not None:
+            return response
+        assert data is not None
+        if data.get("puid") not in self.appliances:
+            return _error(UNKNOWN_DEVICE, f"Unknown puid {data.get('puid')}")
+        curve: dict[str, str] = {}
+        try:
+            day = dt.date.fromisoformat(data["dateStart"])
+            end = dt.date.fromisoformat(data["dateEnd"])
+            while day <= end:
+                curve[day.isoformat()] = "1.0"
+                day += dt.timedelta(days=1)
+        except (KeyError, ValueError):
+            pass
+        return _ok({
+            "type": data.get("statType", "week"),
+            "deviceType": data.get("deviceType"),
+            "resultData": {
+                "electricUsage": f"{len(curve):.2f}",
+                "waterUsage": f"{len(curve) * 11:.2f}",
+                "normElectricUsage": "0.00",
+                "normWaterUsage": "0.00",
+                "runTimes": "0.00",
+                "cycles": len(curve),
+                "electricCurve": curve,
+                "waterCurve": {day: "11.0" for day in curve},
+                "programResult": [],
+                "energyPeriod": [],
+            },
+        })
+
+    async def get_stats(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        return web.json_response(dict(self.stats))
+
+    # -- Simulation -----------------------------------------------------------
+
+    def _chance(self, percent: float) -> bool:
+        return percent > 0 and self.random.uniform(0, 100) < percent
+
+    def _take_allowance(self) -> bool:
+        rate = self.config.rate_limit
+        if not rate:
+            return True
+        now = time.monotonic()
+        self._allowance = min(rate, self._allowance + (now - self._allowance_updated) * rate)
+        self._allowance_updated = now
+        if self._allowance < 1:
+            return False
+        self._allowance -= 1
+        return True
+
+    def _simulate_activity(self) -> None:
+        for appliance in self.appliances.values():
+            status_list = appliance["statusList"]
+            if status_list and self._chance(self.config.change_rate):
+                name = self.random.choice(list(status_list))
+                value = status_list[name]
+                if value.lstrip("-").isdigit():
+                    status_list[name] = str(int(value) ^ 1)
+
+
+def main(args: argparse.Namespace) -> None:
+    config = CloudConfig(
+        devices=args.devices,
+        seed=args.seed,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        timeout_rate=args.timeout_rate,
+        timeout=args.timeout,
+        auth_error_rate=args.auth_error_rate,
+        token_lifetime=args.token_lifetime,
+        rate_limit=args.rate_limit,
+        change_rate=args.change_rate,
+    )
+    cloud = FakeCloud(config)
+    print(f"Serving {len(cloud.appliances)} appliances: {json.dumps(vars(args))}")
+    web.run_app(cloud.app(), port=args.port)
+
+
+if __name__ == "__main__":
+    defaults = CloudConfig()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", "--port", type=int, default=8080)
+    parser.add_argument("-n", "--devices", type=int, default=defaults.devices, help="number of appliances")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="seed for all random decisions")
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="gateway latency in seconds")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="extra random latency, up to seconds")
+    parser.add_argument("--failure-rate", type=float, default=defaults.failure_rate,
+                        help="%% of gateway requests failing with HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=defaults.timeout_rate,
+                        help="%% of gateway requests hanging for --timeout seconds")
+    parser.add_argument("--timeout", type=float, default=defaults.timeout)
+    parser.add_argument("--auth-error-rate", type=float, default=defaults.auth_error_rate,
+                        help="%% of logins rejected")
+    parser.add_argument("--token-lifetime", type=int, default=defaults.token_lifetime,
+                        help="access token lifetime in seconds (the client renews 90 seconds early)")
+    parser.add_argument("--rate-limit", type=float, default=defaults.rate_limit,
+                        help="gateway requests per second before HTTP 429 (0 = unlimited)")
+    parser.add_argument("--change-rate", type=float, default=defaults.change_rate,
+                        help="%% of appliances changing a property between polls")
+    main(parser.parse_args())
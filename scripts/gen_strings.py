@@ -55,7 +55,17 @@ def main(basedir):
         strings = json.load(f)
     # Entities not created based on status_list properties
     valid_properties = {
-        "sensor": {"daily_energy_kwh", "daily_water_consumption"},
+        "sensor": {
+            "daily_energy_kwh",
+            "daily_water_consumption",
+            # Diagnostic sensors of the config entry
+            "api_calls_per_minute",
+            "last_poll_duration",
+            "median_command_latency",
+            "poll_success_rate",
+            "queued_commands",
+            "statistics_cycle_duration",
+        },
         "binary_sensor": {"offline_state"},
     }
     valid_options = {}
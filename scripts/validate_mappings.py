@@ -9,7 +9,7 @@ import yaml
 from homeassistant.components.climate import HVACAction
 
 from custom_components.connectlife.climate import HVAC_MODE_ALIASES, HVAC_MODE_VALUES
-from custom_components.connectlife.dictionaries import _merge_property
+from custom_components.connectlife.dictionaries import PROPERTIES, _build, _merge_property, _resolve
 
 PLATFORMS = ('binary_sensor', 'climate', 'humidifier', 'number', 'select',
              'sensor', 'switch', 'water_heater')
@@ -114,6 +114,28 @@ CHECKS = (
 )
 
 
+def _check_dangling_references(filename):
+    """Properties read through ``unit: property.<name>``, button
+    ``available_when`` and climate presets must be declared in the merged
+    dictionary (base plus subtype). An undeclared unit property leaves the
+    literal ``property.<name>`` as the unit, and a typo in the others gates
+    the button or preset on a value that never arrives. ``combine`` sources
+    count as declared: they are the raw parts the combined sensor hides.
+    Returns one message per dangling reference."""
+    type_code, _, feature_code = filename.removesuffix('.yaml').partition('-')
+    _, raw = _resolve(type_code, feature_code)
+    declared = {entry['property'] for entry in raw[PROPERTIES]}
+    declared.update(
+        source['property'] for entry in raw[PROPERTIES] for source in entry.get('combine') or []
+    )
+    dictionary = _build(raw)
+    return [
+        f"{filename}: {key} depends on undeclared property '{name}'"
+        for key, names in sorted(dictionary.depends_on.items())
+        for name in sorted(names - declared)
+    ]
+
+
 def main(basedir):
     yaml.SafeLoader.construct_mapping_org = yaml.SafeLoader.construct_mapping
     yaml.SafeLoader.construct_mapping = my_construct_mapping
@@ -165,6 +187,10 @@ def main(basedir):
                     print(err)
                     errors.append(filename)
 
+        for err in _check_dangling_references(filename):
+            print(err)
+            errors.append(filename)
+
     if errors:
         sys.exit(1)
 
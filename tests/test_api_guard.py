@@ -0,0 +1,199 @@
+"""Tests for the gateway rate limiter and circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from connectlife.api import LifeConnectAuthError, LifeConnectError
+
+from custom_components.connectlife.api_guard import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    ApiGuard,
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    is_gateway_error,
+)
+from custom_components.connectlife.messages import GATEWAY_ERROR_PREFIX
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _gateway_error() -> LifeConnectError:
+    return LifeConnectError(f"{GATEWAY_ERROR_PREFIX}: code=1 description='busy'")
+
+
+# -- TokenBucket -------------------------------------------------------------
+
+
+async def test_burst_is_served_without_waiting():
+    bucket = TokenBucket(rate=0.001, burst=3)
+
+    for _ in range(3):
+        await asyncio.wait_for(bucket.acquire(), 0.1)
+
+    assert bucket.throttled == 0
+
+
+async def test_commands_are_served_before_waiting_polls():
+    bucket = TokenBucket(rate=100, burst=1)
+    await bucket.acquire()
+    order: list[str] = []
+
+    async def request(name: str, priority: int):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    polls = [asyncio.create_task(request(f"poll{i}", PRIORITY_BACKGROUND)) for i in range(2)]
+    await asyncio.sleep(0)
+    command = asyncio.create_task(request("command", PRIORITY_COMMAND))
+    await asyncio.gather(*polls, command)
+
+    assert order == ["command", "poll0", "poll1"]
+    assert bucket.throttled == 3
+
+
+async def test_cancelled_waiter_gives_up_its_place():
+    bucket = TokenBucket(rate=100, burst=1)
+    await bucket.acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket.waiting == 0
+
+
+async def test_token_handed_to_a_cancelled_waiter_is_returned():
+    clock = _Clock()
+    bucket = TokenBucket(rate=1, burst=1, clock=clock)
+    await bucket.acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+
+    clock.now = 1.0
+    bucket._timer.cancel()  # released by hand below
+    bucket._release()  # the token goes to the waiter ...
+    waiter.cancel()  # ... which is cancelled before it runs
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The token is still there for the next request.
+    await asyncio.wait_for(bucket.acquire(), 0.1)
+    assert bucket.throttled == 1
+
+
+# -- CircuitBreaker ----------------------------------------------------------
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock)
+
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()  # a success resets the count
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_lets_one_probe_through():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 60
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+
+    breaker.record_failure()  # probe failed: open for another reset_timeout
+    assert breaker.state == CIRCUIT_OPEN
+    clock.now = 120
+    breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.trips == 1
+
+
+def test_only_gateway_failures_count():
+    assert is_gateway_error(_gateway_error())
+    assert is_gateway_error(LifeConnectError("Unexpected response", status=503))
+    assert is_gateway_error(LifeConnectError("Unexpected response", status=429))
+    assert not is_gateway_error(LifeConnectAuthError(f"{GATEWAY_ERROR_PREFIX}: code=100026"))
+    assert not is_gateway_error(LifeConnectError("Unexpected response", status=400))
+    assert not is_gateway_error(TimeoutError())
+
+
+# -- ApiGuard ----------------------------------------------------------------
+
+
+async def test_guard_opens_on_gateway_errors_and_recovers():
+    clock = _Clock()
+    guard = ApiGuard(
+        TokenBucket(rate=0),
+        CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock),
+    )
+    calls: list[str] = []
+
+    async def failing():
+        calls.append("failing")
+        raise _gateway_error()
+
+    async def working():
+        calls.append("working")
+        return "ok"
+
+    for _ in range(2):
+        with pytest.raises(LifeConnectError):
+            await guard.call(PRIORITY_BACKGROUND, failing)
+    with pytest.raises(CircuitOpenError):
+        await guard.call(PRIORITY_COMMAND, working)
+    assert calls == ["failing", "failing"]
+
+    clock.now = 30
+    assert await guard.call(PRIORITY_COMMAND, working) == "ok"
+    assert guard.as_dict()["circuit"] == CIRCUIT_CLOSED
+
+
+async def test_guard_releases_probe_on_unrelated_errors():
+    clock = _Clock()
+    guard = ApiGuard(
+        TokenBucket(rate=0),
+        CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock),
+    )
+
+    async def fail(err: Exception):
+        raise err
+
+    with pytest.raises(LifeConnectError):
+        await guard.call(PRIORITY_BACKGROUND, fail, _gateway_error())
+    clock.now = 30
+    with pytest.raises(TimeoutError):
+        await guard.call(PRIORITY_BACKGROUND, fail, TimeoutError())
+
+    # The timed-out probe neither closed nor re-opened the circuit.
+    assert guard.breaker.state == CIRCUIT_HALF_OPEN
+    with pytest.raises(LifeConnectError):
+        await guard.call(PRIORITY_BACKGROUND, fail, _gateway_error())
+    assert guard.breaker.state == CIRCUIT_OPEN
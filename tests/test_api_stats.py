@@ -0,0 +1,67 @@
+"""Tests for the API call statistics."""
+
+from __future__ import annotations
+
+import pytest
+from connectlife.api import LifeConnectError
+
+from custom_components.connectlife.api_guard import PRIORITY_BACKGROUND, ApiGuard, TokenBucket
+from custom_components.connectlife.api_stats import ApiStats, LatencyHistogram
+from custom_components.connectlife.messages import ERROR_GATEWAY, ERROR_TIMEOUT, GATEWAY_ERROR_PREFIX
+
+
+def test_histogram_covers_a_rolling_window():
+    histogram = LatencyHistogram(window=4)
+    for seconds in (0.1, 0.2, 3.0, 40.0, 0.4, 0.3):
+        histogram.record(seconds)
+
+    stats = histogram.as_dict()
+
+    assert stats["calls"] == 6
+    assert stats["window"] == 4
+    assert stats["max"] == 40.0
+    assert stats["buckets"]["<=0.5s"] == 2
+    assert stats["buckets"]["<=5.0s"] == 1
+    assert stats["buckets"][">30.0s"] == 1
+
+
+def test_errors_are_counted_by_retry_message_category():
+    stats = ApiStats()
+    stats.record("get_appliances", 30.0, TimeoutError())
+    stats.record("get_appliances", 0.5, LifeConnectError(f"{GATEWAY_ERROR_PREFIX}: code=1"))
+    stats.record("update_appliance", 0.2)
+
+    assert stats.as_dict()["errors"] == {ERROR_TIMEOUT: 1, ERROR_GATEWAY: 1}
+    assert set(stats.as_dict()["latency"]) == {"get_appliances", "update_appliance"}
+
+
+def test_calls_per_minute_counts_the_last_minute():
+    now = [0.0]
+    stats = ApiStats(clock=lambda: now[0])
+    for _ in range(3):
+        stats.record("get_appliances", 0.1)
+    now[0] = 30
+    stats.record("update_appliance", 0.1)
+
+    assert stats.calls_per_minute() == 4
+    now[0] = 61
+    assert stats.calls_per_minute() == 1
+
+
+async def test_guard_records_calls_by_method_name():
+    guard = ApiGuard(TokenBucket(rate=0))
+
+    async def get_appliances():
+        return []
+
+    async def fetch():
+        raise TimeoutError
+
+    await guard.call(PRIORITY_BACKGROUND, get_appliances)
+    with pytest.raises(TimeoutError):
+        await guard.call(PRIORITY_BACKGROUND, fetch, name="get_air_duct_energy")
+
+    api = guard.as_dict()
+    assert api["latency"]["get_appliances"]["calls"] == 1
+    assert api["latency"]["get_air_duct_energy"]["calls"] == 1
+    assert api["errors"] == {ERROR_TIMEOUT: 1}
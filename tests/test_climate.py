@@ -12,6 +12,7 @@ from homeassistant.components.climate import (
 
 from custom_components.connectlife.climate import (
     ConnectLifeClimate,
+    PresetIndex,
     _add_hvac_mode_mapping,
     is_climate,
 )
@@ -307,3 +308,40 @@ def test_disabled_climate_property_is_not_exposed() -> None:
     # ... but the disabled swing axis is not exposed.
     assert "swing_mode" not in climate.target_map
     assert not climate._attr_supported_features & ClimateEntityFeature.SWING_MODE
+
+
+PRESETS = {
+    "eco": {"t_eco": 1},
+    "eco_quiet": {"t_eco": 1, "t_fan_mute": 1},
+    "sleep": {"t_sleep": 1},
+}
+
+
+def test_preset_index_prefers_first_matching_preset() -> None:
+    index = PresetIndex(PRESETS)
+
+    assert index.match({"t_eco": 1, "t_fan_mute": 1, "t_sleep": 0}) == "eco"
+    assert index.match({"t_eco": 0, "t_fan_mute": 1, "t_sleep": 1}) == "sleep"
+    assert index.match({"t_eco": 0, "t_fan_mute": 0, "t_sleep": 0}) is None
+    assert index.match({}) is None
+
+
+def test_preset_index_keeps_current_preset_while_it_matches() -> None:
+    index = PresetIndex(PRESETS)
+    status_list = {"t_eco": 1, "t_fan_mute": 1, "t_sleep": 0}
+
+    assert index.match(status_list, "eco_quiet") == "eco_quiet"
+    assert index.match({**status_list, "t_fan_mute": 0}, "eco_quiet") == "eco"
+    assert index.match(status_list, "sleep") == "eco"
+    assert index.match(status_list, "unknown") == "eco"
+
+
+def test_preset_index_matches_again_only_when_preset_properties_change() -> None:
+    index = PresetIndex(PRESETS)
+    status_list = {"t_eco": 1, "t_fan_mute": 0, "t_sleep": 0, "t_temp": 21}
+
+    assert index.match(status_list) == "eco"
+    matched = index._values
+    assert index.match({**status_list, "t_temp": 22}) == "eco"
+    assert index._values is matched
+    assert index.match({**status_list, "t_eco": 0}) is None
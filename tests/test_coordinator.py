@@ -0,0 +1,605 @@
+"""Tests for the appliance coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from connectlife.api import LifeConnectError
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from custom_components.connectlife.coordinator import (
+    COMMAND_COALESCE_DELAY,
+    COMMAND_HISTORY,
+    POLL_HISTORY,
+    ConnectLifeCoordinator,
+    DeviceSubscription,
+    changed_properties,
+)
+from custom_components.connectlife.scheduler import RECOVERY_PROBE_DELAY, PollScheduler
+from custom_components.connectlife.sensor import DIAGNOSTIC_SENSORS, ConnectLifeDiagnosticSensor
+from custom_components.connectlife.utils import changed_device_options
+
+
+def _appliance(device_id: str, status_list: dict, offline_state: int = 1):
+    return SimpleNamespace(
+        device_id=device_id,
+        device_nickname=f"Device {device_id}",
+        puid=f"puid-{device_id}",
+        offline_state=offline_state,
+        status_list=status_list,
+    )
+
+
+_COORDINATORS: list[ConnectLifeCoordinator] = []
+
+
+@pytest.fixture(autouse=True)
+def _cancel_confirmation_timers():
+    """Commands schedule a confirmation refresh; cancel it before the lingering timer check."""
+    yield
+    while _COORDINATORS:
+        timer = _COORDINATORS.pop()._confirmation_timer
+        if timer is not None:
+            timer.cancel()
+
+
+def _coordinator(data: dict) -> ConnectLifeCoordinator:
+    # Bypass DataUpdateCoordinator.__init__ (needs hass); dispatch only uses
+    # self._listeners and the pending changes.
+    coord = ConnectLifeCoordinator.__new__(ConnectLifeCoordinator)
+    coord.data = data
+    coord._listeners = {}
+    coord.scheduler = PollScheduler()
+    coord._command_batches = {}
+    coord._command_locks = {}
+    coord._unconfirmed = {}
+    coord._confirmations_due = {}
+    coord._confirmation_retries = {}
+    coord._entity_plans = {}
+    coord._poll_results = deque(maxlen=POLL_HISTORY)
+    coord._command_latencies = deque(maxlen=COMMAND_HISTORY)
+    coord._schedule_refresh = lambda: None  # type: ignore[method-assign]
+    _COORDINATORS.append(coord)
+    return coord
+
+
+def _with_api(coord: ConnectLifeCoordinator, error: Exception | None = None) -> list[tuple[str, dict]]:
+    """Attach a fake API (and the running loop as hass) recording update_appliance calls."""
+    sent: list[tuple[str, dict]] = []
+
+    async def update_appliance(puid, command):
+        sent.append((puid, command))
+        if error is not None:
+            raise error
+
+    loop = asyncio.get_running_loop()
+    coord.hass = SimpleNamespace(  # type: ignore[assignment]
+        loop=loop,
+        async_create_task=lambda target, name=None: loop.create_task(target),
+    )
+    coord.api = SimpleNamespace(update_appliance=update_appliance)  # type: ignore[assignment]
+    return sent
+
+
+def _listen(coord: ConnectLifeCoordinator, subscription: DeviceSubscription | None) -> list[int]:
+    calls: list[int] = []
+    coord._listeners[object()] = (lambda: calls.append(1), subscription)
+    return calls
+
+
+# -- changed_properties ----------------------------------------------------
+
+
+def test_changed_properties_without_previous_snapshot_is_none():
+    assert changed_properties(None, {"a": _appliance("a", {"p": 1})}) is None
+
+
+def test_changed_properties_reports_changed_added_and_removed_properties():
+    previous = {"a": _appliance("a", {"p": 1, "q": 2, "gone": 3})}
+    current = {"a": _appliance("a", {"p": 1, "q": 5, "new": 0})}
+
+    assert changed_properties(previous, current) == {"a": {"q", "new", "gone"}}
+
+
+def test_changed_properties_omits_unchanged_devices():
+    previous = {"a": _appliance("a", {"p": 1})}
+    current = {"a": _appliance("a", {"p": 1})}
+
+    assert changed_properties(previous, current) == {}
+
+
+def test_changed_properties_whole_device_on_offline_added_or_removed():
+    previous = {
+        "a": _appliance("a", {"p": 1}),
+        "gone": _appliance("gone", {}),
+    }
+    current = {
+        "a": _appliance("a", {"p": 1}, offline_state=0),
+        "new": _appliance("new", {}),
+    }
+
+    assert changed_properties(previous, current) == {"a": None, "gone": None, "new": None}
+
+
+# -- DeviceSubscription ----------------------------------------------------
+
+
+def test_subscription_without_watch_follows_whole_device():
+    subscription = DeviceSubscription("a")
+
+    assert subscription.affected_by({"a": {"anything"}})
+    assert not subscription.affected_by({"b": None})
+
+
+def test_subscription_only_affected_by_watched_properties():
+    subscription = DeviceSubscription("a")
+    subscription.watch("p", "q")
+
+    assert subscription.affected_by({"a": {"q"}})
+    assert not subscription.affected_by({"a": {"r"}})
+    assert subscription.affected_by({"a": None})
+
+
+def test_empty_watch_only_follows_device_level_changes():
+    subscription = DeviceSubscription("a")
+    subscription.watch()
+
+    assert not subscription.affected_by({"a": {"p"}})
+    assert subscription.affected_by({"a": None})
+
+
+# -- listener dispatch -----------------------------------------------------
+
+
+def test_dispatch_skips_listeners_whose_properties_did_not_change():
+    coord = _coordinator({})
+    watching_p = DeviceSubscription("a")
+    watching_p.watch("p")
+    watching_q = DeviceSubscription("a")
+    watching_q.watch("q")
+    p_calls = _listen(coord, watching_p)
+    q_calls = _listen(coord, watching_q)
+    other_calls = _listen(coord, None)
+
+    coord._pending_changes = {"a": {"p"}}
+    coord.async_update_listeners()
+
+    assert p_calls == [1]
+    assert q_calls == []
+    assert other_calls == [1]  # listeners without a subscription always update
+    assert coord.updates_delivered == 2
+    assert coord.updates_skipped == 1
+
+
+def test_dispatch_without_pending_changes_notifies_everyone():
+    coord = _coordinator({})
+    subscription = DeviceSubscription("a")
+    subscription.watch("p")
+    calls = _listen(coord, subscription)
+
+    coord.async_update_listeners()
+
+    assert calls == [1]
+
+
+def test_dispatch_wakes_the_entities_the_dependency_graph_lists(build_dictionary):
+    coord = _coordinator({})
+    dictionary = build_dictionary(sub={"properties": [
+        {"property": "t_temp_type"},
+        {"property": "f_temp", "sensor": {"unit": "property.t_temp_type"}},
+    ]})
+    coord._entity_plans = {"a": SimpleNamespace(dictionary=dictionary)}  # type: ignore[dict-item]
+    following = DeviceSubscription("a")
+    following.follow("sensor.f_temp", "f_temp")
+    other = DeviceSubscription("a")
+    other.follow("sensor.t_temp_type", "t_temp_type")
+    calls = _listen(coord, following)
+    other_calls = _listen(coord, other)
+
+    # The unit source changed, not the value.
+    coord._pending_changes = {"a": {"t_temp_type"}}
+    coord.async_update_listeners()
+    coord._pending_changes = {"a": {"f_other"}}
+    coord.async_update_listeners()
+
+    assert calls == [1]
+    assert other_calls == [1]
+
+
+async def test_update_device_notifies_only_written_properties():
+    appliance = _appliance("a", {"p": 0, "q": 0})
+    coord = _coordinator({"a": appliance})
+    sent = _with_api(coord)
+    watching_p = DeviceSubscription("a")
+    watching_p.watch("p")
+    watching_q = DeviceSubscription("a")
+    watching_q.watch("q")
+    p_calls = _listen(coord, watching_p)
+    q_calls = _listen(coord, watching_q)
+
+    await coord.async_update_device("a", {"p": 1}, {"p": 1})
+
+    assert sent == [("puid-a", {"p": "1"})]
+    assert appliance.status_list == {"p": 1, "q": 0}
+    assert p_calls == [1]
+    assert q_calls == []
+
+
+# -- command coalescing ----------------------------------------------------
+
+
+async def test_concurrent_commands_are_sent_as_one_update():
+    appliance = _appliance("a", {"p": 0, "q": 0})
+    coord = _coordinator({"a": appliance})
+    sent = _with_api(coord)
+
+    await asyncio.gather(
+        coord.async_update_device("a", {"p": 1}, {"p": 1}),
+        coord.async_update_device("a", {"q": 2}, {"q": 2}),
+        coord.async_update_device("a", {"p": 3}, {"p": 3}),
+    )
+
+    # One round trip; the later value for p supersedes the earlier one.
+    assert sent == [("puid-a", {"p": "3", "q": "2"})]
+    assert appliance.status_list == {"p": 3, "q": 2}
+
+
+async def test_commands_for_different_devices_are_not_merged():
+    coord = _coordinator({"a": _appliance("a", {}), "b": _appliance("b", {})})
+    sent = _with_api(coord)
+
+    await asyncio.gather(
+        coord.async_update_device("a", {"p": 1}, {}),
+        coord.async_update_device("b", {"p": 1}, {}),
+    )
+
+    assert sorted(sent) == [("puid-a", {"p": "1"}), ("puid-b", {"p": "1"})]
+
+
+async def test_shutdown_drops_unsent_commands():
+    coord = _coordinator({"a": _appliance("a", {"p": 0})})
+    sent = _with_api(coord)
+    command = asyncio.ensure_future(coord.async_update_device("a", {"p": 1}, {"p": 1}))
+    await asyncio.sleep(0)  # queued, waiting for the coalescing delay
+
+    with patch.object(DataUpdateCoordinator, "async_shutdown", AsyncMock()):
+        await coord.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await command
+    assert coord._command_batches == {}
+    await asyncio.sleep(COMMAND_COALESCE_DELAY * 2)
+    assert sent == []
+
+
+async def test_commands_with_different_beep_are_sent_separately_in_order():
+    coord = _coordinator({"a": _appliance("a", {})})
+    sent = _with_api(coord)
+
+    await asyncio.gather(
+        coord.async_update_device("a", {"p": 1, "t_beep": 0}, {}),
+        coord.async_update_device("a", {"q": 1}, {}),
+    )
+
+    assert sent == [("puid-a", {"p": "1", "t_beep": "0"}), ("puid-a", {"q": "1"})]
+
+
+async def test_failed_update_is_raised_to_every_caller():
+    appliance = _appliance("a", {"p": 0})
+    coord = _coordinator({"a": appliance})
+    _with_api(coord, LifeConnectError("rejected"))
+
+    results = await asyncio.gather(
+        coord.async_update_device("a", {"p": 1}, {"p": 1}),
+        coord.async_update_device("a", {"p": 2}, {"p": 2}),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, LifeConnectError) for r in results)
+    assert appliance.status_list == {"p": 0}  # nothing applied optimistically
+
+
+async def test_single_command_error_propagates():
+    coord = _coordinator({"a": _appliance("a", {})})
+    _with_api(coord, LifeConnectError("rejected"))
+
+    with pytest.raises(LifeConnectError):
+        await coord.async_update_device("a", {"p": 1}, {})
+
+
+# -- failure backoff -------------------------------------------------------
+
+
+async def test_failed_polls_back_off_and_success_resets():
+    coord = _coordinator({})
+    coord.error_count = 0
+    coord.last_update_success = True
+    error: Exception | None = LifeConnectError("Unexpected response from HijuConn gateway")
+
+    async def get_appliances():
+        if error is not None:
+            raise error
+
+    coord.api = SimpleNamespace(get_appliances=get_appliances, appliances=[])  # type: ignore[assignment]
+
+    await coord._async_update_data()
+    assert coord.scheduler.failures == 1
+    assert coord.update_interval is not None
+    assert coord.update_interval.total_seconds() <= RECOVERY_PROBE_DELAY
+
+    error = None
+    await coord._async_update_data()
+    assert coord.scheduler.failures == 0
+
+
+# -- refresh coalescing ----------------------------------------------------
+
+
+def _with_polls(coord: ConnectLifeCoordinator) -> tuple[list[int], asyncio.Event]:
+    """Attach a fake API whose get_appliances waits for the returned event."""
+    polls: list[int] = []
+    release = asyncio.Event()
+    appliance = _appliance("a", {"t_power": "0"})
+
+    async def get_appliances():
+        polls.append(1)
+        await release.wait()
+        appliance.status_list = {"t_power": str(len(polls))}
+
+    coord.error_count = 0
+    coord.last_update_success = True
+    coord.api = SimpleNamespace(get_appliances=get_appliances, appliances=[appliance])  # type: ignore[assignment]
+    return polls, release
+
+
+async def test_poll_reused_from_another_entry_is_not_counted_as_a_poll():
+    appliance = _appliance("a", {"t_power": "1"})
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0"})})
+    coord.error_count = 0
+    coord.last_update_success = True
+    coord.api = SimpleNamespace(appliances=[appliance])  # type: ignore[assignment]
+
+    async def async_get_appliances():
+        return coord.api.appliances, True
+
+    coord.session = SimpleNamespace(async_get_appliances=async_get_appliances)  # type: ignore[assignment]
+
+    data = await coord._async_update_data()
+
+    assert data == {"a": appliance}
+    assert coord._pending_changes == {"a": {"t_power"}}
+    assert coord.scheduler.as_dict()["polls_last_hour"] == 0
+    assert coord.polls_completed == 0
+    assert coord.poll_success_rate is None
+    assert coord._fetched_at is None
+
+
+async def test_concurrent_refreshes_share_one_fetch():
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0"})})
+    polls, release = _with_polls(coord)
+
+    refreshes = [asyncio.create_task(coord._async_update_data()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*refreshes)
+
+    assert polls == [1]
+    assert all(result is results[0] for result in results)
+    assert coord.refreshes_coalesced == 2
+    # Only the refresh that fetched reports the change.
+    assert coord._pending_changes == {}
+
+
+async def test_refresh_right_after_a_fetch_reuses_its_data():
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0"})})
+    polls, release = _with_polls(coord)
+    release.set()
+
+    coord.data = await coord._async_update_data()
+    assert await coord._async_update_data() is coord.data
+    assert polls == [1]
+
+    coord._fetched_at = 0.0  # long ago
+    await coord._async_update_data()
+    assert polls == [1, 1]
+
+
+# -- command confirmation --------------------------------------------------
+
+
+async def test_confirmation_refresh_keeps_applied_and_rolls_back_ignored_values():
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0", "t_temp": "20"})})
+    _with_api(coord)
+    refreshes: list[int] = []
+
+    async def async_refresh():
+        refreshes.append(1)
+
+    coord.async_refresh = async_refresh  # type: ignore[method-assign]
+    coord.error_count = 0
+    coord.last_update_success = True
+    await asyncio.gather(
+        coord.async_update_device("a", {"t_power": 1}, {"t_power": 1}),
+        coord.async_update_device("a", {"t_temp": 25}, {"t_temp": 25}),
+    )
+    assert coord.data["a"].status_list == {"t_power": 1, "t_temp": 25}
+    assert coord._confirmation_timer is not None
+
+    coord._confirmation_timer.cancel()
+    coord._async_confirm()
+    await asyncio.sleep(0)
+    assert refreshes == [1]
+
+    # The device turned on but kept its temperature.
+    reported = _appliance("a", {"t_power": "1", "t_temp": "20"})
+
+    async def get_appliances():
+        pass
+
+    coord.api = SimpleNamespace(get_appliances=get_appliances, appliances=[reported])  # type: ignore[assignment]
+    listener = _listen(coord, DeviceSubscription("a"))
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+
+    assert coord.commands_confirmed == 1
+    assert coord.commands_rolled_back == 0
+    assert coord.last_confirmation_latency is not None
+    assert coord.data["a"].status_list["t_temp"] == "20"
+    assert listener == [1]
+    assert coord._confirmations_due == {}
+
+    # Still not applied by the next poll.
+    coord._fetched_at = None
+    coord.data = await coord._async_update_data()
+
+    assert coord.commands_confirmed == 1
+    assert coord.commands_rolled_back == 1
+    assert coord._confirmation_retries == {}
+
+
+async def test_value_applied_by_the_next_poll_is_confirmed():
+    coord = _coordinator({"a": _appliance("a", {"t_temp": "20"})})
+    coord.error_count = 0
+    coord.last_update_success = True
+    coord._confirmations_due = {"a": {"t_temp": (25, 0.0)}}
+    reported = [_appliance("a", {"t_temp": "20"})]
+
+    async def get_appliances():
+        pass
+
+    coord.api = SimpleNamespace(get_appliances=get_appliances, appliances=reported)  # type: ignore[assignment]
+    await coord._async_update_data()
+    assert coord._confirmation_retries == {"a": {"t_temp": (25, 0.0)}}
+
+    reported[0] = _appliance("a", {"t_temp": "25"})
+    coord._fetched_at = None
+    await coord._async_update_data()
+
+    assert coord.commands_confirmed == 1
+    assert coord.commands_rolled_back == 0
+    assert coord._confirmation_retries == {}
+
+
+async def test_new_command_replaces_a_value_awaiting_its_retry():
+    coord = _coordinator({"a": _appliance("a", {"t_temp": "20"})})
+    _with_api(coord)
+    coord._confirmation_retries = {"a": {"t_temp": (25, 0.0)}}
+
+    await coord.async_update_device("a", {"t_temp": 22}, {"t_temp": 22})
+
+    assert coord._confirmation_retries == {"a": {}}
+    assert coord._unconfirmed["a"]["t_temp"][0] == 22
+
+
+async def test_confirmation_waits_for_a_successful_fetch():
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0"})})
+    coord.error_count = 0
+    coord.last_update_success = True
+    coord._confirmations_due = {"a": {"t_power": (1, 0.0)}}
+
+    async def get_appliances():
+        raise LifeConnectError("Unexpected response from HijuConn gateway")
+
+    coord.api = SimpleNamespace(get_appliances=get_appliances, appliances=[])  # type: ignore[assignment]
+    await coord._async_update_data()
+
+    assert coord._confirmations_due == {"a": {"t_power": (1, 0.0)}}
+    assert coord.commands_rolled_back == 0
+
+
+# -- health metrics --------------------------------------------------------
+
+
+async def test_poll_success_rate_and_command_latency():
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0"})})
+    _with_api(coord)
+    assert coord.poll_success_rate is None
+    assert coord.median_command_latency is None
+
+    coord._poll_results.extend([True, True, True, False])
+    assert coord.poll_success_rate == 75.0
+
+    command = asyncio.create_task(coord.async_update_device("a", {"t_power": 1}, {"t_power": 1}))
+    await asyncio.sleep(0)
+    assert coord.commands_queued == 1
+    await command
+
+    assert coord.commands_queued == 0
+    assert coord.median_command_latency is not None
+
+
+async def test_queued_commands_sensor_returns_to_zero_after_the_command():
+    coord = _coordinator({"a": _appliance("a", {"t_power": "0"})})
+    _with_api(coord)
+    coord.entities = {}
+    description = next(d for d in DIAGNOSTIC_SENSORS if d.key == "queued_commands")
+    sensor = ConnectLifeDiagnosticSensor(
+        coord, None, SimpleNamespace(entry_id="entry", title="Account"), description  # type: ignore[arg-type]
+    )
+    writes: list[object] = []
+
+    with patch.object(Entity, "async_write_ha_state", lambda self: writes.append(self.native_value)):
+        command = asyncio.create_task(coord.async_update_device("a", {"t_power": 1}, {"t_power": 1}))
+        await asyncio.sleep(0)
+        sensor._async_refresh(dt_util.utcnow())
+        assert writes == [1]
+
+        await command
+        sensor._async_refresh(dt_util.utcnow())
+        sensor._async_refresh(dt_util.utcnow())
+
+    assert sensor.native_value == 0
+    assert writes == [1, 0]
+
+
+# -- per-device rebuild ----------------------------------------------------
+
+
+class _Entity:
+    def __init__(self, unique_id: str):
+        self.unique_id = unique_id
+        self.hass = object()
+        self.removed = False
+
+    async def async_remove(self):
+        self.removed = True
+
+
+def test_changed_device_options():
+    old = {"poll_budget": 240, "devices": {"a": {"disable_beep": False}, "b": {}}}
+
+    assert changed_device_options(old, {**old, "devices": {"a": {"disable_beep": True}, "b": {}}}) == {"a"}
+    assert changed_device_options(old, {**old, "devices": {"a": {"disable_beep": False}}}) == set()
+    assert changed_device_options(old, {**old, "poll_budget": 120}) is None
+
+
+async def test_rebuild_device_recreates_only_its_entities():
+    coord = _coordinator({"a": _appliance("a", {}), "b": _appliance("b", {})})
+    coord.entities = {}
+    coord._entity_plans = {"a": object(), "b": object()}  # type: ignore[dict-item]
+    coord._entity_factories = []
+    coord._device_entities = {}
+    coord._remove_unmapped_entities = lambda only_device_id=None: None  # type: ignore[method-assign]
+    generation = 0
+    added: list[list[_Entity]] = []
+
+    def factory(appliance):
+        coord.entities[f"{appliance.device_id}-{generation}"] = "sensor"  # type: ignore[assignment]
+        return [_Entity(f"{appliance.device_id}-{generation}")]
+
+    coord.async_add_entity_factory(factory, added.append)  # type: ignore[arg-type]
+    old_a, old_b = added[0]
+
+    generation = 1
+    await coord.async_rebuild_device("a")
+
+    assert old_a.removed and not old_b.removed
+    assert [e.unique_id for e in added[1]] == ["a-1"]
+    assert set(coord.entities) == {"a-1", "b-0"}
+    assert "a" not in coord._entity_plans and "b" in coord._entity_plans
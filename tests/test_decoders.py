@@ -0,0 +1,80 @@
+"""Tests for the compiled per-property value decoders."""
+
+from __future__ import annotations
+
+from custom_components.connectlife.decoders import (
+    MISSING,
+    combine_decoder,
+    enum_decoder,
+    mapped_decoder,
+    select_decoder,
+    switch_decoder,
+    value_decoder,
+)
+
+
+def test_value_decoder_missing_property_keeps_state():
+    assert value_decoder("p")({}) is MISSING
+    assert value_decoder("p", unknown_value=255, multiplier=0.5)({}) is MISSING
+
+
+def test_value_decoder_unknown_value_and_multiplier():
+    decode = value_decoder("p", unknown_value=255, multiplier=0.5)
+
+    assert decode({"p": 255}) is None
+    assert decode({"p": 10}) == 5.0
+    assert value_decoder("p")({"p": 7}) == 7
+    assert value_decoder("p", unknown_value=0)({"p": 0}) is None
+
+
+def test_enum_decoder_maps_and_reports_unexpected_values():
+    options = {0: "off", 1: "on"}
+    unexpected = []
+
+    def on_unexpected(value):
+        unexpected.append(value)
+        options[value] = str(value)
+        return str(value)
+
+    decode = enum_decoder("p", options, on_unexpected, unknown_value=255)
+
+    assert decode({"p": 1}) == "on"
+    assert decode({"p": 255}) is None
+    assert decode({"p": 7}) == "7"
+    assert decode({"p": 7}) == "7"
+    assert unexpected == [7]  # later updates find it in the extended map
+
+
+def test_combine_decoder_sums_sources():
+    sources = [
+        {"property": "a"},
+        {"property": "b", "multiplier": 10, "unknown_value": 255},
+    ]
+    decode = combine_decoder("total", sources, value_decoder("total"), multiplier=0.5)
+
+    assert decode({"a": 1, "b": 2}) == 10.5
+    assert decode({"a": 1, "b": 255}) == 0.5  # unknown source skipped
+    assert decode({}) is None  # neither sources nor own value
+    assert decode({"total": 4}) == 4  # falls back to own value
+
+
+def test_select_decoder():
+    decode = select_decoder("p", {0: "low", 1: "high"}, str, unknown_value=255)
+
+    assert decode({"p": 1}) == "high"
+    assert decode({"p": 255}) is None
+    assert decode({"p": 3}) == "3"
+    assert decode({}) is MISSING
+
+
+def test_switch_and_mapped_decoders():
+    unknown = []
+    switch = switch_decoder("p", on=1, off=0, on_unexpected=unknown.append)
+    binary = mapped_decoder("p", {0: False, 1: False, 2: True}, unknown.append)
+
+    assert switch({"p": 1}) is True
+    assert switch({"p": 0}) is False
+    assert switch({"p": 5}) is None
+    assert binary({"p": 2}) is True
+    assert binary({"p": 9}) is None
+    assert unknown == [5, 9]
@@ -0,0 +1,78 @@
+"""Tests for the diagnostics downloads."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from connectlife.appliance import ConnectLifeAppliance
+
+from custom_components.connectlife.const import DOMAIN
+from custom_components.connectlife.coordinator import ConnectLifeCoordinator
+from custom_components.connectlife.diagnostics import (
+    async_get_config_entry_diagnostics,
+    async_get_device_diagnostics,
+)
+from custom_components.connectlife.scheduler import PollScheduler
+
+
+def _appliance(device_id: str) -> ConnectLifeAppliance:
+    return ConnectLifeAppliance(None, {  # type: ignore[arg-type]
+        "wifiId": f"wifi-{device_id}",
+        "deviceId": device_id,
+        "puid": f"puid-{device_id}",
+        "deviceNickName": f"Device {device_id}",
+        "deviceFeatureCode": "000",
+        "deviceFeatureName": "000",
+        "deviceTypeCode": "003",
+        "deviceTypeName": "003",
+        "role": 1,
+        "roomId": 1,
+        "roomName": "Living room",
+        "offlineState": 1,
+        "seq": 1,
+        "bindTime": None,
+        "useTime": None,
+        "createTime": None,
+        "statusList": {"t_power": "1"},
+    })
+
+
+def _hass(data: dict) -> tuple[SimpleNamespace, SimpleNamespace]:
+    coordinator = ConnectLifeCoordinator.__new__(ConnectLifeCoordinator)
+    coordinator.data = data
+    coordinator.scheduler = PollScheduler()
+
+    async def async_add_executor_job(target, *args):
+        return target(*args)
+
+    hass = SimpleNamespace(
+        data={DOMAIN: {"entry": coordinator}},
+        async_add_executor_job=async_add_executor_job,
+    )
+    return hass, SimpleNamespace(entry_id="entry")
+
+
+async def test_config_entry_diagnostics_include_each_appliance_redacted():
+    hass, entry = _hass({"a": _appliance("a"), "b": _appliance("b")})
+
+    result = await async_get_config_entry_diagnostics(hass, entry)  # type: ignore[arg-type]
+
+    assert result["payload"]["devices"] == 2
+    assert len(result["appliances"]) == 2
+    device = result["appliances"][0]
+    assert device["appliance"]["status_list"] == {"t_power": 1}
+    assert device["appliance"]["device_type_code"] == "003"
+    for field in ("device_id", "puid", "wifi_id", "device_nickname", "room_name"):
+        assert device["appliance"][field] == "**REDACTED**"
+    assert device["dictionary"]["properties"]
+    assert device["polling"]["state"]
+
+
+async def test_device_diagnostics_match_the_config_entry_section():
+    hass, entry = _hass({"a": _appliance("a")})
+    device = SimpleNamespace(identifiers={(DOMAIN, "a")})
+
+    result = await async_get_device_diagnostics(hass, entry, device)  # type: ignore[arg-type]
+    entry_result = await async_get_config_entry_diagnostics(hass, entry)  # type: ignore[arg-type]
+
+    assert result == entry_result["appliances"][0]
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+from homeassistant.const import UnitOfTemperature
+
 from custom_components.connectlife.dictionaries import (
     Property,
     Sensor,
     _merge_property,
 )
+from custom_components.connectlife.utils import to_unit
 
 # Minimal property list so a parsed mapping is well-formed.
 _MINIMAL_PROPS = [{"property": "t_power", "switch": None}]
@@ -460,3 +465,53 @@ def test_statistics_block_replaced_by_feature_override(build_dictionary):
     )
     assert d.statistics_source == "energy_consumption_curve"
     assert d.statistics_sensors == {"daily_water_consumption": True}
+
+
+def test_dependency_graph_links_entities_to_the_properties_they_read(build_dictionary):
+    """`combine` sources, `property.<name>` units, button `available_when` and
+    climate presets all show up as dependencies, in both directions."""
+    d = build_dictionary(
+        sub={
+            "climate": {"presets": [{"t_eco": 1, "preset": "eco"}]},
+            "properties": [
+                {"property": "t_temp", "climate": {"target": "target_temperature"}},
+                {"property": "t_temp_type", "climate": {"target": "temperature_unit"}},
+                {"property": "t_eco", "switch": None},
+                {
+                    "property": "f_energy",
+                    "combine": [{"property": "f_energy_hi"}, {"property": "f_energy_lo"}],
+                },
+                {"property": "f_temp", "sensor": {"unit": "property.t_temp_type"}},
+            ],
+            "buttons": [{"key": "start", "available_when": {"t_power": 1}, "write": {"t_start": 1}}],
+        }
+    )
+
+    assert d.depends_on["climate"] == {"t_temp", "t_temp_type", "t_eco"}
+    assert d.depends_on["switch.t_eco"] == {"t_eco"}
+    assert d.depends_on["sensor.f_energy"] == {"f_energy", "f_energy_hi", "f_energy_lo"}
+    assert d.depends_on["sensor.f_temp"] == {"f_temp", "t_temp_type"}
+    assert d.depends_on["button.start"] == {"t_power"}
+    # Placeholders added for the combine sources are not entities of their own.
+    assert "sensor.f_energy_hi" not in d.depends_on
+
+    assert d.dependents["t_temp_type"] == {"climate", "sensor.f_temp"}
+    assert d.dependents["t_eco"] == {"climate", "switch.t_eco"}
+    assert d.dependents["f_energy_lo"] == {"sensor.f_energy"}
+
+
+def test_to_unit_resolves_plain_and_property_units(build_dictionary):
+    d = build_dictionary(
+        sub={
+            "properties": [
+                {"property": "t_temp_unit", "select": {"options": {0: "celsius", 1: "fahrenheit"}}},
+                {"property": "f_temp", "sensor": {"device_class": "temperature", "unit": "property.t_temp_unit"}},
+            ]
+        }
+    )
+    appliance = SimpleNamespace(status_list={"t_temp_unit": 1, "f_temp": 70})
+
+    assert to_unit(None, appliance, d) is None
+    assert to_unit("min", appliance, d) == "min"
+    assert to_unit("°C", appliance, d) == UnitOfTemperature.CELSIUS
+    assert to_unit("property.t_temp_unit", appliance, d) == UnitOfTemperature.FAHRENHEIT
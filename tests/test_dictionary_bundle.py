@@ -0,0 +1,93 @@
+"""Tests for the precompiled data dictionary bundle."""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import custom_components.connectlife.dictionaries as dictmod
+from custom_components.connectlife.dictionaries import (
+    BUNDLE_FILE,
+    Dictionaries,
+    _decode,
+    _encode,
+    compile_bundle,
+)
+
+
+@pytest.fixture
+def bundle():
+    with open(os.path.join(os.path.dirname(dictmod.__file__), BUNDLE_FILE)) as f:
+        return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def _reset_dictionaries():
+    Dictionaries.dictionaries.clear()
+    Dictionaries.bundle = None
+    yield
+    Dictionaries.dictionaries.clear()
+    Dictionaries.bundle = None
+
+
+def _appliance(key: str):
+    type_code, _, feature = key.partition("-")
+    return SimpleNamespace(
+        device_type_code=type_code,
+        device_feature_code=feature or "unknown",
+        device_nickname="test",
+    )
+
+
+def test_encode_preserves_non_string_keys():
+    value = {"options": {0: "off", 1: "on"}, "flags": {True: 1}, "list": [{2: None}]}
+
+    assert _decode(json.loads(json.dumps(_encode(value)))) == value
+
+
+def test_committed_bundle_is_up_to_date(bundle):
+    # Run `python -m scripts.compile_dictionaries` after changing a data dictionary.
+    # Each base file is parsed once here instead of once per subtype.
+    load_yaml = functools.cache(dictmod._load_yaml)
+    with patch.object(dictmod, "_load_yaml", side_effect=load_yaml):
+        compiled = compile_bundle()
+
+    assert bundle == json.loads(json.dumps(compiled))
+
+
+def test_bundle_matches_yaml(bundle):
+    # Builds every dictionary through both paths.
+    keys = list(bundle["dictionaries"]) + ["009-unknown"]
+
+    from_yaml = {k: Dictionaries.get_dictionary(_appliance(k)) for k in keys}
+
+    Dictionaries.dictionaries.clear()
+    assert Dictionaries.load_bundle()
+    from_bundle = {k: Dictionaries.get_dictionary(_appliance(k)) for k in keys}
+
+    for key in keys:
+        dictionary, expected = from_bundle[key], from_yaml[key]
+        assert dictionary.climate == expected.climate
+        assert dictionary.presets == expected.presets
+        assert dictionary.statistics_source == expected.statistics_source
+        assert dictionary.statistics_sensors == expected.statistics_sensors
+        assert [vars(b) for b in dictionary.buttons] == [vars(b) for b in expected.buttons]
+        assert dictionary.properties.keys() == expected.properties.keys()
+        for name, prop in dictionary.properties.items():
+            assert _vars(prop) == _vars(expected.properties[name]), (key, name)
+
+
+def _vars(obj):
+    return {k: vars(v) if hasattr(v, "__dict__") else v for k, v in vars(obj).items()}
+
+
+def test_stale_bundle_falls_back_to_yaml(monkeypatch):
+    monkeypatch.setattr(dictmod, "source_digest", lambda: "edited")
+
+    assert not Dictionaries.load_bundle()
+    assert Dictionaries.bundle is None
@@ -0,0 +1,169 @@
+"""Tests for the ConnectLife entity base class."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from homeassistant.const import UnitOfTemperature
+from homeassistant.helpers.entity import Entity
+
+from custom_components.connectlife import utils
+from custom_components.connectlife.dictionaries import Property
+from custom_components.connectlife.number import ConnectLifeNumberEntity
+from custom_components.connectlife.select import ConnectLifeSelect
+from custom_components.connectlife.sensor import ConnectLifeStatusSensor
+
+
+def _appliance(status_list: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        device_id="dev1",
+        device_nickname="AC",
+        device_feature_name="104",
+        device_type_code="009",
+        device_feature_code="104",
+        room_name="Kitchen",
+        offline_state=1,
+        status_list=status_list,
+    )
+
+
+def _coordinator(appliance: SimpleNamespace) -> SimpleNamespace:
+    return SimpleNamespace(
+        data={"dev1": appliance},
+        config_entry=SimpleNamespace(options={}, entry_id="e"),
+        hass=None,
+        last_update_success=True,
+        add_entity=lambda *a, **k: None,
+        writes_suppressed=0,
+    )
+
+
+def _select(status_list: dict):
+    appliance = _appliance(status_list)
+    coordinator = _coordinator(appliance)
+    prop = Property({"property": "t_fan", "select": {"options": {0: "low", 1: "high"}}})
+    return ConnectLifeSelect(coordinator, appliance, "t_fan", prop), appliance, coordinator
+
+
+def test_unchanged_state_is_not_written():
+    select, appliance, coordinator = _select({"t_fan": 0})
+    with patch.object(Entity, "async_write_ha_state") as write:
+        select.async_write_ha_state()  # as when the entity is added
+        select._handle_coordinator_update()
+        assert write.call_count == 1
+        assert coordinator.writes_suppressed == 1
+
+        appliance.status_list["t_fan"] = 1
+        select._handle_coordinator_update()
+        assert write.call_count == 2
+        assert select.current_option == "high"
+
+
+def test_availability_change_is_written():
+    select, appliance, coordinator = _select({"t_fan": 0})
+    with patch.object(Entity, "async_write_ha_state") as write:
+        select._handle_coordinator_update()
+        appliance.offline_state = 0
+        select._handle_coordinator_update()
+
+        assert write.call_count == 2
+        assert coordinator.writes_suppressed == 0
+
+
+def test_options_extended_in_update_are_written():
+    select, appliance, _ = _select({"t_fan": 0})
+    with patch.object(Entity, "async_write_ha_state") as write:
+        select._handle_coordinator_update()
+        appliance.status_list["t_fan"] = 7  # unexpected value adds an option
+        select._handle_coordinator_update()
+
+        assert write.call_count == 2
+        assert select.options == ["low", "high", "7"]
+
+
+def _oven_sensor(build_dictionary, status_list: dict):
+    dictionary = build_dictionary(
+        sub={
+            "properties": [
+                {
+                    "property": "Oven_temperature_unit",
+                    "sensor": {"device_class": "enum", "options": {0: "°C", 1: "°F"}},
+                },
+                {
+                    "property": "Oven_measured_temperature",
+                    "sensor": {"device_class": "temperature", "unit": "property.Oven_temperature_unit"},
+                },
+            ]
+        }
+    )
+    appliance = _appliance(status_list)
+    coordinator = _coordinator(appliance)
+    name = "Oven_measured_temperature"
+    sensor = ConnectLifeStatusSensor(coordinator, appliance, name, dictionary.properties[name], dictionary)
+    return sensor, appliance
+
+
+def test_property_unit_follows_its_source(build_dictionary):
+    sensor, appliance = _oven_sensor(build_dictionary, {"Oven_measured_temperature": 180, "Oven_temperature_unit": 0})
+    assert sensor.native_unit_of_measurement == UnitOfTemperature.CELSIUS
+    # Woken by the unit source through the dictionary's dependency graph.
+    assert sensor._subscription.key == "sensor.Oven_measured_temperature"
+
+    with patch.object(Entity, "async_write_ha_state") as write:
+        sensor.async_write_ha_state()
+        appliance.status_list.update({"Oven_measured_temperature": 356, "Oven_temperature_unit": 1})
+        sensor._handle_coordinator_update()
+
+        assert write.call_count == 2
+        assert sensor.native_unit_of_measurement == UnitOfTemperature.FAHRENHEIT
+        assert sensor.native_value == 356
+
+
+def test_property_unit_is_only_resolved_when_its_source_changes(build_dictionary):
+    sensor, appliance = _oven_sensor(build_dictionary, {"Oven_measured_temperature": 180, "Oven_temperature_unit": 0})
+
+    with patch.object(utils, "to_unit", wraps=utils.to_unit) as to_unit:
+        appliance.status_list["Oven_measured_temperature"] = 190
+        sensor.update_state()
+        assert to_unit.call_count == 0
+
+        appliance.status_list["Oven_temperature_unit"] = 1
+        sensor.update_state()
+        assert to_unit.call_count == 1
+
+
+def test_number_property_unit_follows_its_source(build_dictionary):
+    dictionary = build_dictionary(
+        sub={
+            "properties": [
+                {"property": "Oven_temperature_unit", "select": {"options": {1: "celsius", 2: "fahrenheit"}}},
+                {
+                    "property": "Oven_set_temperature",
+                    "number": {
+                        "device_class": "temperature",
+                        "unit": "property.Oven_temperature_unit",
+                        "min_value": 30,
+                        "max_value": 480,
+                    },
+                },
+            ]
+        }
+    )
+    appliance = _appliance({"Oven_set_temperature": 180, "Oven_temperature_unit": 1})
+    name = "Oven_set_temperature"
+    number = ConnectLifeNumberEntity(
+        _coordinator(appliance), appliance, name, dictionary.properties[name], dictionary
+    )
+    assert number.native_unit_of_measurement == UnitOfTemperature.CELSIUS
+    assert number._subscription.key == "number.Oven_set_temperature"
+    assert number._subscription.key in dictionary.dependents["Oven_temperature_unit"]
+
+    with patch.object(Entity, "async_write_ha_state") as write:
+        number.async_write_ha_state()
+        appliance.status_list.update({"Oven_set_temperature": 356, "Oven_temperature_unit": 2})
+        number._handle_coordinator_update()
+
+        assert write.call_count == 2
+        assert number.native_unit_of_measurement == UnitOfTemperature.FAHRENHEIT
+        assert number.native_value == 356
@@ -0,0 +1,112 @@
+"""Tests for the per-appliance entity plan."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from types import SimpleNamespace
+
+from homeassistant.const import Platform
+
+from custom_components.connectlife.const import SW_VERSION_PROPERTY, SWING_MODE
+from custom_components.connectlife.coordinator import ConnectLifeCoordinator
+from custom_components.connectlife.dictionaries import Dictionaries, Dictionary, Property
+from custom_components.connectlife.entity_plan import build_entity_plan
+
+
+def _dictionary() -> Dictionary:
+    properties = defaultdict(
+        lambda: Property({"property": "default", "optional": True}),
+        {
+            "t_power": Property({"property": "t_power", "climate": {"target": "is_on"}}),
+            "t_up_down": Property(
+                {
+                    "property": "t_up_down",
+                    "switch": {},
+                    "climate": {"target": "swing_mode", "options": {0: "off", 1: "on"}},
+                }
+            ),
+            "t_fan": Property({"property": "t_fan", "select": {"options": {0: "low"}}}),
+            "t_door": Property({"property": "t_door", "binary_sensor": {}}),
+            "t_hidden": Property({"property": "t_hidden", "disable": True}),
+            "total": Property(
+                {
+                    "property": "total",
+                    "sensor": {},
+                    "combine": [{"property": "part_a"}, {"property": "part_b"}],
+                }
+            ),
+        },
+    )
+    return Dictionary(
+        climate=None,
+        properties=properties,
+        buttons=[],
+        statistics_source="air_duct_energy",
+        statistics_sensors={"daily_energy_kwh": True},
+    )
+
+
+def _appliance(status_list: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        device_id="dev1",
+        device_nickname="AC",
+        device_type_code="plan_type",
+        device_feature_code="plan_feat",
+        status_list=status_list,
+    )
+
+
+def test_plan_assigns_properties_to_platforms_in_status_order():
+    appliance = _appliance(
+        {
+            "t_door": 0,
+            "t_power": 1,
+            "t_up_down": 0,
+            "t_fan": 0,
+            "t_hidden": 1,
+            "t_unknown": 3,
+            SW_VERSION_PROPERTY: "1.0",
+            "part_a": 1,
+        }
+    )
+    plan = build_entity_plan(appliance, _dictionary())
+
+    assert plan.climate_bindings == {"is_on": "t_power", SWING_MODE: "t_up_down"}
+    assert plan.properties_for(Platform.BINARY_SENSOR) == ["t_door"]
+    assert plan.properties_for(Platform.SELECT) == ["t_fan"]
+    # Bound to the climate entity, so no switch of its own.
+    assert plan.properties_for(Platform.SWITCH) == []
+    # Unknown properties become default sensors; the software version does not.
+    assert plan.properties_for(Platform.SENSOR) == ["t_unknown", "part_a"]
+    assert plan.combine_sensors == ["total"]
+    assert plan.device_platforms == {Platform.CLIMATE}
+    assert [s.key for s in plan.statistics_sensors] == ["daily_energy_kwh"]
+
+
+def test_plan_ignores_override_for_property_the_device_lacks():
+    appliance = _appliance({"t_power": 1, "t_up_down": 0})
+    plan = build_entity_plan(appliance, _dictionary(), {SWING_MODE: "t_swing_angle"})
+
+    # Override names a property the device lacks, so the automatic binding stays.
+    assert plan.properties_for(Platform.SWITCH) == []
+
+
+def test_combine_sensor_requires_a_source_in_status_list():
+    plan = build_entity_plan(_appliance({"t_power": 1}), _dictionary())
+
+    assert plan.combine_sensors == []
+
+
+def test_coordinator_builds_plan_once_per_device():
+    Dictionaries.dictionaries["plan_type-plan_feat"] = _dictionary()
+    try:
+        coord = ConnectLifeCoordinator.__new__(ConnectLifeCoordinator)
+        coord._entity_plans = {}
+        coord.config_entry = SimpleNamespace(options={})  # type: ignore[assignment]
+        appliance = _appliance({"t_power": 1})
+
+        plan = coord.entity_plan(appliance)
+
+        assert coord.entity_plan(appliance) is plan
+    finally:
+        Dictionaries.dictionaries.pop("plan_type-plan_feat")
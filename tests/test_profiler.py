@@ -0,0 +1,37 @@
+"""Tests for the integration profile."""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+
+from custom_components.connectlife.coordinator import changed_properties
+from custom_components.connectlife.profiler import INTEGRATION_DIR, _integration_stats, _write
+
+
+def _profile() -> cProfile.Profile:
+    profile = cProfile.Profile()
+    profile.enable()
+    changed_properties({}, {})
+    json.dumps({"a": 1})
+    profile.disable()
+    return profile
+
+
+def test_profile_is_limited_to_the_integration():
+    stats = _integration_stats(_profile())
+
+    files = {file for file, _, _ in stats.stats}  # type: ignore[attr-defined]
+    assert files
+    assert all(file.startswith(INTEGRATION_DIR) for file in files)
+    assert any(name == "changed_properties" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_profile_files_are_written(tmp_path):
+    path = str(tmp_path / "connectlife_profile.prof")
+
+    _write(_profile(), path)
+
+    assert pstats.Stats(path).stats  # type: ignore[attr-defined]
+    assert "changed_properties" in (tmp_path / "connectlife_profile.txt").read_text()
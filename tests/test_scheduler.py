@@ -0,0 +1,148 @@
+"""Tests for the adaptive poll scheduler."""
+
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from types import SimpleNamespace
+
+from custom_components.connectlife.scheduler import (
+    BACKOFF_BASE,
+    BACKOFF_JITTER,
+    BACKOFF_MAX,
+    IDLE_AFTER,
+    POLL_INTERVALS,
+    RECOVERY_PROBE_DELAY,
+    STATE_ACTIVE,
+    STATE_COMMAND,
+    STATE_DEFAULT,
+    STATE_IDLE,
+    STATE_OFFLINE,
+    PollScheduler,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _appliance(offline_state: int = 1):
+    return SimpleNamespace(offline_state=offline_state)
+
+
+def _scheduler(budget: int = 240) -> tuple[PollScheduler, _Clock]:
+    clock = _Clock()
+    return PollScheduler(budget, clock=clock), clock
+
+
+def test_first_poll_starts_devices_in_default_state():
+    scheduler, _ = _scheduler()
+    scheduler.record_changes({"a": _appliance()}, None)
+
+    assert scheduler.device_state("a") == STATE_DEFAULT
+    assert scheduler.next_interval() == POLL_INTERVALS[STATE_DEFAULT]
+
+
+def test_changing_device_is_polled_faster_then_goes_idle():
+    scheduler, clock = _scheduler()
+    scheduler.record_changes({"a": _appliance()}, None)
+    clock.now += 60
+    scheduler.record_changes({"a": _appliance()}, {"a": {"p"}})
+
+    assert scheduler.device_state("a") == STATE_ACTIVE
+
+    clock.now += IDLE_AFTER
+    assert scheduler.device_state("a") == STATE_IDLE
+    assert scheduler.next_interval() == POLL_INTERVALS[STATE_IDLE]
+
+
+def test_command_wins_over_offline_and_shortest_device_wins():
+    scheduler, _ = _scheduler()
+    scheduler.record_changes({"a": _appliance(0), "b": _appliance(0)}, None)
+
+    assert scheduler.next_interval() == POLL_INTERVALS[STATE_OFFLINE]
+
+    scheduler.record_command("b")
+    assert scheduler.device_state("a") == STATE_OFFLINE
+    assert scheduler.device_state("b") == STATE_COMMAND
+    assert scheduler.next_interval() == POLL_INTERVALS[STATE_COMMAND]
+
+
+def test_removed_devices_are_forgotten():
+    scheduler, _ = _scheduler()
+    scheduler.record_changes({"a": _appliance(0)}, None)
+    scheduler.record_changes({}, {"a": None})
+
+    assert scheduler.as_dict()["devices"] == {}
+
+
+def test_budget_defers_next_poll():
+    scheduler, clock = _scheduler(budget=60)
+    scheduler.record_command("a")
+    for _ in range(60):
+        scheduler.record_poll()
+        clock.now += 10
+
+    # 60 polls in the last 600 s: the next one has to wait until the first
+    # poll leaves the one-hour window.
+    assert scheduler.next_interval() == timedelta(seconds=3000)
+
+    clock.now += 3000
+    assert scheduler.next_interval() == POLL_INTERVALS[STATE_IDLE]
+
+
+# -- failure backoff -------------------------------------------------------
+
+
+def _failing_scheduler() -> tuple[PollScheduler, _Clock]:
+    clock = _Clock()
+    # Jitter always takes the full delay, so intervals are predictable.
+    rng = SimpleNamespace(uniform=lambda low, high: high)
+    return PollScheduler(clock=clock, rng=rng), clock  # type: ignore[arg-type]
+
+
+def test_first_failure_probes_quickly_then_backs_off_exponentially():
+    scheduler, _ = _failing_scheduler()
+    scheduler.record_changes({"a": _appliance()}, None)
+
+    delays = []
+    for _ in range(8):
+        scheduler.record_failure()
+        delays.append(scheduler.next_interval().total_seconds())
+
+    assert delays[0] == RECOVERY_PROBE_DELAY
+    assert delays[1:4] == [BACKOFF_BASE, 2 * BACKOFF_BASE, 4 * BACKOFF_BASE]
+    assert delays[-1] == BACKOFF_MAX
+
+
+def test_backoff_overrides_activity_and_resets_on_success():
+    scheduler, clock = _failing_scheduler()
+    scheduler.record_changes({"a": _appliance()}, None)
+    scheduler.record_command("a")
+    scheduler.record_failure()
+    scheduler.record_failure()
+    clock.now += 20
+
+    assert scheduler.next_interval() == timedelta(seconds=BACKOFF_BASE - 20)
+    assert scheduler.as_dict()["consecutive_failures"] == 2
+    assert scheduler.as_dict()["next_attempt"] is not None
+
+    scheduler.record_success()
+    assert scheduler.next_interval() == POLL_INTERVALS[STATE_COMMAND]
+    assert scheduler.as_dict()["next_attempt"] is None
+
+
+def test_backoff_is_jittered():
+    delays = set()
+    for seed in range(5):
+        scheduler = PollScheduler(clock=_Clock(), rng=random.Random(seed))
+        scheduler.record_failure()
+        scheduler.record_failure()
+        delays.add(scheduler.next_interval().total_seconds())
+
+    assert len(delays) == 5
+    assert all((1 - BACKOFF_JITTER) * BACKOFF_BASE <= d <= BACKOFF_BASE for d in delays)
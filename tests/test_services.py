@@ -0,0 +1,65 @@
+"""Tests for the device update services."""
+
+from __future__ import annotations
+
+import asyncio
+
+from connectlife.api import LifeConnectError
+
+from custom_components.connectlife.services import MAX_CONCURRENT_UPDATES, async_update_devices
+
+
+class _FakeCoordinator:
+    def __init__(self, failing: set[str] | None = None, error: Exception | None = None):
+        self.failing = failing or set()
+        self.error = error or LifeConnectError("Unexpected response from HijuConn gateway")
+        self.sent: list[tuple[str, dict]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def async_update_device(self, device_id, command, properties):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0)
+            if device_id in self.failing:
+                raise self.error
+            self.sent.append((device_id, command))
+        finally:
+            self.running -= 1
+
+
+async def test_devices_are_updated_concurrently_with_a_limit():
+    coordinator = _FakeCoordinator()
+    devices = {f"target{i}": (f"dev{i}", coordinator) for i in range(MAX_CONCURRENT_UPDATES * 3)}
+
+    results = await async_update_devices(devices, {"Actions": 1})
+
+    assert len(coordinator.sent) == len(devices)
+    assert coordinator.max_running == MAX_CONCURRENT_UPDATES
+    assert all(result["success"] for result in results.values())
+
+
+async def test_failing_device_does_not_stop_the_others():
+    coordinator = _FakeCoordinator(failing={"dev1"})
+    devices = {f"target{i}": (f"dev{i}", coordinator) for i in range(3)}
+
+    results = await async_update_devices(devices, {"t_power": 1})
+
+    assert [device_id for device_id, _ in coordinator.sent] == ["dev0", "dev2"]
+    assert results["target1"]["success"] is False
+    assert "HijuConn" in results["target1"]["error"]
+    assert results["target0"]["success"] and results["target2"]["success"]
+    assert all("latency" in result for result in results.values())
+
+
+async def test_unexpected_error_is_reported_for_that_device_only():
+    # E.g. the device disappeared from the coordinator data.
+    coordinator = _FakeCoordinator(failing={"dev0"}, error=KeyError("dev0"))
+    devices = {f"target{i}": (f"dev{i}", coordinator) for i in range(3)}
+
+    results = await async_update_devices(devices, {"t_power": 1})
+
+    assert [device_id for device_id, _ in coordinator.sent] == ["dev1", "dev2"]
+    assert results["target0"] == {"success": False, "error": "KeyError: 'dev0'", "latency": results["target0"]["latency"]}
+    assert results["target1"]["success"] and results["target2"]["success"]
@@ -0,0 +1,133 @@
+"""Tests for the session shared by entries of the same account."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.connectlife.api_guard import ApiGuard, TokenBucket
+from custom_components.connectlife.const import DOMAIN
+from custom_components.connectlife.session import (
+    DATA_SESSIONS,
+    SHARED_POLL_MAX_AGE,
+    AccountSession,
+    async_acquire_session,
+    async_release_session,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeApi:
+    def __init__(self):
+        self.appliances = []
+        self.logins = 0
+        self.polls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def login(self):
+        self.logins += 1
+
+    async def get_appliances(self):
+        self.polls += 1
+        await self.release.wait()
+        self.appliances = [SimpleNamespace(device_id=f"d{self.polls}")]
+        return self.appliances
+
+
+class _NoTokens:
+    async def async_restore(self, api) -> bool:
+        return False
+
+
+def _session(clock: _Clock | None = None, entries: int = 2) -> AccountSession:
+    session = AccountSession(_FakeApi(), ApiGuard(TokenBucket(rate=0)), clock or _Clock())
+    session.entries.update(f"entry{i}" for i in range(entries))
+    return session
+
+
+def test_entries_of_one_account_share_a_session():
+    hass = SimpleNamespace(data={DOMAIN: {}})
+
+    first = async_acquire_session(hass, "a", "User@example.com", "pw")
+    second = async_acquire_session(hass, "b", "user@example.com", "pw")
+    other = async_acquire_session(hass, "c", "user@example.com", "pw", trir=True)
+
+    assert first is second
+    assert other is not first
+    assert first.entries == {"a", "b"}
+
+    async_release_session(hass, "a")
+    assert len(hass.data[DOMAIN][DATA_SESSIONS]) == 2
+    async_release_session(hass, "b")
+    async_release_session(hass, "c")
+    assert hass.data[DOMAIN][DATA_SESSIONS] == {}
+
+
+async def test_login_happens_once():
+    session = _session()
+
+    await asyncio.gather(session.async_login(_NoTokens()), session.async_login(_NoTokens()))
+
+    assert session.api.logins == 1
+
+
+async def test_concurrent_polls_share_one_request():
+    session = _session()
+    session.api.release.clear()
+
+    polls = [asyncio.create_task(session.async_get_appliances()) for _ in range(3)]
+    await asyncio.sleep(0)
+    session.api.release.set()
+    results = await asyncio.gather(*polls)
+
+    assert session.api.polls == 1
+    assert all(appliances is results[0][0] for appliances, _ in results)
+    assert not any(reused for _, reused in results)
+    assert session.polls_shared == 2
+
+
+async def test_recent_poll_is_reused_until_it_is_stale():
+    clock = _Clock()
+    session = _session(clock)
+
+    assert (await session.async_get_appliances())[1] is False
+    clock.now = SHARED_POLL_MAX_AGE - 1
+    assert (await session.async_get_appliances())[1] is True
+    assert session.api.polls == 1
+
+    clock.now = SHARED_POLL_MAX_AGE + 1
+    assert (await session.async_get_appliances())[1] is False
+    assert session.api.polls == 2
+
+
+async def test_session_of_one_entry_always_polls():
+    session = _session(_Clock(), entries=1)
+
+    await session.async_get_appliances()
+    await session.async_get_appliances()
+
+    assert session.api.polls == 2
+    assert session.polls_shared == 0
+
+
+async def test_cancelled_refresh_does_not_cancel_the_shared_poll():
+    session = _session()
+    session.api.release.clear()
+
+    cancelled = asyncio.create_task(session.async_get_appliances())
+    waiting = asyncio.create_task(session.async_get_appliances())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    session.api.release.set()
+
+    appliances, _ = await waiting
+    assert [a.device_id for a in appliances] == ["d1"]
@@ -0,0 +1,111 @@
+"""Tests for the persisted appliance snapshot."""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections import deque
+from types import SimpleNamespace
+
+from connectlife.appliance import ConnectLifeAppliance
+
+from custom_components.connectlife.coordinator import (
+    COMMAND_HISTORY,
+    POLL_HISTORY,
+    ConnectLifeCoordinator,
+)
+from custom_components.connectlife.scheduler import PollScheduler
+from custom_components.connectlife.snapshot import appliance_to_payload
+
+PAYLOAD = {
+    "wifiId": "wifi1",
+    "deviceId": "dev1",
+    "puid": "puid1",
+    "deviceNickName": "Living room",
+    "deviceFeatureCode": "117",
+    "deviceFeatureName": "Split AC",
+    "deviceTypeCode": "009",
+    "deviceTypeName": "Air conditioner",
+    "role": 1,
+    "roomId": 2,
+    "roomName": "Living room",
+    "offlineState": 1,
+    "seq": 3,
+    "bindTime": 1700000000000,
+    "useTime": None,
+    "createTime": 1690000000000,
+    "statusList": {
+        "t_power": "1",
+        "t_temp": "21.5",
+        "f_name": "auto",
+        "t_clock": "2024/05/06T07:08:09",
+    },
+}
+
+
+def test_payload_round_trips_appliance():
+    appliance = ConnectLifeAppliance(None, PAYLOAD)
+    restored = ConnectLifeAppliance(None, appliance_to_payload(appliance))
+
+    for attr in (
+        "wifi_id", "device_id", "puid", "device_nickname", "device_feature_code",
+        "device_feature_name", "device_type_code", "device_type_name", "role",
+        "room_id", "room_name", "offline_state", "seq", "bind_time", "use_time",
+        "create_time", "device_type",
+    ):
+        assert getattr(restored, attr) == getattr(appliance, attr), attr
+    assert restored.status_list == appliance.status_list
+    assert restored.status_list["t_clock"] == dt.datetime(2024, 5, 6, 7, 8, 9, tzinfo=dt.UTC)
+
+
+class _FakeSnapshot:
+    def __init__(self):
+        self.saved: list[dict] = []
+
+    def async_save(self, data):
+        self.saved.append(data)
+
+
+def _coordinator(appliances) -> tuple[ConnectLifeCoordinator, _FakeSnapshot]:
+    coord = ConnectLifeCoordinator.__new__(ConnectLifeCoordinator)
+    coord.data = None
+    coord.last_update_success = True
+    coord.scheduler = PollScheduler()
+    coord._confirmations_due = {}
+    coord._confirmation_retries = {}
+    coord._entity_plans = {}
+    coord._poll_results = deque(maxlen=POLL_HISTORY)
+    coord._command_latencies = deque(maxlen=COMMAND_HISTORY)
+    coord.snapshot = _FakeSnapshot()  # type: ignore[assignment]
+
+    async def get_appliances():
+        return None
+
+    coord.api = SimpleNamespace(get_appliances=get_appliances, appliances=appliances)  # type: ignore[assignment]
+    return coord, coord.snapshot  # type: ignore[return-value]
+
+
+async def test_poll_saves_snapshot_only_when_something_changed():
+    appliance = ConnectLifeAppliance(None, PAYLOAD)
+    coord, snapshot = _coordinator([appliance])
+
+    coord.data = await coord._async_update_data()
+    assert len(snapshot.saved) == 1  # first poll
+
+    coord._fetched_at = None  # past MIN_FETCH_SPACING
+    coord.data = await coord._async_update_data()
+    assert len(snapshot.saved) == 1  # nothing changed
+
+    coord.api.appliances = [ConnectLifeAppliance(None, {**PAYLOAD, "statusList": {"t_power": "0"}})]
+    coord._fetched_at = None
+    coord.data = await coord._async_update_data()
+    assert len(snapshot.saved) == 2
+
+
+def test_restore_marks_data_stale():
+    appliance = ConnectLifeAppliance(None, PAYLOAD)
+    coord, _ = _coordinator([])
+
+    coord.async_restore({appliance.device_id: appliance})
+
+    assert coord.data == {"dev1": appliance}
+    assert coord.last_update_success is False
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -85,12 +86,16 @@ def test_enabled_sensors_consumption_energy_and_water():
 class _FakeApi:
     """Records calls; optionally raises per endpoint."""
 
-    def __init__(self, *, air_duct=None, consumption=None, air_duct_exc=None):
+    def __init__(self, *, air_duct=None, consumption=None, air_duct_exc=None, consumption_delay=0.0):
         self._air_duct = air_duct
         self._consumption = consumption
         self._air_duct_exc = air_duct_exc
+        self._consumption_delay = consumption_delay
         self.air_duct_calls = 0
         self.consumption_calls = 0
+        self.consumption_cancelled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
 
     async def get_air_duct_energy(self, *_args):
         self.air_duct_calls += 1
@@ -100,6 +105,15 @@ class _FakeApi:
 
     async def get_energy_consumption_curve(self, *_args):
         self.consumption_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._consumption_delay)
+        except asyncio.CancelledError:
+            self.consumption_cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
         return self._consumption
 
 
@@ -170,15 +184,55 @@ async def test_coordinator_stores_results_per_device():
     assert api.consumption_calls == 1
 
 
-async def test_coordinator_auth_error_breaks_remaining_devices():
-    # AC fetched first and raises auth error -> loop breaks before the washing machine.
-    api = _FakeApi(air_duct_exc=LifeConnectAuthError("token rejected"))
+async def test_coordinator_auth_error_cancels_remaining_devices():
+    # AC raises auth error while the washing machine is still in flight -> it is cancelled.
+    api = _FakeApi(air_duct_exc=LifeConnectAuthError("token rejected"), consumption_delay=10)
     data = {"ac": _appliance("ac", *_AC), "wm": _appliance("wm", *_WM)}
     result = await _coordinator(api, data)._async_update_data()
 
     assert result == {}
     assert api.air_duct_calls == 1
-    assert api.consumption_calls == 0  # never reached
+    assert api.consumption_cancelled == 1
+    assert api.in_flight == 0
+
+
+async def test_coordinator_auth_error_keeps_completed_results():
+    api = _FakeApi(
+        air_duct_exc=LifeConnectAuthError("token rejected"),
+        consumption=SimpleNamespace(electric_curve={}, water_curve={}),
+    )
+    coord = _coordinator(api, {"wm": _appliance("wm", *_WM), "ac": _appliance("ac", *_AC)})
+    coord.max_concurrent_fetches = 1  # wm completes before ac starts
+    result = await coord._async_update_data()
+
+    assert set(result) == {"wm"}
+
+
+async def test_coordinator_fetches_devices_concurrently_within_limit():
+    api = _FakeApi(
+        consumption=SimpleNamespace(electric_curve={}, water_curve={}),
+        consumption_delay=0.01,
+    )
+    data = {f"wm{i}": _appliance(f"wm{i}", *_WM) for i in range(5)}
+    coord = _coordinator(api, data)
+    coord.max_concurrent_fetches = 2
+    result = await coord._async_update_data()
+
+    assert set(result) == set(data)
+    assert api.max_in_flight == 2
+
+
+async def test_coordinator_timeout_yields_none_for_slow_device():
+    api = _FakeApi(
+        air_duct=SimpleNamespace(electric_total=2.0),
+        consumption_delay=10,
+    )
+    coord = _coordinator(api, {"ac": _appliance("ac", *_AC), "wm": _appliance("wm", *_WM)})
+    coord.fetch_timeout = 0.01
+    result = await coord._async_update_data()
+
+    assert result["wm"] is None
+    assert result["ac"] is not None and result["ac"].electric_total == 2.0
 
 
 async def test_coordinator_generic_error_yields_none_and_continues():
@@ -0,0 +1,54 @@
+"""Tests for the persisted token state."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from connectlife.api import ConnectLifeApi
+from connectlife.trir import TrirConnectLifeApi
+
+from custom_components.connectlife.token_cache import restore_token_state, token_state
+
+
+def _logged_in(api: ConnectLifeApi, expires_in: dt.timedelta) -> ConnectLifeApi:
+    now = dt.datetime.now().replace(microsecond=0)
+    api._access_token = "access"
+    api._expires = now + expires_in
+    api._refresh_token = "refresh"
+    api._refresh_token_expires = now + dt.timedelta(days=30)
+    return api
+
+
+def test_token_state_round_trips():
+    for api_class in (ConnectLifeApi, TrirConnectLifeApi):
+        api = _logged_in(api_class("user", "password"), dt.timedelta(hours=1))
+        state = token_state(api, "user")
+        assert state is not None
+
+        restored = api_class("user", "password")
+        assert restore_token_state(restored, state, "user")
+        for attr in ("_access_token", "_expires", "_refresh_token", "_refresh_token_expires"):
+            assert getattr(restored, attr) == getattr(api, attr), attr
+
+
+def test_no_state_before_login():
+    assert token_state(ConnectLifeApi("user", "password"), "user") is None
+
+
+def test_tokens_of_another_account_are_ignored():
+    state = token_state(_logged_in(ConnectLifeApi("old", "pw"), dt.timedelta(hours=1)), "old")
+    assert state is not None
+
+    api = ConnectLifeApi("new", "pw")
+    assert not restore_token_state(api, state, "new")
+    assert api._access_token is None
+
+
+def test_expired_access_token_is_restored_for_refresh():
+    state = token_state(_logged_in(ConnectLifeApi("user", "pw"), -dt.timedelta(hours=1)), "user")
+    assert state is not None
+
+    assert restore_token_state(ConnectLifeApi("user", "pw"), state, "user")
+
+    state["refresh_token_expires"] = (dt.datetime.now() - dt.timedelta(days=1)).timestamp()
+    assert not restore_token_state(ConnectLifeApi("user", "pw"), state, "user")